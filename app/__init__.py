@@ -5,13 +5,15 @@ This module contains the application factory for creating Flask instances
 with proper configuration and blueprint registration.
 """
 
-from flask import Flask
+from flask import Flask, abort, current_app, request
 from flask_cors import CORS
 import os
 
 from app.core.config import Config
 from app.core.logging import setup_logging
 from app.core.exceptions import register_error_handlers
+from app.core.request import PycelizeRequest
+from app.utils.file_utils import FileUtils
 
 
 def create_app(config_path: str = None) -> Flask:
@@ -31,6 +33,7 @@ def create_app(config_path: str = None) -> Flask:
     """
     # Create Flask instance
     app = Flask(__name__)
+    app.request_class = PycelizeRequest
 
     # Load configuration
     if config_path is None:
@@ -47,6 +50,8 @@ def create_app(config_path: str = None) -> Flask:
     app.config["MAX_CONTENT_LENGTH"] = (
         config.get("file.max_file_size_mb", 50) * 1024 * 1024
     )
+    app.config["UPLOAD_FOLDER"] = config.get("file.upload_folder", "uploads")
+    app.config["USE_X_SENDFILE"] = config.get("file.use_x_sendfile", False)
 
     # Setup CORS
     CORS(app, resources={r"/api/*": {"origins": "*"}})
@@ -57,6 +62,9 @@ def create_app(config_path: str = None) -> Flask:
     # Register error handlers
     register_error_handlers(app)
 
+    # Reject oversized uploads before any route parses the form body
+    app.before_request(_reject_oversized_request)
+
     # Create upload and output directories
     _ensure_directories(config)
 
@@ -66,6 +74,20 @@ def create_app(config_path: str = None) -> Flask:
     return app
 
 
+def _reject_oversized_request() -> None:
+    """
+    Abort with 413 when the declared Content-Length exceeds MAX_CONTENT_LENGTH.
+
+    Werkzeug enforces the limit only once a handler reads the form, and
+    route-level ``except Exception`` blocks would turn that into a 500.
+    Checking the header up front rejects the request before the body is read.
+    """
+    limit = current_app.config.get("MAX_CONTENT_LENGTH")
+    length = request.content_length
+    if limit and length and length > limit:
+        abort(413)
+
+
 def _ensure_directories(config: Config) -> None:
     """
     Ensure required directories exist.
@@ -90,8 +112,9 @@ def _ensure_directories(config: Config) -> None:
             chat_config.get("backup", {}).get("snapshot_path", "./automation/sqlite/snapshots"),
         ])
 
+    # FileUtils remembers these, so per-request ensure_directory calls are free
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        FileUtils.ensure_directory(directory)
 
 
 def _register_blueprints(app: Flask) -> None:
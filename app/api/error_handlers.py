@@ -0,0 +1,42 @@
+"""
+Blueprint Error Handlers
+
+This module registers blueprint-scoped error handlers that turn service
+exceptions into the standard error response, so route handlers do not
+need to repeat the same except blocks.
+"""
+
+from flask import Blueprint
+from werkzeug.exceptions import HTTPException
+
+from app.builders.response_builder import ResponseBuilder
+from app.core.exceptions import ValidationError, FileProcessingError
+
+
+def register_route_error_handlers(blueprint: Blueprint) -> None:
+    """
+    Register the standard route error handlers on a blueprint.
+
+    ValidationError maps to 422, FileProcessingError to 400 and any other
+    exception to 500. HTTP errors raised by Flask itself pass through.
+
+    Args:
+        blueprint: Blueprint whose routes should use the handlers
+    """
+
+    @blueprint.errorhandler(ValidationError)
+    def handle_validation_error(error: ValidationError):
+        """Handle request validation failures."""
+        return ResponseBuilder.error_response(error.message, 422)
+
+    @blueprint.errorhandler(FileProcessingError)
+    def handle_file_processing_error(error: FileProcessingError):
+        """Handle file processing failures."""
+        return ResponseBuilder.error_response(error.message, 400)
+
+    @blueprint.errorhandler(Exception)
+    def handle_unexpected_error(error: Exception):
+        """Handle any other error raised by a route."""
+        if isinstance(error, HTTPException):
+            return error
+        return ResponseBuilder.error_response(str(error), 500)
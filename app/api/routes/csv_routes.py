@@ -6,10 +6,9 @@ This module provides API endpoints for CSV file operations.
 
 import os
 import json
-from datetime import datetime
-from flask import Blueprint, request, jsonify, current_app
-from werkzeug.utils import secure_filename
+from flask import Blueprint, request, url_for
 
+from app.api.settings import current_settings, ensure_folders, shared_service
 from app.builders.response_builder import ResponseBuilder
 from app.services.csv_service import CSVService
 from app.services.search_service import SearchService
@@ -20,18 +19,17 @@ from app.core.exceptions import ValidationError, FileProcessingError
 from app.models.request import SearchRequest
 
 csv_bp = Blueprint("csv", __name__)
+csv_bp.record_once(ensure_folders)
 
 
 def get_csv_service() -> CSVService:
-    """Get CSVService instance with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return CSVService(config)
+    """Get the shared CSVService instance for the current app config."""
+    return shared_service(CSVService)
 
 
 def get_search_service() -> SearchService:
-    """Get SearchService instance with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return SearchService(config)
+    """Get the shared SearchService instance for the current app config."""
+    return shared_service(SearchService)
 
 
 @csv_bp.route("/info", methods=["POST"])
@@ -52,31 +50,27 @@ def get_csv_info():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
+        _, upload_folder, _ = current_settings()
 
-        FileUtils.ensure_directory(upload_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             service = get_csv_service()
             info = service.get_file_info(file_path)
+            # Report the upload's name rather than its staged temporary path
+            info["file_path"] = info["file_name"] = FileUtils.secure_filename(
+                file.filename
+            )
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data=info, message="CSV file information retrieved successfully"
             )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @csv_bp.route("/convert-to-excel", methods=["POST"])
@@ -103,31 +97,23 @@ def convert_csv_to_excel():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        _, upload_folder, output_folder = current_settings()
 
         sheet_name = request.form.get("sheet_name", "Sheet1")
         output_filename = request.form.get("output_filename")
 
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
+        safe_name = FileUtils.secure_filename(file.filename)
 
-        try:
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             service = get_csv_service()
 
             # Generate output path
             if output_filename:
-                output_path = os.path.join(
-                    output_folder, secure_filename(output_filename)
-                )
+                filename = FileUtils.secure_filename(output_filename)
             else:
-                output_path = os.path.join(
-                    output_folder,
-                    generate_output_filename(file.filename, "converted", ".xlsx"),
-                )
+                filename = generate_output_filename(safe_name, "converted", ".xlsx")
+            output_path = os.path.join(output_folder, filename)
 
             # Convert
             service.convert_to_excel(
@@ -135,24 +121,20 @@ def convert_csv_to_excel():
             )
 
             # Build download URL
-            host = request.host
-            filename = os.path.basename(output_path)
-            download_url = f"http://{host}/api/v1/files/downloads/{filename}"
-            response = ResponseBuilder.success(
+            download_url = url_for(
+                "files.download_file", filename=filename, _external=True
+            )
+            return ResponseBuilder.success_response(
                 data={"download_url": download_url},
                 message="Converted to Excel file successfully",
             )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @csv_bp.route("/search", methods=["POST"])
@@ -185,9 +167,7 @@ def search_csv():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        _, upload_folder, output_folder = current_settings()
 
         # Parse request parameters
         conditions_str = request.form.get("conditions", "[]")
@@ -207,12 +187,9 @@ def search_csv():
             raise ValidationError("Output format must be xlsx, csv, or json")
 
         # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
 
-        try:
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             # Read CSV file
             csv_service = get_csv_service()
             df = csv_service.read_csv(file_path)
@@ -234,12 +211,12 @@ def search_csv():
             )
 
             # Generate output filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             if output_filename:
-                output_name = secure_filename(output_filename)
+                output_name = FileUtils.secure_filename(output_filename)
             else:
-                extension = f".{output_format}"
-                output_name = f"search_results_{timestamp}{extension}"
+                output_name = generate_output_filename(
+                    "search_results", extension=output_format
+                )
 
             output_path = os.path.join(output_folder, output_name)
 
@@ -247,10 +224,11 @@ def search_csv():
             search_service.save_search_results(filtered_df, output_path, output_format)
 
             # Build download URL
-            host = request.host
-            download_url = f"http://{host}/api/v1/files/downloads/{output_name}"
+            download_url = url_for(
+                "files.download_file", filename=output_name, _external=True
+            )
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data={
                     "download_url": download_url,
                     "total_rows": len(df),
@@ -259,17 +237,13 @@ def search_csv():
                 },
                 message=f"Search completed successfully. {len(filtered_df)} rows matched.",
             )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @csv_bp.route("/search/suggest-operators", methods=["POST"])
@@ -294,15 +268,12 @@ def suggest_search_operators_csv():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
+        _, upload_folder, _ = current_settings()
 
         # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
 
-        try:
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             # Get file info (includes data types)
             csv_service = get_csv_service()
             info = csv_service.get_file_info(file_path)
@@ -318,18 +289,14 @@ def suggest_search_operators_csv():
                     "operators": operators,
                 }
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data=suggestions,
                 message="Operator suggestions generated successfully",
             )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
@@ -5,40 +5,58 @@ This module provides API endpoints for Excel file operations.
 """
 
 import os
-import json
-from datetime import datetime
-from flask import Blueprint, request, jsonify, current_app
-from werkzeug.utils import secure_filename
-
+import re
+import time
+import tempfile
+import orjson
+from flask import Blueprint, request, url_for
+
+from app.api.error_handlers import register_route_error_handlers
+from app.api.settings import current_settings, ensure_folders, shared_service
 from app.builders.response_builder import ResponseBuilder
 from app.services.excel_service import ExcelService
-from app.services.binding_service import BindingService
 from app.services.search_service import SearchService
+from app.services import process_pool
+from app.services.process_pool import run_cpu_bound
 from app.utils.file_utils import FileUtils
 from app.utils.validators import Validators
-from app.utils.helpers import generate_output_filename
-from app.core.exceptions import ValidationError, FileProcessingError
+from app.utils.helpers import as_bool, generate_output_filename, json_response
+from app.utils.schemas import validate_payload
+from app.core.exceptions import ValidationError
 from app.models.request import SearchRequest
 
 excel_bp = Blueprint("excel", __name__)
+register_route_error_handlers(excel_bp)
+excel_bp.record_once(ensure_folders)
 
+# Prebuilt success bodies for endpoints that return a download URL
+_EXTRACTED_RESPONSE = ResponseBuilder.template(
+    "Extracted Excel file generated successfully"
+)
+_BOUND_RESPONSE = ResponseBuilder.template("Excel binding completed successfully")
 
-def get_excel_service() -> ExcelService:
-    """Get ExcelService instance with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return ExcelService(config)
+# Characters not allowed in user-supplied output filenames
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _safe_filename(name: str) -> str:
+    """Sanitize a user-supplied output filename with a precompiled pattern."""
+    return _UNSAFE_FILENAME_RE.sub("_", name).strip("._")[:200] or "file"
 
 
-def get_binding_service() -> BindingService:
-    """Get BindingService instance with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return BindingService(config)
+def _download_url(filename: str) -> str:
+    """Build the external download URL for a file in the output folder."""
+    return url_for("files.download_file", filename=filename, _external=True)
+
+
+def get_excel_service() -> ExcelService:
+    """Get the shared ExcelService instance for the current app config."""
+    return shared_service(ExcelService)
 
 
 def get_search_service() -> SearchService:
-    """Get SearchService instance with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return SearchService(config)
+    """Get the shared SearchService instance for the current app config."""
+    return shared_service(SearchService)
 
 
 @excel_bp.route("/info", methods=["POST"])
@@ -55,37 +73,19 @@ def get_excel_info():
     Example:
         curl -X POST -F "file=@data.xlsx" http://localhost:5050/api/v1/excel/info
     """
-    try:
-        Validators.validate_file_uploaded(request.files.get("file"))
+    files = request.files
+    file = files.get("file")
+    Validators.validate_file_uploaded(file)
 
-        file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
+    # Read the upload straight from the request stream
+    service = get_excel_service()
+    info = service.get_file_info_fast(
+        file.stream, file_name=FileUtils.secure_filename(file.filename)
+    )
 
-        # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            service = get_excel_service()
-            info = service.get_file_info(file_path)
-
-            response = ResponseBuilder.success(
-                data=info, message="File information retrieved successfully"
-            )
-            return jsonify(response), 200
-
-        finally:
-            # Clean up uploaded file
-            FileUtils.delete_file(file_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    return ResponseBuilder.success_response(
+        data=info, message="File information retrieved successfully"
+    )
 
 
 @excel_bp.route("/extract-columns", methods=["POST"])
@@ -109,56 +109,32 @@ def extract_columns():
              -F "remove_duplicates=true" \
              http://localhost:5050/api/v1/excel/extract-columns
     """
-    try:
-        Validators.validate_file_uploaded(request.files.get("file"))
-
-        file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
+    form, files = request.form, request.files
+    file = files.get("file")
+    Validators.validate_file_uploaded(file)
 
-        # Parse request parameters
-        columns_str = request.form.get("columns", "[]")
-        columns = json.loads(columns_str)
-        remove_duplicates = (
-            request.form.get("remove_duplicates", "false").lower() == "true"
-        )
-        include_statistics = (
-            request.form.get("include_statistics", "true").lower() == "true"
-        )
+    # Parse request parameters
+    columns_str = form.get("columns", "[]")
+    columns = orjson.loads(columns_str)
+    remove_duplicates = as_bool(form.get("remove_duplicates"), False)
+    include_statistics = as_bool(form.get("include_statistics"), True)
 
-        if not columns:
-            raise ValidationError("No columns specified for extraction")
+    validate_payload("extract_columns", {"columns": columns})
 
-        # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
+    # Read the upload straight from the request stream
+    service = get_excel_service()
+    df = service.read_excel_stream(file.stream)
 
-        try:
-            service = get_excel_service()
-            df = service.read_excel(file_path)
+    extracted = service.extract_columns(
+        data=df,
+        columns=columns,
+        remove_duplicates=remove_duplicates,
+        include_statistics=include_statistics,
+    )
 
-            extracted = service.extract_columns(
-                data=df,
-                columns=columns,
-                remove_duplicates=remove_duplicates,
-                include_statistics=include_statistics,
-            )
-
-            response = ResponseBuilder.success(
-                data=extracted, message=f"Successfully extracted {len(columns)} columns"
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    return ResponseBuilder.success_response(
+        data=extracted, message=f"Successfully extracted {len(columns)} columns"
+    )
 
 
 @excel_bp.route("/extract-columns-to-file", methods=["POST"])
@@ -181,66 +157,41 @@ def extract_columns_to_file():
              -F "remove_duplicates=true" \
              http://localhost:5050/api/v1/excel/extract-columns-to-file
     """
-    try:
-        Validators.validate_file_uploaded(request.files.get("file"))
-
-        file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        # Parse request parameters
-        columns_str = request.form.get("columns", "[]")
-        columns = json.loads(columns_str)
-        remove_duplicates = (
-            request.form.get("remove_duplicates", "false").lower() == "true"
+    form, files = request.form, request.files
+    file = files.get("file")
+    Validators.validate_file_uploaded(file)
+    config, upload_folder, output_folder = current_settings()
+
+    # Parse request parameters
+    columns_str = form.get("columns", "[]")
+    columns = orjson.loads(columns_str)
+    remove_duplicates = as_bool(form.get("remove_duplicates"), False)
+
+    validate_payload("extract_columns", {"columns": columns})
+
+    # Stage uploaded file under a unique temporary name
+    with FileUtils.staged_upload(file, upload_folder) as file_path:
+        # Generate output filename
+        output_filename = f"extracted_columns_{time.time_ns():x}.xlsx"
+        output_path = os.path.join(output_folder, output_filename)
+
+        # Extract columns and save to file in the CPU process pool
+        run_cpu_bound(
+            config,
+            process_pool.extract_columns_to_file,
+            file_path=file_path,
+            columns=columns,
+            output_path=output_path,
+            remove_duplicates=remove_duplicates,
         )
 
-        if not columns:
-            raise ValidationError("No columns specified for extraction")
-
-        # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            service = get_excel_service()
-            df = service.read_excel(file_path)
-
-            # Generate output filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"extracted_columns_{timestamp}.xlsx"
-            output_path = os.path.join(output_folder, output_filename)
-
-            # Extract columns and save to file
-            service.extract_columns_to_file(
-                data=df,
-                columns=columns,
-                output_path=output_path,
-                remove_duplicates=remove_duplicates,
-            )
-
-            # Build download URL
-            host = request.host
-            download_url = f"http://{host}/api/v1/files/downloads/{output_filename}"
-
-            response = ResponseBuilder.success(
-                data={"download_url": download_url},
-                message="Extracted Excel file generated successfully",
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        # Build download URL
+        download_url = _download_url(output_filename)
+
+        response = ResponseBuilder.from_template(
+            _EXTRACTED_RESPONSE, {"download_url": download_url}
+        )
+        return json_response(response)
 
 
 @excel_bp.route("/map-columns", methods=["POST"])
@@ -262,69 +213,45 @@ def map_columns():
              -F 'mapping={"Customer Name": "name", "Email": {"source": "email", "default": "N/A"}}' \
              http://localhost:5050/api/v1/excel/map-columns
     """
-    try:
-        Validators.validate_file_uploaded(request.files.get("file"))
-
-        file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        # Parse mapping
-        mapping_str = request.form.get("mapping", "{}")
-        mapping = json.loads(mapping_str)
-
-        if not mapping:
-            raise ValidationError("No column mapping provided")
-
-        output_filename = request.form.get("output_filename")
-
-        # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            service = get_excel_service()
-            df = service.read_excel(file_path)
-
-            # Apply mapping
-            mapped_df = service.apply_column_mapping(df, mapping)
-
-            # Generate output path
-            if output_filename:
-                output_path = os.path.join(
-                    output_folder, secure_filename(output_filename)
-                )
-            else:
-                output_path = os.path.join(
-                    output_folder,
-                    generate_output_filename(file.filename, "mapped", ".xlsx"),
-                )
-
-            # Write result
-            service.write_excel(mapped_df, output_path)
-
-            # Build download URL
-            host = request.host
-            filename = os.path.basename(output_path)
-            download_url = f"http://{host}/api/v1/files/downloads/{filename}"
-            response = ResponseBuilder.success(
-                data={"download_url": download_url},
-                message="Extracted Excel file generated successfully",
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    form, files = request.form, request.files
+    file = files.get("file")
+    Validators.validate_file_uploaded(file)
+    config, upload_folder, output_folder = current_settings()
+
+    # Parse mapping
+    mapping_str = form.get("mapping", "{}")
+    mapping = orjson.loads(mapping_str)
+
+    validate_payload("map_columns", {"mapping": mapping})
+
+    output_filename = form.get("output_filename")
+
+    safe_name = FileUtils.secure_filename(file.filename)
+
+    # Stage uploaded file under a unique temporary name
+    with FileUtils.staged_upload(file, upload_folder) as file_path:
+        # Generate output path
+        if output_filename:
+            filename = _safe_filename(output_filename)
+        else:
+            filename = generate_output_filename(safe_name, "mapped", ".xlsx")
+        output_path = os.path.join(output_folder, filename)
+
+        # Apply mapping and write result in the CPU process pool
+        run_cpu_bound(
+            config,
+            process_pool.map_columns_to_file,
+            file_path=file_path,
+            mapping=mapping,
+            output_path=output_path,
+        )
+
+        # Build download URL
+        download_url = _download_url(filename)
+        response = ResponseBuilder.from_template(
+            _EXTRACTED_RESPONSE, {"download_url": download_url}
+        )
+        return json_response(response)
 
 
 @excel_bp.route("/bind-single-key", methods=["POST"])
@@ -354,61 +281,48 @@ def bind_single_key():
           -F 'bind_columns=["s_1_id"]' \
           http://localhost:5050/api/v1/excel/bind-single-key
     """
-    source_file_path = None
-    bind_file_path = None
+    # Validate file uploads
+    form, files = request.form, request.files
+    source_file = files.get("source_file")
+    bind_file = files.get("bind_file")
+    Validators.validate_file_uploaded(source_file)
+    Validators.validate_file_uploaded(bind_file)
+
+    # Parse request parameters
+    comparison_column = form.get("comparison_column")
+    bind_columns_str = form.get("bind_columns", "[]")
+    output_filename = form.get("output_filename")
 
     try:
-        # Validate file uploads
-        Validators.validate_file_uploaded(request.files.get("source_file"))
-        Validators.validate_file_uploaded(request.files.get("bind_file"))
-
-        source_file = request.files["source_file"]
-        bind_file = request.files["bind_file"]
-
-        # Parse request parameters
-        comparison_column = request.form.get("comparison_column")
-        bind_columns_str = request.form.get("bind_columns", "[]")
-        output_filename = request.form.get("output_filename")
-
-        # Validate required parameters
-        if not comparison_column:
-            raise ValidationError("comparison_column parameter is required")
-
-        try:
-            bind_columns = json.loads(bind_columns_str)
-        except json.JSONDecodeError:
-            raise ValidationError("bind_columns must be a valid JSON array")
-
-        if not bind_columns or len(bind_columns) == 0:
-            raise ValidationError("At least one bind column must be specified")
-
-        # Get configuration
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        # Ensure directories exist
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-
-        # Save uploaded files
-        source_file_path = FileUtils.secure_save_path(
-            source_file.filename, upload_folder
+        bind_columns = orjson.loads(bind_columns_str)
+    except orjson.JSONDecodeError:
+        raise ValidationError("bind_columns must be a valid JSON array")
+
+    # Validate required parameters
+    validate_payload(
+        "bind_single_key",
+        {"comparison_column": comparison_column, "bind_columns": bind_columns},
+    )
+
+    config, upload_folder, output_folder = current_settings()
+
+    # Generate output path if custom filename provided
+    output_path = None
+    if output_filename:
+        output_path = os.path.join(output_folder, _safe_filename(output_filename))
+
+    # Save uploaded files into a per-request temporary directory
+    with tempfile.TemporaryDirectory(dir=upload_folder) as tmp_dir:
+        source_file_path = FileUtils.secure_save_path(source_file.filename, tmp_dir)
+        bind_file_path = FileUtils.secure_save_path(bind_file.filename, tmp_dir)
+        FileUtils.save_uploads(
+            (source_file, source_file_path), (bind_file, bind_file_path)
         )
-        source_file.save(source_file_path)
-
-        bind_file_path = FileUtils.secure_save_path(bind_file.filename, upload_folder)
-        bind_file.save(bind_file_path)
-
-        # Perform binding
-        binding_service = get_binding_service()
-
-        # Generate output path if custom filename provided
-        output_path = None
-        if output_filename:
-            output_path = os.path.join(output_folder, secure_filename(output_filename))
 
-        result = binding_service.bind_excel_single_key(
+        # Perform binding in the CPU process pool
+        result = run_cpu_bound(
+            config,
+            process_pool.bind_single_key,
             source_path=source_file_path,
             bind_path=bind_file_path,
             comparison_column=comparison_column,
@@ -416,31 +330,13 @@ def bind_single_key():
             output_path=output_path,
         )
 
-        # Build download URL
-        output_filename_only = os.path.basename(result["output_path"])
-        host = request.host
-        download_url = f"http://{host}/api/v1/files/downloads/{output_filename_only}"
+    # Build download URL
+    download_url = _download_url(os.path.basename(result["output_path"]))
 
-        response_data = {"download_url": download_url}
+    response_data = {"download_url": download_url}
 
-        response = ResponseBuilder.success(
-            data=response_data,
-            message="Excel binding completed successfully",
-        )
-        return jsonify(response), 200
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
-    finally:
-        # Clean up uploaded files
-        if source_file_path:
-            FileUtils.delete_file(source_file_path)
-        if bind_file_path:
-            FileUtils.delete_file(bind_file_path)
+    response = ResponseBuilder.from_template(_BOUND_RESPONSE, response_data)
+    return json_response(response)
 
 
 @excel_bp.route("/bind-multi-key", methods=["POST"])
@@ -471,67 +367,54 @@ def bind_multi_key():
           -F 'bind_columns=["email", "phone"]' \
           http://localhost:5050/api/v1/excel/bind-multi-key
     """
-    source_file_path = None
-    bind_file_path = None
+    # Validate file uploads
+    form, files = request.form, request.files
+    source_file = files.get("source_file")
+    bind_file = files.get("bind_file")
+    Validators.validate_file_uploaded(source_file)
+    Validators.validate_file_uploaded(bind_file)
+
+    # Parse request parameters
+    comparison_columns_str = form.get("comparison_columns", "[]")
+    bind_columns_str = form.get("bind_columns", "[]")
+    output_filename = form.get("output_filename")
+
+    # Parse JSON parameters
+    try:
+        comparison_columns = orjson.loads(comparison_columns_str)
+    except orjson.JSONDecodeError:
+        raise ValidationError("comparison_columns must be a valid JSON array")
 
     try:
-        # Validate file uploads
-        Validators.validate_file_uploaded(request.files.get("source_file"))
-        Validators.validate_file_uploaded(request.files.get("bind_file"))
-
-        source_file = request.files["source_file"]
-        bind_file = request.files["bind_file"]
-
-        # Parse request parameters
-        comparison_columns_str = request.form.get("comparison_columns", "[]")
-        bind_columns_str = request.form.get("bind_columns", "[]")
-        output_filename = request.form.get("output_filename")
-
-        # Parse JSON parameters
-        try:
-            comparison_columns = json.loads(comparison_columns_str)
-        except json.JSONDecodeError:
-            raise ValidationError("comparison_columns must be a valid JSON array")
-
-        try:
-            bind_columns = json.loads(bind_columns_str)
-        except json.JSONDecodeError:
-            raise ValidationError("bind_columns must be a valid JSON array")
-
-        # Validate required parameters
-        if not comparison_columns or len(comparison_columns) == 0:
-            raise ValidationError("At least one comparison column must be specified")
-
-        if not bind_columns or len(bind_columns) == 0:
-            raise ValidationError("At least one bind column must be specified")
-
-        # Get configuration
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        # Ensure directories exist
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-
-        # Save uploaded files
-        source_file_path = FileUtils.secure_save_path(
-            source_file.filename, upload_folder
+        bind_columns = orjson.loads(bind_columns_str)
+    except orjson.JSONDecodeError:
+        raise ValidationError("bind_columns must be a valid JSON array")
+
+    # Validate required parameters
+    validate_payload(
+        "bind_multi_key",
+        {"comparison_columns": comparison_columns, "bind_columns": bind_columns},
+    )
+
+    config, upload_folder, output_folder = current_settings()
+
+    # Generate output path if custom filename provided
+    output_path = None
+    if output_filename:
+        output_path = os.path.join(output_folder, _safe_filename(output_filename))
+
+    # Save uploaded files into a per-request temporary directory
+    with tempfile.TemporaryDirectory(dir=upload_folder) as tmp_dir:
+        source_file_path = FileUtils.secure_save_path(source_file.filename, tmp_dir)
+        bind_file_path = FileUtils.secure_save_path(bind_file.filename, tmp_dir)
+        FileUtils.save_uploads(
+            (source_file, source_file_path), (bind_file, bind_file_path)
         )
-        source_file.save(source_file_path)
-
-        bind_file_path = FileUtils.secure_save_path(bind_file.filename, upload_folder)
-        bind_file.save(bind_file_path)
-
-        # Perform binding
-        binding_service = get_binding_service()
-
-        # Generate output path if custom filename provided
-        output_path = None
-        if output_filename:
-            output_path = os.path.join(output_folder, secure_filename(output_filename))
 
-        result = binding_service.bind_excel_multi_key(
+        # Perform binding in the CPU process pool
+        result = run_cpu_bound(
+            config,
+            process_pool.bind_multi_key,
             source_path=source_file_path,
             bind_path=bind_file_path,
             comparison_columns=comparison_columns,
@@ -539,31 +422,13 @@ def bind_multi_key():
             output_path=output_path,
         )
 
-        # Build download URL
-        output_filename_only = os.path.basename(result["output_path"])
-        host = request.host
-        download_url = f"http://{host}/api/v1/files/downloads/{output_filename_only}"
+    # Build download URL
+    download_url = _download_url(os.path.basename(result["output_path"]))
 
-        response_data = {"download_url": download_url}
+    response_data = {"download_url": download_url}
 
-        response = ResponseBuilder.success(
-            data=response_data,
-            message="Excel binding completed successfully",
-        )
-        return jsonify(response), 200
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
-    finally:
-        # Clean up uploaded files
-        if source_file_path:
-            FileUtils.delete_file(source_file_path)
-        if bind_file_path:
-            FileUtils.delete_file(bind_file_path)
+    response = ResponseBuilder.from_template(_BOUND_RESPONSE, response_data)
+    return json_response(response)
 
 
 @excel_bp.route("/search", methods=["POST"])
@@ -592,95 +457,74 @@ def search_excel():
              -F "output_format=xlsx" \
              http://localhost:5050/api/v1/excel/search
     """
-    try:
-        Validators.validate_file_uploaded(request.files.get("file"))
-
-        file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        # Parse request parameters
-        conditions_str = request.form.get("conditions", "[]")
-        conditions_data = json.loads(conditions_str)
-        logic = request.form.get("logic", "AND").upper()
-        output_format = request.form.get("output_format", "xlsx").lower()
-        output_filename = request.form.get("output_filename")
-
-        # Validate parameters
-        if not conditions_data:
-            raise ValidationError("At least one search condition is required")
-
-        if logic not in ["AND", "OR"]:
-            raise ValidationError("Logic must be either 'AND' or 'OR'")
-
-        if output_format not in ["xlsx", "csv", "json"]:
-            raise ValidationError("Output format must be xlsx, csv, or json")
-
-        # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            # Read Excel file
-            excel_service = get_excel_service()
-            df = excel_service.read_excel(file_path)
-
-            # Create search request
-            search_request = SearchRequest.from_dict(
-                {
-                    "conditions": conditions_data,
-                    "logic": logic,
-                    "output_format": output_format,
-                    "output_filename": output_filename,
-                }
-            )
-
-            # Apply search
-            search_service = get_search_service()
-            filtered_df = search_service.apply_search(
-                df, search_request.conditions, search_request.logic
-            )
-
-            # Generate output filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            if output_filename:
-                output_name = secure_filename(output_filename)
-            else:
-                extension = f".{output_format}"
-                output_name = f"search_results_{timestamp}{extension}"
-
-            output_path = os.path.join(output_folder, output_name)
-
-            # Save results
-            search_service.save_search_results(filtered_df, output_path, output_format)
-
-            # Build download URL
-            host = request.host
-            download_url = f"http://{host}/api/v1/files/downloads/{output_name}"
-
-            response = ResponseBuilder.success(
-                data={
-                    "download_url": download_url,
-                    "total_rows": len(df),
-                    "filtered_rows": len(filtered_df),
-                    "conditions_applied": len(search_request.conditions),
-                },
-                message=f"Search completed successfully. {len(filtered_df)} rows matched.",
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    form, files = request.form, request.files
+    file = files.get("file")
+    Validators.validate_file_uploaded(file)
+    _, upload_folder, output_folder = current_settings()
+
+    # Parse request parameters
+    conditions_str = form.get("conditions", "[]")
+    conditions_data = orjson.loads(conditions_str)
+    logic = form.get("logic", "AND").upper()
+    output_format = form.get("output_format", "xlsx").lower()
+    output_filename = form.get("output_filename")
+
+    # Validate parameters
+    validate_payload(
+        "search",
+        {
+            "conditions": conditions_data,
+            "logic": logic,
+            "output_format": output_format,
+        },
+    )
+
+    # Stage uploaded file under a unique temporary name
+    with FileUtils.staged_upload(file, upload_folder) as file_path:
+        # Read Excel file
+        excel_service = get_excel_service()
+        df = excel_service.read_excel(file_path, dtype_backend="pyarrow")
+
+        # Create search request
+        search_request = SearchRequest.from_dict(
+            {
+                "conditions": conditions_data,
+                "logic": logic,
+                "output_format": output_format,
+                "output_filename": output_filename,
+            }
+        )
+
+        # Apply search
+        search_service = get_search_service()
+        filtered_df = search_service.apply_search(
+            df, search_request.conditions, search_request.logic
+        )
+
+        # Generate output filename
+        if output_filename:
+            output_name = _safe_filename(output_filename)
+        else:
+            extension = f".{output_format}"
+            output_name = f"search_results_{time.time_ns():x}{extension}"
+
+        output_path = os.path.join(output_folder, output_name)
+
+        # Save results
+        search_service.save_search_results(filtered_df, output_path, output_format)
+
+        # Build download URL
+        download_url = _download_url(output_name)
+
+        return ResponseBuilder.success_response(
+            data={
+                "download_url": download_url,
+                "total_rows": len(df),
+                "filtered_rows": len(filtered_df),
+                "conditions_applied": len(search_request.conditions),
+            },
+            message=f"Search completed successfully. {len(filtered_df)} rows matched.",
+        )
 
 
 @excel_bp.route("/search/suggest-operators", methods=["POST"])
@@ -701,46 +545,29 @@ def suggest_search_operators_excel():
         curl -X POST -F "file=@data.xlsx" \
              http://localhost:5050/api/v1/excel/search/suggest-operators
     """
-    try:
-        Validators.validate_file_uploaded(request.files.get("file"))
-
-        file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-
-        # Save uploaded file
-        FileUtils.ensure_directory(upload_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            # Get file info (includes data types)
-            excel_service = get_excel_service()
-            info = excel_service.get_file_info(file_path)
-
-            # Generate operator suggestions
-            search_service = get_search_service()
-            suggestions = {}
-
-            for column, dtype in info.get("data_types", {}).items():
-                operators = search_service.get_operator_suggestions(dtype)
-                suggestions[column] = {
-                    "type": dtype,
-                    "operators": operators,
-                }
-
-            response = ResponseBuilder.success(
-                data=suggestions,
-                message="Operator suggestions generated successfully",
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    files = request.files
+    file = files.get("file")
+    Validators.validate_file_uploaded(file)
+    _, upload_folder, _ = current_settings()
+
+    # Stage uploaded file under a unique temporary name
+    with FileUtils.staged_upload(file, upload_folder) as file_path:
+        # Get file info (includes data types)
+        excel_service = get_excel_service()
+        info = excel_service.get_file_info(file_path)
+
+        # Generate operator suggestions
+        search_service = get_search_service()
+        suggestions = {}
+
+        for column, dtype in info.get("data_types", {}).items():
+            operators = search_service.get_operator_suggestions(dtype)
+            suggestions[column] = {
+                "type": dtype,
+                "operators": operators,
+            }
+
+        return ResponseBuilder.success_response(
+            data=suggestions,
+            message="Operator suggestions generated successfully",
+        )
@@ -5,23 +5,22 @@ This module provides API endpoints for file binding and management.
 """
 
 import os
-from flask import Blueprint, request, jsonify, current_app, send_file
-from werkzeug.utils import secure_filename
+import orjson
+from flask import Blueprint, request, current_app, send_file, url_for
 
+from app.api.error_handlers import register_route_error_handlers
+from app.api.settings import current_settings, ensure_folders, shared_service
 from app.builders.response_builder import ResponseBuilder
-from app.services.binding_service import BindingService
+from app.services import process_pool
+from app.services.process_pool import run_cpu_bound
 from app.utils.file_utils import FileUtils
 from app.utils.validators import Validators
 from app.utils.helpers import generate_output_filename
-from app.core.exceptions import ValidationError, FileProcessingError
+from app.core.exceptions import ValidationError
 
 file_bp = Blueprint("files", __name__)
-
-
-def get_binding_service() -> BindingService:
-    """Get BindingService instance with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return BindingService(config)
+register_route_error_handlers(file_bp)
+file_bp.record_once(ensure_folders)
 
 
 @file_bp.route("/downloads/<filename>", methods=["GET"])
@@ -39,56 +38,67 @@ def download_file(filename):
         curl http://localhost:5050/api/v1/files/downloads/extracted_columns_20260129_120000.xlsx \
              --output result.xlsx
     """
-    try:
-        logger = current_app.logger
-        config = current_app.config.get("PYCELIZE")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        logger.info(f"Config for file download: {config}")
-        logger.info(f"Download request for file: {filename}")
-
-        # Secure the filename to prevent path traversal
-        safe_filename = secure_filename(filename)
-        file_path = os.path.join(output_folder, safe_filename)
-
-        logger.info(f"Secure filename: {safe_filename}")
-        logger.info(f"Resolved file path: {file_path}")
-
-        # Validate that the resolved path is within the output folder
-        abs_output_folder = os.path.abspath(output_folder)
-        abs_file_path = os.path.abspath(file_path)
-
-        logger.info(f"Absolute file path: {abs_file_path}")
-
-        if not abs_file_path.startswith(abs_output_folder + os.sep):
-            logger.error("Attempted path traversal attack detected")
-            return jsonify(ResponseBuilder.error("Invalid file path", 400)), 400
-
-        # Check if file exists
-        if not os.path.exists(file_path):
-            return jsonify(ResponseBuilder.error("File not found", 404)), 404
-
-        # Determine mimetype based on extension
-        if safe_filename.endswith(".xlsx"):
-            mimetype = (
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
-        elif safe_filename.endswith(".txt"):
-            mimetype = "text/plain"
-        elif safe_filename.endswith(".sql"):
-            mimetype = "text/plain"
-        else:
-            mimetype = "application/octet-stream"
-
-        return send_file(
-            abs_file_path,
-            as_attachment=True,
-            download_name=safe_filename,
-            mimetype=mimetype,
+    logger = current_app.logger
+    config, _, output_folder = current_settings()
+
+    logger.info(f"Config for file download: {config}")
+    logger.info(f"Download request for file: {filename}")
+
+    # Secure the filename to prevent path traversal
+    safe_filename = FileUtils.secure_filename(filename)
+    file_path = os.path.join(output_folder, safe_filename)
+
+    logger.info(f"Secure filename: {safe_filename}")
+    logger.info(f"Resolved file path: {file_path}")
+
+    # Validate that the resolved path is within the output folder
+    abs_output_folder = os.path.abspath(output_folder)
+    abs_file_path = os.path.abspath(file_path)
+
+    logger.info(f"Absolute file path: {abs_file_path}")
+
+    if not abs_file_path.startswith(abs_output_folder + os.sep):
+        logger.error("Attempted path traversal attack detected")
+        return ResponseBuilder.error_response("Invalid file path", 400)
+
+    # Check if file exists
+    if not os.path.exists(file_path):
+        return ResponseBuilder.error_response("File not found", 404)
+
+    # Determine mimetype based on extension
+    if safe_filename.endswith(".xlsx"):
+        mimetype = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    elif safe_filename.endswith(".txt"):
+        mimetype = "text/plain"
+    elif safe_filename.endswith(".sql"):
+        mimetype = "text/plain"
+    else:
+        mimetype = "application/octet-stream"
+
+    # Behind nginx, hand the transfer to an internal location so nginx
+    # sendfile()s the file and the worker only writes headers
+    accel_prefix = config.get("file.x_accel_redirect_prefix")
+    if accel_prefix:
+        response = current_app.response_class(mimetype=mimetype)
+        response.headers["X-Accel-Redirect"] = (
+            f"{accel_prefix.rstrip('/')}/{safe_filename}"
         )
+        response.headers.set(
+            "Content-Disposition", "attachment", filename=safe_filename
+        )
+        return response
 
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    # Serve by path so the WSGI server can use sendfile(2), and let
+    # clients revalidate with If-None-Match instead of re-downloading
+    return send_file(
+        abs_file_path,
+        as_attachment=True,
+        download_name=safe_filename,
+        mimetype=mimetype,
+        conditional=True,
+        etag=True,
+        max_age=0,
+    )
 
 
 @file_bp.route("/bind", methods=["POST"])
@@ -114,80 +124,60 @@ def bind_excel_files():
              http://localhost:5050/api/v1/files/bind \
              --output result.xlsx
     """
-    try:
-        # Validate files
-        source_file = request.files.get("source_file")
-        target_file = request.files.get("target_file")
-
-        Validators.validate_file_uploaded(source_file)
-        Validators.validate_file_uploaded(target_file)
-
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
-
-        # Parse column mapping
-        import json
-
-        column_mapping_str = request.form.get("column_mapping", "{}")
-        column_mapping = json.loads(column_mapping_str)
-
-        if not column_mapping:
-            raise ValidationError("column_mapping is required")
-
-        output_filename = request.form.get("output_filename")
-
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-
-        # Save uploaded files
-        source_path = FileUtils.secure_save_path(source_file.filename, upload_folder)
-        target_path = FileUtils.secure_save_path(target_file.filename, upload_folder)
-        source_file.save(source_path)
-        target_file.save(target_path)
-
-        try:
-            service = get_binding_service()
-
-            # Generate output path
-            if output_filename:
-                output_path = os.path.join(
-                    output_folder, secure_filename(output_filename)
-                )
-            else:
-                output_path = os.path.join(
-                    output_folder,
-                    generate_output_filename(target_file.filename, "bound", ".xlsx"),
-                )
-
-            # Perform binding
-            result = service.bind_data(
-                source_path=source_path,
-                target_path=target_path,
-                column_mapping=column_mapping,
-                output_path=output_path,
-            )
-
-            # Build download URL
-            host = request.host
-            filename = os.path.basename(result["output_path"])
-            download_url = f"http://{host}/api/v1/files/downloads/{filename}"
-            response = ResponseBuilder.success(
-                data={"download_url": download_url},
-                message="Converted to Excel file successfully",
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(source_path)
-            FileUtils.delete_file(target_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    # Validate files
+    form, files = request.form, request.files
+    source_file = files.get("source_file")
+    target_file = files.get("target_file")
+
+    Validators.validate_file_uploaded(source_file)
+    Validators.validate_file_uploaded(target_file)
+
+    config, upload_folder, output_folder = current_settings()
+
+    # Parse column mapping
+    column_mapping_str = form.get("column_mapping", "{}")
+    column_mapping = orjson.loads(column_mapping_str)
+
+    if not column_mapping:
+        raise ValidationError("column_mapping is required")
+
+    output_filename = form.get("output_filename")
+
+    target_name = FileUtils.secure_filename(target_file.filename)
+
+    # Generate output path
+    if output_filename:
+        output_path = os.path.join(
+            output_folder, FileUtils.secure_filename(output_filename)
+        )
+    else:
+        output_path = os.path.join(
+            output_folder,
+            generate_output_filename(target_name, "bound", ".xlsx"),
+        )
+
+    # Stage uploaded files under unique temporary names
+    with FileUtils.staged_uploads(upload_folder, source_file, target_file) as (
+        source_path,
+        target_path,
+    ):
+        # Perform binding in the CPU process pool
+        result = run_cpu_bound(
+            config,
+            process_pool.bind_data,
+            source_path=source_path,
+            target_path=target_path,
+            column_mapping=column_mapping,
+            output_path=output_path,
+        )
+
+    # Build download URL
+    filename = os.path.basename(result["output_path"])
+    download_url = url_for("files.download_file", filename=filename, _external=True)
+    return ResponseBuilder.success_response(
+        data={"download_url": download_url},
+        message="Converted to Excel file successfully",
+    )
 
 
 @file_bp.route("/bind/preview", methods=["POST"])
@@ -198,68 +188,48 @@ def preview_binding():
     Returns:
         JSON with binding preview and statistics
     """
-    try:
-        source_file = request.files.get("source_file")
-        target_file = request.files.get("target_file")
-
-        Validators.validate_file_uploaded(source_file)
-        Validators.validate_file_uploaded(target_file)
-
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-
-        import json
-
-        column_mapping_str = request.form.get("column_mapping", "{}")
-        column_mapping = json.loads(column_mapping_str)
-
-        FileUtils.ensure_directory(upload_folder)
-
-        source_path = FileUtils.secure_save_path(source_file.filename, upload_folder)
-        target_path = FileUtils.secure_save_path(target_file.filename, upload_folder)
-        source_file.save(source_path)
-        target_file.save(target_path)
-
-        try:
-            from app.services.excel_service import ExcelService
-
-            excel_service = ExcelService(config)
-
-            source_df = excel_service.read_excel(source_path)
-            target_df = excel_service.read_excel(target_path)
-
-            # Validate mapping
-            validation = {
-                "source_columns": list(source_df.columns),
-                "target_columns": list(target_df.columns),
-                "source_rows": len(source_df),
-                "target_rows": len(target_df),
-                "mapping_valid": True,
-                "issues": [],
-            }
-
-            for target_col, source_col in column_mapping.items():
-                if source_col not in source_df.columns:
-                    validation["issues"].append(
-                        f"Source column '{source_col}' not found"
-                    )
-                    validation["mapping_valid"] = False
-                if target_col not in target_df.columns:
-                    validation["issues"].append(
-                        f"Target column '{target_col}' not found"
-                    )
-                    validation["mapping_valid"] = False
-
-            response = ResponseBuilder.success(
-                data=validation, message="Binding preview generated"
-            )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(source_path)
-            FileUtils.delete_file(target_path)
-
-    except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    form, files = request.form, request.files
+    source_file = files.get("source_file")
+    target_file = files.get("target_file")
+
+    Validators.validate_file_uploaded(source_file)
+    Validators.validate_file_uploaded(target_file)
+
+    column_mapping_str = form.get("column_mapping", "{}")
+    column_mapping = orjson.loads(column_mapping_str)
+
+    from app.services.excel_service import ExcelService
+
+    excel_service = shared_service(ExcelService)
+
+    # Read only the headers and row counts of both uploads
+    source = excel_service.peek(source_file.stream)
+    target = excel_service.peek(target_file.stream)
+
+    # Validate mapping with two set differences instead of per-key lookups
+    missing_source = set(column_mapping.values()).difference(source["columns"])
+    missing_target = set(column_mapping.keys()).difference(target["columns"])
+
+    issues = [
+        f"Source column '{col}' not found"
+        for col in column_mapping.values()
+        if col in missing_source
+    ]
+    issues.extend(
+        f"Target column '{col}' not found"
+        for col in column_mapping
+        if col in missing_target
+    )
+
+    validation = {
+        "source_columns": source["columns"],
+        "target_columns": target["columns"],
+        "source_rows": source["n_rows"],
+        "target_rows": target["n_rows"],
+        "mapping_valid": not (missing_source or missing_target),
+        "issues": issues,
+    }
+
+    return ResponseBuilder.success_response(
+        data=validation, message="Binding preview generated"
+    )
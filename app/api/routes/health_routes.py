@@ -4,25 +4,32 @@ Health Check Routes
 This module provides health check endpoints for monitoring.
 """
 
-from flask import Blueprint, jsonify, current_app
+from functools import lru_cache
+from typing import Tuple
+
+import orjson
+from flask import Blueprint, Flask, Response, current_app
 from app.builders.response_builder import ResponseBuilder
 
 health_bp = Blueprint("health", __name__)
 
 
-@health_bp.route("", methods=["GET"])
-@health_bp.route("/", methods=["GET"])
-def health_check():
+@lru_cache(maxsize=4)
+def _probe_bodies(app: Flask) -> Tuple[bytes, bytes]:
     """
-    Health check endpoint.
+    Serialize the health and readiness response bodies once per application.
 
-    Returns:
-        JSON response indicating service health
+    Load-balancer probes hit these endpoints constantly, so the bodies
+    (including their meta block) are built and encoded on the first call
+    and reused afterwards.
 
-    Example:
-        GET /api/v1/health
+    Args:
+        app: Flask application whose config describes the service
+
+    Returns:
+        Tuple of (health body, readiness body) as JSON bytes
     """
-    config = current_app.config.get("PYCELIZE")
+    config = app.config.get("PYCELIZE")
 
     data = {
         "status": "healthy",
@@ -30,18 +37,44 @@ def health_check():
         "version": config.get("app.version", "v0.0.1") if config else "v0.0.1",
     }
 
-    response = (
+    health = (
         ResponseBuilder()
         .with_data(data)
         .with_message("Service is healthy")
         .with_status_code(200)
         .build()
     )
+    ready = (
+        ResponseBuilder()
+        .with_data({"ready": True})
+        .with_message("Service is ready")
+        .with_status_code(200)
+        .build()
+    )
+
+    return orjson.dumps(health), orjson.dumps(ready)
+
 
-    return jsonify(response), 200
+@health_bp.route(
+    "", methods=["GET"], strict_slashes=False, provide_automatic_options=False
+)
+def health_check():
+    """
+    Health check endpoint.
 
+    Returns:
+        JSON response indicating service health
+
+    Example:
+        GET /api/v1/health
+    """
+    body = _probe_bodies(current_app._get_current_object())[0]
+    return Response(body, status=200, mimetype="application/json")
 
-@health_bp.route("/ready", methods=["GET"])
+
+@health_bp.route(
+    "/ready", methods=["GET"], strict_slashes=False, provide_automatic_options=False
+)
 def readiness_check():
     """
     Readiness check endpoint.
@@ -49,12 +82,5 @@ def readiness_check():
     Returns:
         JSON response indicating service readiness
     """
-    response = (
-        ResponseBuilder()
-        .with_data({"ready": True})
-        .with_message("Service is ready")
-        .with_status_code(200)
-        .build()
-    )
-
-    return jsonify(response), 200
+    body = _probe_bodies(current_app._get_current_object())[1]
+    return Response(body, status=200, mimetype="application/json")
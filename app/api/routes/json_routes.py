@@ -5,26 +5,29 @@ This module provides API endpoints for JSON generation operations.
 """
 
 import os
-import json
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, url_for
 
+from app.api.settings import current_settings
 from app.builders.response_builder import ResponseBuilder
-from app.services.excel_service import ExcelService
-from app.services.json_generation_service import JSONGenerationService
+from app.services import process_pool
+from app.services.json_generation_service import (
+    AGGREGATION_MODES,
+    NULL_HANDLING_STRATEGIES,
+)
+from app.services.process_pool import run_cpu_bound
 from app.utils.file_utils import FileUtils
 from app.utils.validators import Validators
-from app.utils.helpers import generate_output_filename
+from app.utils.helpers import (
+    as_bool,
+    generate_output_filename,
+    parse_column_list,
+    parse_column_mapping,
+)
 from app.core.exceptions import ValidationError, FileProcessingError
 
 json_bp = Blueprint("json", __name__)
 
 
-def get_services():
-    """Get service instances with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return ExcelService(config), JSONGenerationService(config)
-
-
 @json_bp.route("/generate", methods=["POST"])
 def generate_json():
     """
@@ -54,80 +57,62 @@ def generate_json():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        config, upload_folder, output_folder = current_settings()
 
         # Parse request parameters
         columns_str = request.form.get("columns", "[]")
-        columns = json.loads(columns_str) if columns_str else []
+        columns = parse_column_list("columns", columns_str) if columns_str else []
 
         column_mapping_str = request.form.get("column_mapping", "{}")
-        column_mapping = json.loads(column_mapping_str) if column_mapping_str else {}
+        column_mapping = (
+            parse_column_mapping("column_mapping", column_mapping_str)
+            if column_mapping_str
+            else {}
+        )
 
-        pretty_print = request.form.get("pretty_print", "true").lower() == "true"
+        pretty_print = as_bool(request.form.get("pretty_print"), True)
         null_handling = request.form.get("null_handling", "include")
-        array_wrapper = request.form.get("array_wrapper", "true").lower() == "true"
+        array_wrapper = as_bool(request.form.get("array_wrapper"), True)
         output_filename = request.form.get("output_filename")
 
         # Validate null_handling
-        if null_handling not in ["include", "exclude", "default"]:
+        if null_handling not in NULL_HANDLING_STRATEGIES:
             raise ValidationError(
                 f"Invalid null_handling: {null_handling}. "
                 f"Must be 'include', 'exclude', or 'default'"
             )
 
-        # Ensure directories exist
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-
-        # Save uploaded file
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            excel_service, json_service = get_services()
-
-            # Read Excel file
-            df = excel_service.read_excel(file_path)
-
-            # Extract specified columns if provided
-            if columns:
-                missing_columns = [col for col in columns if col not in df.columns]
-                if missing_columns:
-                    raise ValidationError(
-                        f"Columns not found: {', '.join(missing_columns)}"
-                    )
-                df = df[columns]
-
-            # Use all columns if no mapping provided
-            if not column_mapping:
-                column_mapping = {col: col for col in df.columns}
+        safe_name = FileUtils.secure_filename(file.filename)
 
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             # Generate output filename
             if output_filename:
                 output_file = output_filename
                 if not output_file.endswith(".json"):
                     output_file += ".json"
             else:
-                output_file = generate_output_filename(
-                    file.filename, "generated", ".json"
-                )
+                output_file = generate_output_filename(safe_name, "generated", ".json")
 
             output_path = os.path.join(output_folder, output_file)
 
-            # Generate JSON
-            result = json_service.generate_json(
-                data=df,
-                column_mapping=column_mapping,
+            # Read the sheet and generate JSON in the CPU process pool
+            result = run_cpu_bound(
+                config,
+                process_pool.generate_json_file,
+                file_path=file_path,
                 output_path=output_path,
+                columns=columns,
+                column_mapping=column_mapping,
                 pretty_print=pretty_print,
                 null_handling=null_handling,
                 array_wrapper=array_wrapper,
             )
 
             # Build download URL
-            download_url = f"{request.scheme}://{request.host}/api/v1/files/downloads/{output_file}"
+            download_url = url_for(
+                "files.download_file", filename=output_file, _external=True
+            )
 
             response_data = {
                 "download_url": download_url,
@@ -135,22 +120,17 @@ def generate_json():
                 "file_size": result["file_size"],
             }
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data=response_data,
                 message="JSON file generated successfully",
             )
-            return jsonify(response), 200
-
-        finally:
-            # Clean up uploaded file
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @json_bp.route("/generate-with-template", methods=["POST"])
@@ -190,11 +170,10 @@ def generate_json_with_template():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        config, upload_folder, output_folder = current_settings()
 
-        # Parse required parameters
+        # Parse required parameters; the template is passed through as a
+        # string so the service can reuse its compiled form across requests
         template_str = request.form.get("template")
         if not template_str:
             raise ValidationError("template is required")
@@ -203,51 +182,26 @@ def generate_json_with_template():
         if not column_mapping_str:
             raise ValidationError("column_mapping is required")
 
-        # Parse JSON parameters
-        try:
-            # Template can be a JSON string or already parsed
-            template = (
-                json.loads(template_str)
-                if isinstance(template_str, str)
-                else template_str
-            )
-        except json.JSONDecodeError as e:
-            raise ValidationError(f"Invalid template JSON: {str(e)}")
-
-        try:
-            column_mapping = json.loads(column_mapping_str)
-        except json.JSONDecodeError as e:
-            raise ValidationError(f"Invalid column_mapping JSON: {str(e)}")
-
+        column_mapping = parse_column_mapping("column_mapping", column_mapping_str)
         if not column_mapping:
             raise ValidationError("column_mapping cannot be empty")
 
         # Parse optional parameters
-        pretty_print = request.form.get("pretty_print", "true").lower() == "true"
+        pretty_print = as_bool(request.form.get("pretty_print"), True)
         aggregation_mode = request.form.get("aggregation_mode", "array")
         output_filename = request.form.get("output_filename")
 
         # Validate aggregation_mode
-        if aggregation_mode not in ["array", "single", "nested"]:
+        if aggregation_mode not in AGGREGATION_MODES:
             raise ValidationError(
                 f"Invalid aggregation_mode: {aggregation_mode}. "
                 f"Must be 'array', 'single', or 'nested'"
             )
 
-        # Ensure directories exist
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-
-        # Save uploaded file
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            excel_service, json_service = get_services()
-
-            # Read Excel file
-            df = excel_service.read_excel(file_path)
+        safe_name = FileUtils.secure_filename(file.filename)
 
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             # Generate output filename
             if output_filename:
                 output_file = output_filename
@@ -255,23 +209,27 @@ def generate_json_with_template():
                     output_file += ".json"
             else:
                 output_file = generate_output_filename(
-                    file.filename, "generated_template", ".json"
+                    safe_name, "generated_template", ".json"
                 )
 
             output_path = os.path.join(output_folder, output_file)
 
-            # Generate JSON with template
-            result = json_service.generate_json_with_template(
-                data=df,
-                template=template,
-                column_mapping=column_mapping,
+            # Read the sheet and generate JSON in the CPU process pool
+            result = run_cpu_bound(
+                config,
+                process_pool.generate_json_with_template_file,
+                file_path=file_path,
                 output_path=output_path,
+                template=template_str,
+                column_mapping=column_mapping,
                 pretty_print=pretty_print,
                 aggregation_mode=aggregation_mode,
             )
 
             # Build download URL
-            download_url = f"{request.scheme}://{request.host}/api/v1/files/downloads/{output_file}"
+            download_url = url_for(
+                "files.download_file", filename=output_file, _external=True
+            )
 
             response_data = {
                 "download_url": download_url,
@@ -279,19 +237,14 @@ def generate_json_with_template():
                 "file_size": result["file_size"],
             }
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data=response_data,
                 message="JSON file generated successfully with template",
             )
-            return jsonify(response), 200
-
-        finally:
-            # Clean up uploaded file
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
@@ -5,27 +5,23 @@ This module provides API endpoints for data normalization operations.
 """
 
 import os
-from flask import Blueprint, request, jsonify, current_app
-from werkzeug.utils import secure_filename
+import orjson
+from flask import Blueprint, request, current_app, url_for
 
+from app.api.settings import current_settings, shared_service
 from app.builders.response_builder import ResponseBuilder
-from app.services.excel_service import ExcelService
+from app.services import process_pool
 from app.services.normalization_service import NormalizationService
+from app.services.process_pool import run_cpu_bound
 from app.models.request import NormalizationConfig
 from app.utils.file_utils import FileUtils
 from app.utils.validators import Validators
-from app.utils.helpers import generate_output_filename
+from app.utils.helpers import as_bool, generate_output_filename
 from app.core.exceptions import ValidationError, FileProcessingError, NormalizationError
 
 normalization_bp = Blueprint("normalization", __name__)
 
 
-def get_services():
-    """Get service instances with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return ExcelService(config), NormalizationService(config)
-
-
 @normalization_bp.route("/types", methods=["GET"])
 def get_normalization_types():
     """
@@ -38,19 +34,16 @@ def get_normalization_types():
         curl http://localhost:5050/api/v1/normalization/types
     """
     try:
-        config = current_app.config.get("PYCELIZE")
-        service = NormalizationService(config)
-        types = service.get_available_normalizations()
+        types = shared_service(NormalizationService).get_available_normalizations()
 
-        response = ResponseBuilder.success(
+        return ResponseBuilder.success_response(
             data=types,
             message="Normalization types retrieved successfully",
             total=len(types),
         )
-        return jsonify(response), 200
 
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @normalization_bp.route("/apply", methods=["POST"])
@@ -86,15 +79,11 @@ def apply_normalization():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        config, upload_folder, output_folder = current_settings()
 
         # Parse normalizations
-        import json
-
         normalizations_str = request.form.get("normalizations", "[]")
-        normalizations_data = json.loads(normalizations_str)
+        normalizations_data = orjson.loads(normalizations_str)
 
         if not normalizations_data:
             raise ValidationError("No normalization configurations provided")
@@ -105,66 +94,53 @@ def apply_normalization():
         ]
 
         output_filename = request.form.get("output_filename")
-        return_report = request.form.get("return_report", "false").lower() == "true"
-
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            excel_service, norm_service = get_services()
+        return_report = as_bool(request.form.get("return_report"), False)
 
-            # Read data
-            df = excel_service.read_excel(file_path)
-
-            # Apply normalization
-            normalized_df, report = norm_service.normalize(df, normalization_configs)
+        safe_name = FileUtils.secure_filename(file.filename)
 
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             # Generate output path
             if output_filename:
-                output_path = os.path.join(
-                    output_folder, secure_filename(output_filename)
-                )
+                filename = FileUtils.secure_filename(output_filename)
             else:
-                output_path = os.path.join(
-                    output_folder,
-                    generate_output_filename(file.filename, "normalized", ".xlsx"),
-                )
+                filename = generate_output_filename(safe_name, "normalized", ".xlsx")
+            output_path = os.path.join(output_folder, filename)
 
             logger.info(f"Writing normalized file to {output_path}")
 
-            # Write result
-            excel_service.write_excel(normalized_df, output_path)
+            # Read, normalize and write the result in the CPU process pool
+            report = run_cpu_bound(
+                config,
+                process_pool.normalize_to_file,
+                file_path=file_path,
+                normalizations=normalization_configs,
+                output_path=output_path,
+            )
 
             if return_report:
-                response = ResponseBuilder.success(
+                return ResponseBuilder.success_response(
                     data={
                         "report": report,
-                        "output_file": os.path.basename(output_path),
+                        "output_file": filename,
                     },
                     message="Normalization completed successfully",
                 )
-                return jsonify(response), 200
             else:
                 # Build download URL
-                host = request.host
-                filename = os.path.basename(output_path)
-                download_url = f"http://{host}/api/v1/files/downloads/{filename}"
-                response = ResponseBuilder.success(
+                download_url = url_for(
+                    "files.download_file", filename=filename, _external=True
+                )
+                return ResponseBuilder.success_response(
                     data={"download_url": download_url},
                     message="Extracted Excel file generated successfully",
                 )
-                return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except NormalizationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
@@ -4,27 +4,166 @@ SQL Generation Routes
 This module provides API endpoints for SQL generation operations.
 """
 
+import copy
 import os
-import json
-from datetime import datetime
-from flask import Blueprint, request, jsonify, current_app
+from functools import lru_cache
+from typing import Dict, Optional
 
+from flask import Blueprint, request, url_for
+
+from app.api.settings import current_settings
 from app.builders.response_builder import ResponseBuilder
-from app.services.excel_service import ExcelService
+from app.services import process_pool
+from app.services.process_pool import run_cpu_bound
 from app.services.sql_generation_service import SQLGenerationService
+from app.models.enums import DatabaseType
 from app.models.request import SQLGenerationRequest, AutoIncrementConfig
 from app.utils.file_utils import FileUtils
 from app.utils.validators import Validators
-from app.utils.helpers import generate_output_filename
+from app.utils.helpers import (
+    as_bool,
+    generate_output_filename,
+    json_response,
+    parse_column_list,
+    parse_column_mapping,
+    parse_json_field,
+)
 from app.core.exceptions import ValidationError, FileProcessingError, SQLGenerationError
 
 sql_bp = Blueprint("sql", __name__)
 
+# Database types accepted by the generation endpoints
+_DATABASE_TYPES = frozenset(db.value for db in DatabaseType)
+
+# The /databases body only varies in its meta block, so build the rest once
+_DATABASES_RESPONSE = ResponseBuilder.template(
+    "Supported databases retrieved successfully"
+)
+_DATABASES_DATA = {"databases": SQLGenerationService.get_supported_databases()}
+
+
+def _validate_database_type(database_type):
+    """
+    Reject unsupported database types before the upload is read.
+
+    Args:
+        database_type: Database type from the request (case-insensitive)
+
+    Raises:
+        ValidationError: If the database type is not supported
+    """
+    if database_type.lower() not in _DATABASE_TYPES:
+        raise ValidationError(
+            f"Invalid database_type: {database_type}. "
+            f"Must be one of: {', '.join(sorted(_DATABASE_TYPES))}"
+        )
+
+
+@lru_cache(maxsize=512)
+def _auto_increment_config(raw: str) -> Optional[AutoIncrementConfig]:
+    """
+    Parse an auto_increment form field, reusing results for repeated values.
+
+    Args:
+        raw: Raw auto_increment JSON
+
+    Returns:
+        Parsed configuration, or None when the field is empty
+
+    Raises:
+        ValidationError: If the value is not valid JSON
+    """
+    data = parse_json_field("auto_increment", raw)
+    return AutoIncrementConfig.from_dict(data) if data else None
 
-def get_services():
-    """Get service instances with current app config."""
-    config = current_app.config.get("PYCELIZE")
-    return ExcelService(config), SQLGenerationService(config)
+
+@lru_cache(maxsize=512)
+def _column_mapping(raw: str) -> Dict[str, str]:
+    """
+    Parse a required column_mapping form field, reusing results for repeated values.
+
+    Wide schemas send multi-kilobyte mappings, usually the same one on every
+    call. Callers must copy the result before changing it.
+
+    Args:
+        raw: Raw column_mapping JSON
+
+    Returns:
+        Shared column mapping
+
+    Raises:
+        ValidationError: If the value is malformed or empty
+    """
+    column_mapping = parse_column_mapping("column_mapping", raw)
+    if not column_mapping:
+        raise ValidationError("column_mapping is required")
+    return column_mapping
+
+
+@lru_cache(maxsize=512)
+def _sql_request(
+    table_name: str,
+    column_mapping_str: str,
+    database_type: str,
+    auto_increment_str: str,
+    template: Optional[str] = None,
+    batch_size: int = 1000,
+    include_transaction: bool = True,
+) -> SQLGenerationRequest:
+    """
+    Build a SQL generation request from raw form values.
+
+    Clients tend to resend the same table, mapping and options, so the
+    parsed and validated request is cached by the raw strings. Callers
+    must copy the result before changing it.
+
+    Args:
+        table_name: Target table name
+        column_mapping_str: Raw column_mapping JSON
+        database_type: Database type from the request
+        auto_increment_str: Raw auto_increment JSON
+        template: Optional custom SQL template
+        batch_size: Number of statements per batch
+        include_transaction: Whether to wrap statements in a transaction
+
+    Returns:
+        Shared SQLGenerationRequest
+
+    Raises:
+        ValidationError: If a field is missing, malformed or unsupported
+    """
+    column_mapping = _column_mapping(column_mapping_str)
+    _validate_database_type(database_type)
+
+    return SQLGenerationRequest(
+        table_name=table_name,
+        column_mapping=column_mapping,
+        database_type=database_type,
+        template=template,
+        auto_increment=_auto_increment_config(auto_increment_str),
+        batch_size=batch_size,
+        include_transaction=include_transaction,
+    )
+
+
+def _read_columns(columns, column_mapping, remove_duplicates=False):
+    """
+    Work out which columns a SQL request actually needs read from the sheet.
+
+    Args:
+        columns: Columns explicitly requested by the caller
+        column_mapping: Mapping of SQL columns or placeholders to data columns
+        remove_duplicates: Whether rows are deduplicated before generation
+
+    Returns:
+        Column names to pass as ``usecols``, or None to read every column
+    """
+    if columns:
+        return columns
+    # Deduplication compares whole rows, so every column must be loaded
+    if remove_duplicates:
+        return None
+    return list(column_mapping.values())
 
 
 @sql_bp.route("/databases", methods=["GET"])
@@ -38,19 +177,9 @@ def get_supported_databases():
     Example:
         curl http://localhost:5050/api/v1/sql/databases
     """
-    try:
-        config = current_app.config.get("PYCELIZE")
-        service = SQLGenerationService(config)
-        databases = service.get_supported_databases()
-
-        response = ResponseBuilder.success(
-            data={"databases": databases},
-            message="Supported databases retrieved successfully",
-        )
-        return jsonify(response), 200
-
-    except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+    return json_response(
+        ResponseBuilder.from_template(_DATABASES_RESPONSE, _DATABASES_DATA)
+    )
 
 
 @sql_bp.route("/generate", methods=["POST"])
@@ -93,100 +222,77 @@ def generate_sql():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        config, upload_folder, output_folder = current_settings()
 
-        # Parse request parameters
-        table_name = request.form.get("table_name")
+        # Parse request parameters from a single snapshot of the form
+        form = request.form.to_dict()
+        table_name = form.get("table_name")
         if not table_name:
             raise ValidationError("table_name is required")
 
-        column_mapping_str = request.form.get("column_mapping", "{}")
-        column_mapping = json.loads(column_mapping_str)
-
-        if not column_mapping:
-            raise ValidationError("column_mapping is required")
-
-        database_type = request.form.get("database_type", "postgresql")
-        template = request.form.get("template")
-        batch_size = int(request.form.get("batch_size", 1000))
-        include_transaction = (
-            request.form.get("include_transaction", "true").lower() == "true"
-        )
-        return_file = request.form.get("return_file", "false").lower() == "true"
-
-        # Parse auto-increment config
-        auto_increment_str = request.form.get("auto_increment", "{}")
-        auto_increment_data = json.loads(auto_increment_str)
+        return_file = as_bool(form.get("return_file"), False)
 
         # Create request object
-        sql_request = SQLGenerationRequest(
-            table_name=table_name,
-            column_mapping=column_mapping,
-            database_type=database_type,
-            template=template,
-            batch_size=batch_size,
-            include_transaction=include_transaction,
-        )
-
-        if auto_increment_data:
-            from app.models.request import AutoIncrementConfig
-
-            sql_request.auto_increment = AutoIncrementConfig.from_dict(
-                auto_increment_data
+        sql_request = copy.copy(
+            _sql_request(
+                table_name,
+                form.get("column_mapping", "{}"),
+                form.get("database_type", "postgresql"),
+                form.get("auto_increment", "{}"),
+                template=form.get("template"),
+                batch_size=int(form.get("batch_size", 1000)),
+                include_transaction=as_bool(form.get("include_transaction"), True),
             )
+        )
 
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            excel_service, sql_service = get_services()
-
-            # Read data
-            df = excel_service.read_excel(file_path)
-
-            # Generate SQL
-            result = sql_service.generate_sql(df, sql_request)
+        safe_name = FileUtils.secure_filename(file.filename)
 
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
             if return_file:
-                # Export to file
-                output_path = os.path.join(
-                    output_folder,
-                    generate_output_filename(file.filename, "sql", ".sql"),
+                # Stream the sheet in batch_size chunks straight to the file,
+                # in the CPU process pool
+                filename = generate_output_filename(safe_name, "sql", ".sql")
+                output_path = os.path.join(output_folder, filename)
+                run_cpu_bound(
+                    config,
+                    process_pool.generate_sql_file,
+                    file_path=file_path,
+                    sql_request=sql_request,
+                    output_path=output_path,
                 )
-                sql_service.export_sql(result["statements"], output_path)
 
                 # Build download URL
-                host = request.host
-                filename = os.path.basename(output_path)
-                download_url = f"http://{host}/api/v1/files/downloads/{filename}"
-                response = ResponseBuilder.success(
+                download_url = url_for(
+                    "files.download_file", filename=filename, _external=True
+                )
+                return ResponseBuilder.success_response(
                     data={"download_url": download_url},
                     message="Generate Standard SQL file successfully",
                 )
-                return jsonify(response), 200
             else:
-                response = ResponseBuilder.success(
+                # Read data and generate SQL in the CPU process pool
+                result = run_cpu_bound(
+                    config,
+                    process_pool.generate_sql,
+                    file_path=file_path,
+                    sql_request=sql_request,
+                )
+
+                return ResponseBuilder.success_response(
                     data=result,
                     message="SQL generated successfully",
                     total=result["total_statements"],
                 )
-                return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except SQLGenerationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @sql_bp.route("/generate-to-text", methods=["POST"])
@@ -220,103 +326,66 @@ def generate_sql_to_text():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        config, upload_folder, output_folder = current_settings()
 
-        # Parse request parameters
-        columns_str = request.form.get("columns", "[]")
-        columns = json.loads(columns_str)
+        # Parse request parameters from a single snapshot of the form
+        form = request.form.to_dict()
+        columns_str = form.get("columns", "[]")
+        columns = parse_column_list("columns", columns_str)
 
-        table_name = request.form.get("table_name")
+        table_name = form.get("table_name")
         if not table_name:
             raise ValidationError("table_name is required")
 
-        column_mapping_str = request.form.get("column_mapping", "{}")
-        column_mapping = json.loads(column_mapping_str)
-
-        if not column_mapping:
-            raise ValidationError("column_mapping is required")
-
-        database_type = request.form.get("database_type", "postgresql")
-        remove_duplicates = (
-            request.form.get("remove_duplicates", "false").lower() == "true"
-        )
-
-        # Parse auto-increment config
-        auto_increment_str = request.form.get("auto_increment", "{}")
-        auto_increment_data = json.loads(auto_increment_str)
+        remove_duplicates = as_bool(form.get("remove_duplicates"), False)
 
         # Create request object
-        sql_request = SQLGenerationRequest(
-            table_name=table_name,
-            column_mapping=column_mapping,
-            database_type=database_type,
-            batch_size=1000,
-            include_transaction=True,
+        sql_request = copy.copy(
+            _sql_request(
+                table_name,
+                form.get("column_mapping", "{}"),
+                form.get("database_type", "postgresql"),
+                form.get("auto_increment", "{}"),
+            )
         )
 
-        if auto_increment_data:
-            from app.models.request import AutoIncrementConfig
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
+            output_filename = generate_output_filename("sql_statements.txt")
+            output_path = os.path.join(output_folder, output_filename)
 
-            sql_request.auto_increment = AutoIncrementConfig.from_dict(
-                auto_increment_data
+            # Read, generate and save to text file in the CPU process pool
+            run_cpu_bound(
+                config,
+                process_pool.generate_sql_text_file,
+                file_path=file_path,
+                sql_request=sql_request,
+                output_path=output_path,
+                columns=columns,
+                usecols=_read_columns(
+                    columns, sql_request.column_mapping, remove_duplicates
+                ),
+                remove_duplicates=remove_duplicates,
             )
 
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            excel_service, sql_service = get_services()
-
-            # Read data
-            df = excel_service.read_excel(file_path)
-
-            # Extract columns if specified
-            if columns:
-                missing_columns = [col for col in columns if col not in df.columns]
-                if missing_columns:
-                    raise ValidationError(
-                        f"Columns not found: {', '.join(missing_columns)}"
-                    )
-                df = df[columns]
-
-            # Remove duplicates if requested
-            if remove_duplicates:
-                df = df.drop_duplicates()
-
-            # Generate SQL
-            result = sql_service.generate_sql(df, sql_request)
-
-            # Save to text file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"sql_statements_{timestamp}.txt"
-            output_path = os.path.join(output_folder, output_filename)
-            sql_service.export_sql(result["statements"], output_path)
-
             # Build download URL
-            host = request.host
-            download_url = f"http://{host}/api/v1/files/downloads/{output_filename}"
+            download_url = url_for(
+                "files.download_file", filename=output_filename, _external=True
+            )
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data={"download_url": download_url},
                 message="SQL text file generated successfully",
             )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except SQLGenerationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
 
 
 @sql_bp.route("/generate-custom-to-text", methods=["POST"])
@@ -360,15 +429,14 @@ def generate_custom_sql_to_text():
         Validators.validate_file_uploaded(request.files.get("file"))
 
         file = request.files["file"]
-        config = current_app.config.get("PYCELIZE")
-        upload_folder = config.get("file.upload_folder", "uploads")
-        output_folder = config.get("file.output_folder", "outputs")
+        config, upload_folder, output_folder = current_settings()
 
-        # Parse request parameters
-        columns_str = request.form.get("columns", "[]")
-        columns = json.loads(columns_str)
+        # Parse request parameters from a single snapshot of the form
+        form = request.form.to_dict()
+        columns_str = form.get("columns", "[]")
+        columns = parse_column_list("columns", columns_str)
 
-        template = request.form.get("template")
+        template = form.get("template")
         if not template:
             raise ValidationError("template is required")
 
@@ -381,76 +449,50 @@ def generate_custom_sql_to_text():
         ):
             template = template[1:-1]
 
-        sheet_name = request.form.get("sheet_name", "Sheet1") or "Sheet1"
+        sheet_name = form.get("sheet_name", "Sheet1") or "Sheet1"
 
-        column_mapping_str = request.form.get("column_mapping", "{}")
-        column_mapping = json.loads(column_mapping_str)
+        column_mapping = _column_mapping(form.get("column_mapping", "{}"))
 
-        if not column_mapping:
-            raise ValidationError("column_mapping is required")
-
-        remove_duplicates = (
-            request.form.get("remove_duplicates", "false").lower() == "true"
-        )
+        remove_duplicates = as_bool(form.get("remove_duplicates"), False)
 
         # Parse auto-increment config
-        auto_increment_str = request.form.get("auto_increment", "{}")
-        auto_increment_data = json.loads(auto_increment_str)
-
-        FileUtils.ensure_directory(upload_folder)
-        FileUtils.ensure_directory(output_folder)
-        file_path = FileUtils.secure_save_path(file.filename, upload_folder)
-        file.save(file_path)
-
-        try:
-            excel_service, sql_service = get_services()
-
-            # Read data
-            df = excel_service.read_excel(file_path, sheet_name=sheet_name)
-
-            # Extract columns if specified
-            if columns:
-                missing_columns = [col for col in columns if col not in df.columns]
-                if missing_columns:
-                    raise ValidationError(
-                        f"Columns not found: {', '.join(missing_columns)}"
-                    )
-                df = df[columns]
-
-            # Remove duplicates if requested
-            if remove_duplicates:
-                df = df.drop_duplicates()
-
-            # Generate custom SQL
-            auto_config = AutoIncrementConfig.from_dict(auto_increment_data)
-            statements = sql_service.generate_custom_sql(
-                df, template, column_mapping, auto_config
-            )
+        auto_increment = _auto_increment_config(form.get("auto_increment", "{}"))
 
-            # Save to text file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"custom_sql_{timestamp}.txt"
+        # Stage uploaded file under a unique temporary name
+        with FileUtils.staged_upload(file, upload_folder) as file_path:
+            output_filename = generate_output_filename("custom_sql.txt")
             output_path = os.path.join(output_folder, output_filename)
-            sql_service.export_sql(statements, output_path)
+
+            # Read, render the template and save in the CPU process pool
+            run_cpu_bound(
+                config,
+                process_pool.generate_custom_sql_file,
+                file_path=file_path,
+                output_path=output_path,
+                template=template,
+                column_mapping=column_mapping,
+                auto_increment=auto_increment or AutoIncrementConfig(),
+                columns=columns,
+                sheet_name=sheet_name,
+                usecols=_read_columns(columns, column_mapping, remove_duplicates),
+                remove_duplicates=remove_duplicates,
+            )
 
             # Build download URL
-            host = request.host
-            download_url = f"http://{host}/api/v1/files/downloads/{output_filename}"
+            download_url = url_for(
+                "files.download_file", filename=output_filename, _external=True
+            )
 
-            response = ResponseBuilder.success(
+            return ResponseBuilder.success_response(
                 data={"download_url": download_url},
                 message="Custom SQL text file generated successfully",
             )
-            return jsonify(response), 200
-
-        finally:
-            FileUtils.delete_file(file_path)
 
     except ValidationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 422)), 422
+        return ResponseBuilder.error_response(e.message, 422)
     except SQLGenerationError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except FileProcessingError as e:
-        return jsonify(ResponseBuilder.error(e.message, 400)), 400
+        return ResponseBuilder.error_response(e.message, 400)
     except Exception as e:
-        return jsonify(ResponseBuilder.error(str(e), 500)), 500
+        return ResponseBuilder.error_response(str(e), 500)
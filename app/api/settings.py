@@ -0,0 +1,72 @@
+"""
+Route Settings
+
+This module resolves per-application settings and shared service
+instances used by the API route handlers, so handlers do not repeat
+configuration lookups on every request.
+"""
+
+import os
+from functools import lru_cache
+from typing import Tuple
+
+from flask import Flask, current_app
+
+from app.core.config import Config
+
+
+@lru_cache(maxsize=4)
+def app_settings(app: Flask) -> Tuple[Config, str, str]:
+    """
+    Resolve the app config and its upload/output folders once per application.
+
+    Args:
+        app: Flask application holding the PYCELIZE config
+
+    Returns:
+        Tuple of (config, upload folder, output folder)
+    """
+    config = app.config["PYCELIZE"]
+    return (
+        config,
+        config.get("file.upload_folder", "uploads"),
+        config.get("file.output_folder", "outputs"),
+    )
+
+
+def current_settings() -> Tuple[Config, str, str]:
+    """Return the cached config, upload folder and output folder for the current app."""
+    return app_settings(current_app._get_current_object())
+
+
+def ensure_folders(state) -> None:
+    """
+    Create the upload and output folders when a blueprint is registered.
+
+    Intended for use with ``Blueprint.record_once``.
+
+    Args:
+        state: Blueprint setup state passed by Flask
+    """
+    _, upload_folder, output_folder = app_settings(state.app)
+    os.makedirs(upload_folder, exist_ok=True)
+    os.makedirs(output_folder, exist_ok=True)
+
+
+@lru_cache(maxsize=16)
+def _service(service_cls: type, config: Config):
+    """Build one service instance per service class and config."""
+    return service_cls(config)
+
+
+def shared_service(service_cls: type):
+    """
+    Get the shared service instance for the current app config.
+
+    Args:
+        service_cls: Service class taking the config as its only argument
+
+    Returns:
+        Cached instance of service_cls
+    """
+    return _service(service_cls, current_settings()[0])
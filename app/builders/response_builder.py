@@ -5,11 +5,53 @@ This module implements the Builder Design Pattern for constructing
 API responses with consistent structure and metadata.
 """
 
-import uuid
+import itertools
+import os
+import time
 from datetime import datetime, timezone
-from typing import Any, Optional, Dict
+from functools import lru_cache
+from typing import Any, Optional, Dict, Tuple
 
-from flask import current_app
+from flask import Flask, Response, current_app
+
+# Request IDs are "<start time><pid><counter>", unique within each process
+_request_id_prefix = ""
+_request_counter = itertools.count()
+
+
+def _reset_request_ids() -> None:
+    """Start a new request ID sequence for this process."""
+    global _request_id_prefix, _request_counter
+    _request_id_prefix = (
+        f"{int(time.time()) & 0xFFFFFFFF:08x}{os.getpid() & 0xFFFFFFFF:08x}"
+    )
+    _request_counter = itertools.count()
+
+
+_reset_request_ids()
+# Forked workers (gunicorn, the CPU process pool) must not share a sequence
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+@lru_cache(maxsize=4)
+def _app_meta(app: Flask) -> Optional[Tuple[str, str]]:
+    """Resolve the API version and locale once per application."""
+    config = app.config.get("PYCELIZE")
+    if not config:
+        return None
+    return config.get("app.version", "v0.0.1"), config.get("api.locale", "en_US")
+
+
+@lru_cache(maxsize=16)
+def _meta_template(api_version: str, locale: str) -> Dict[str, Any]:
+    """Prebuild the meta block for a version and locale; callers must copy it."""
+    return {
+        "api_version": api_version,
+        "locale": locale,
+        "request_id": None,
+        "requested_time": None,
+    }
 
 
 class ResponseBuilder:
@@ -41,9 +83,22 @@ class ResponseBuilder:
         _total: Total count for collections
         _api_version: API version string
         _locale: Locale setting
-        _request_id: Unique request identifier
+        _request_id: Unique request identifier (generated by build() if unset)
+        _requested_time: Request timestamp (generated by build() if unset)
     """
 
+    # A builder is created for every response; slots skip the instance dict
+    __slots__ = (
+        "_data",
+        "_message",
+        "_status_code",
+        "_total",
+        "_api_version",
+        "_locale",
+        "_request_id",
+        "_requested_time",
+    )
+
     def __init__(self):
         """Initialize ResponseBuilder with default values."""
         self._data: Optional[Any] = None
@@ -52,8 +107,8 @@ class ResponseBuilder:
         self._total: int = 0
         self._api_version: str = "v0.0.1"
         self._locale: str = "en_US"
-        self._request_id: str = self._generate_request_id()
-        self._requested_time: str = self._get_current_time()
+        self._request_id: Optional[str] = None
+        self._requested_time: Optional[str] = None
 
     def with_data(self, data: Any) -> "ResponseBuilder":
         """
@@ -142,14 +197,9 @@ class ResponseBuilder:
         Returns:
             Self for method chaining
         """
-        try:
-            config = current_app.config.get("PYCELIZE")
-            if config:
-                self._api_version = config.get("app.version", "v0.0.1")
-                self._locale = config.get("api.locale", "en_US")
-        except RuntimeError:
-            # Outside application context, use defaults
-            pass
+        self._api_version, self._locale = self._config_meta(
+            self._api_version, self._locale
+        )
         return self
 
     def build(self) -> Dict[str, Any]:
@@ -168,12 +218,9 @@ class ResponseBuilder:
         return {
             "data": self._data,
             "message": self._message,
-            "meta": {
-                "api_version": self._api_version,
-                "locale": self._locale,
-                "request_id": self._request_id,
-                "requested_time": self._requested_time,
-            },
+            "meta": self._build_meta(
+                self._api_version, self._locale, self._request_id, self._requested_time
+            ),
             "status_code": self._status_code,
             "total": self._total,
         }
@@ -196,35 +243,83 @@ class ResponseBuilder:
         return {
             "data": {"error_type": error_type, "details": self._data},
             "message": self._message,
-            "meta": {
-                "api_version": self._api_version,
-                "locale": self._locale,
-                "request_id": self._request_id,
-                "requested_time": self._requested_time,
-            },
+            "meta": self._build_meta(
+                self._api_version, self._locale, self._request_id, self._requested_time
+            ),
             "status_code": self._status_code,
             "total": 0,
         }
 
+    @staticmethod
+    def _config_meta(
+        api_version: str = "v0.0.1", locale: str = "en_US"
+    ) -> Tuple[str, str]:
+        """
+        Read the API version and locale from the Flask app configuration.
+
+        The values are resolved once per application and reused afterwards.
+
+        Args:
+            api_version: Value to use outside an application context
+            locale: Value to use outside an application context
+
+        Returns:
+            Tuple of (api_version, locale)
+        """
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            # Outside application context, use defaults
+            return api_version, locale
+        return _app_meta(app) or (api_version, locale)
+
+    @classmethod
+    def _build_meta(
+        cls,
+        api_version: str,
+        locale: str,
+        request_id: Optional[str] = None,
+        requested_time: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the meta block from a cached template.
+
+        Args:
+            api_version: API version string
+            locale: Locale string
+            request_id: Request ID, generated when not given
+            requested_time: Request timestamp, generated when not given
+
+        Returns:
+            Meta dictionary for a single response
+        """
+        meta = _meta_template(api_version, locale).copy()
+        meta["request_id"] = request_id or cls._generate_request_id()
+        meta["requested_time"] = requested_time or cls._get_current_time()
+        return meta
+
     @staticmethod
     def _generate_request_id() -> str:
         """
         Generate a unique request identifier.
 
+        Combines the process start time and pid with a per-process counter,
+        so no entropy has to be read from the kernel.
+
         Returns:
             32-character hexadecimal request ID
         """
-        return uuid.uuid4().hex
+        return f"{_request_id_prefix}{next(_request_counter):016x}"
 
     @staticmethod
     def _get_current_time() -> str:
         """
-        Get the current timestamp in ISO format with timezone.
+        Get the current UTC timestamp in ISO format.
 
         Returns:
-            ISO formatted timestamp string
+            ISO formatted timestamp string with millisecond precision
         """
-        return datetime.now(timezone.utc).astimezone().isoformat()
+        return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
     @classmethod
     def success(
@@ -250,6 +345,50 @@ class ResponseBuilder:
             .build()
         )
 
+    @staticmethod
+    def template(message: str, status_code: int = 200) -> Dict[str, Any]:
+        """
+        Prebuild the static part of a response.
+
+        Routes that return the same message on every call can build the
+        skeleton once at import time and fill it with from_template().
+
+        Args:
+            message: Response message
+            status_code: HTTP status code
+
+        Returns:
+            Response skeleton with data and meta left empty
+        """
+        return {
+            "data": None,
+            "message": message,
+            "meta": None,
+            "status_code": status_code,
+            "total": 0,
+        }
+
+    @classmethod
+    def from_template(cls, template: Dict[str, Any], data: Any) -> Dict[str, Any]:
+        """
+        Fill a prebuilt response skeleton without going through the builder.
+
+        Produces the same structure as success() while skipping the builder
+        object and its chained setters.
+
+        Args:
+            template: Skeleton returned by template()
+            data: Response data payload
+
+        Returns:
+            Response dictionary
+        """
+        api_version, locale = cls._config_meta()
+        response = template.copy()
+        response["data"] = data
+        response["meta"] = cls._build_meta(api_version, locale)
+        return response
+
     @classmethod
     def error(
         cls, message: str = "Error", status_code: int = 500, details: Any = None
@@ -272,3 +411,41 @@ class ResponseBuilder:
             .with_status_code(status_code)
             .build_error()
         )
+
+    @classmethod
+    def success_response(
+        cls, data: Any = None, message: str = "Success", total: int = 0
+    ) -> Response:
+        """
+        Build a success response and serialize it straight to a Flask Response.
+
+        Args:
+            data: Response data payload
+            message: Success message
+            total: Total count for collections
+
+        Returns:
+            JSON Response with status 200
+        """
+        from app.utils.helpers import json_response
+
+        return json_response(cls.success(data, message, total), 200)
+
+    @classmethod
+    def error_response(
+        cls, message: str = "Error", status_code: int = 500, details: Any = None
+    ) -> Response:
+        """
+        Build an error response and serialize it straight to a Flask Response.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code
+            details: Additional error details
+
+        Returns:
+            JSON Response carrying status_code
+        """
+        from app.utils.helpers import json_response
+
+        return json_response(cls.error(message, status_code, details), status_code)
@@ -5,13 +5,141 @@ This module implements the Builder Design Pattern for constructing
 SQL statements with support for various database types.
 """
 
-from typing import Any, Optional, Dict, List
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+)
+import re
 from datetime import datetime, date
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from app.models.enums import DatabaseType, SQLAutoIncrementType
 
 
+class _LiteralStyle(NamedTuple):
+    """How a database spells literals, transactions and built-in functions."""
+
+    escapes: Tuple[Tuple[str, str], ...]
+    true: str
+    false: str
+    timestamp_suffix: str
+    transaction_start: str
+    current_timestamp: str
+    current_date: str
+    uuid_function: str
+
+
+_STANDARD_ESCAPES = (("'", "''"),)
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _is_null(value: Any) -> bool:
+    """Check whether a cell value is one of the missing-value markers pandas uses."""
+    return (
+        value is None
+        or value is pd.NA
+        or value is pd.NaT
+        or (isinstance(value, (float, np.floating)) and value != value)
+    )
+
+
+# Dialect rules per database, looked up once when the database type is set
+_LITERAL_STYLES: Dict[DatabaseType, _LiteralStyle] = {
+    DatabaseType.POSTGRESQL: _LiteralStyle(
+        escapes=_STANDARD_ESCAPES,
+        true="TRUE",
+        false="FALSE",
+        timestamp_suffix="::timestamp",
+        transaction_start="BEGIN;",
+        current_timestamp="NOW()",
+        current_date="CURRENT_DATE",
+        uuid_function="uuid_generate_v4()",
+    ),
+    DatabaseType.MYSQL: _LiteralStyle(
+        escapes=(("'", "\\'"), ('"', '\\"')),
+        true="1",
+        false="0",
+        timestamp_suffix="",
+        transaction_start="START TRANSACTION;",
+        current_timestamp="NOW()",
+        current_date="CURDATE()",
+        uuid_function="UUID()",
+    ),
+    DatabaseType.SQLITE: _LiteralStyle(
+        escapes=_STANDARD_ESCAPES,
+        true="1",
+        false="0",
+        timestamp_suffix="",
+        transaction_start="BEGIN TRANSACTION;",
+        current_timestamp="datetime('now')",
+        current_date="date('now')",
+        uuid_function="UUID()",
+    ),
+}
+
+
+def _escape_braces(text: str) -> str:
+    """Escape literal braces for use in a str.format pattern."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@lru_cache(maxsize=64)
+def _compile_template(
+    template: str,
+    columns: Tuple[str, ...],
+    current_timestamp: str,
+    current_date: str,
+    with_auto_id: bool,
+) -> str:
+    """
+    Turn a SQL template into a str.format pattern with positional fields.
+
+    Field i takes the formatted value of columns[i]; when with_auto_id is
+    set, field len(columns) takes the auto-increment value. The current
+    timestamp/date placeholders are filled in directly. Placeholders are
+    resolved with the same precedence as successive str.replace calls:
+    {auto_id}, then columns, then the timestamp/date functions.
+
+    Args:
+        template: SQL template with {placeholder} markers
+        columns: Placeholder names bound to row values, in value order
+        current_timestamp: SQL expression for {current_timestamp}
+        current_date: SQL expression for {current_date}
+        with_auto_id: Whether {auto_id} is bound to a value
+
+    Returns:
+        Pattern to call .format(*values) on once per row
+    """
+    fields = {
+        "{current_timestamp}": _escape_braces(current_timestamp),
+        "{current_date}": _escape_braces(current_date),
+    }
+    fields.update((f"{{{column}}}", f"{{{i}}}") for i, column in enumerate(columns))
+    if with_auto_id:
+        fields["{auto_id}"] = f"{{{len(columns)}}}"
+
+    placeholder = re.compile("|".join(map(re.escape, fields)))
+    parts = []
+    position = 0
+    for match in placeholder.finditer(template):
+        parts.append(_escape_braces(template[position : match.start()]))
+        parts.append(fields[match.group()])
+        position = match.end()
+    parts.append(_escape_braces(template[position:]))
+    return "".join(parts)
+
+
 class SQLBuilder:
     """
     Builder class for constructing SQL statements.
@@ -37,13 +165,15 @@ class SQLBuilder:
         _columns: List of column names
         _auto_increment_config: Auto-increment column configuration
         _include_transaction: Whether to wrap in transaction
-        _batch_size: Number of statements per batch
+        _batch_size: Number of rows per multi-row INSERT
+        _multi_row_inserts: Whether to group rows into multi-row INSERTs
     """
 
     def __init__(self):
         """Initialize SQLBuilder with default values."""
         self._table_name: str = ""
         self._database_type: DatabaseType = DatabaseType.POSTGRESQL
+        self._literal_style: _LiteralStyle = _LITERAL_STYLES[DatabaseType.POSTGRESQL]
         self._columns: List[str] = []
         self._column_mapping: Dict[str, str] = {}
         self._auto_increment_enabled: bool = False
@@ -54,7 +184,14 @@ class SQLBuilder:
         self._current_value: int = 1
         self._include_transaction: bool = True
         self._batch_size: int = 1000
+        self._multi_row_inserts: bool = False
         self._template: Optional[str] = None
+        self._insert_prefix: str = ""
+        self._auto_expression: Optional[str] = None
+        self._auto_counted: bool = False
+        self._template_format: str = ""
+        self._template_auto_id: bool = False
+        self._rebuild_skeleton()
 
     def with_table_name(self, table_name: str) -> "SQLBuilder":
         """
@@ -67,6 +204,7 @@ class SQLBuilder:
             Self for method chaining
         """
         self._table_name = table_name
+        self._rebuild_skeleton()
         return self
 
     def with_database_type(self, db_type: DatabaseType) -> "SQLBuilder":
@@ -80,6 +218,8 @@ class SQLBuilder:
             Self for method chaining
         """
         self._database_type = db_type
+        self._literal_style = _LITERAL_STYLES[db_type]
+        self._rebuild_skeleton()
         return self
 
     def with_columns(self, columns: List[str]) -> "SQLBuilder":
@@ -107,6 +247,7 @@ class SQLBuilder:
         """
         self._column_mapping = mapping
         self._columns = list(mapping.keys())
+        self._rebuild_skeleton()
         return self
 
     def with_auto_increment(
@@ -134,8 +275,51 @@ class SQLBuilder:
         self._start_value = start_value
         self._current_value = start_value
         self._sequence_name = sequence_name or f"seq_{column_name}"
+        self._rebuild_skeleton()
         return self
 
+    def _rebuild_skeleton(self) -> None:
+        """
+        Resolve the INSERT prefix, auto-increment values and template pattern.
+
+        The auto-increment column is written either as a constant expression
+        (a sequence or UUID call) or as a counter; columns the database fills
+        itself are left out of the INSERT. A custom template is compiled to
+        its str.format pattern here rather than looked up per row.
+        """
+        self._auto_expression = None
+        self._auto_counted = False
+        if self._auto_increment_type == SQLAutoIncrementType.MANUAL_SEQUENCE:
+            if self._database_type == DatabaseType.POSTGRESQL:
+                self._auto_expression = f"nextval('{self._sequence_name}')"
+            else:
+                self._auto_counted = True
+        elif self._auto_increment_type == SQLAutoIncrementType.UUID_GENERATE:
+            self._auto_expression = self._literal_style.uuid_function
+
+        columns = list(self._column_mapping)
+        if self._auto_increment_enabled and (
+            self._auto_counted or self._auto_expression is not None
+        ):
+            columns.insert(0, self._auto_increment_column)
+        self._insert_prefix = (
+            f"INSERT INTO {self._table_name} ({', '.join(columns)}) VALUES "
+        )
+
+        self._template_auto_id = bool(
+            self._template
+            and self._auto_increment_enabled
+            and "{auto_id}" in self._template
+        )
+        if self._template:
+            self._template_format = _compile_template(
+                self._template,
+                tuple(self._column_mapping),
+                self._get_current_timestamp(),
+                self._get_current_date(),
+                self._template_auto_id,
+            )
+
     def with_transaction(self, include: bool = True) -> "SQLBuilder":
         """
         Set whether to include transaction statements.
@@ -151,10 +335,10 @@ class SQLBuilder:
 
     def with_batch_size(self, size: int) -> "SQLBuilder":
         """
-        Set the batch size for batched execution.
+        Set how many rows build_batched groups into one INSERT.
 
         Args:
-            size: Number of statements per batch
+            size: Number of rows per multi-row INSERT
 
         Returns:
             Self for method chaining
@@ -162,6 +346,19 @@ class SQLBuilder:
         self._batch_size = size
         return self
 
+    def with_multi_row_inserts(self, enabled: bool = True) -> "SQLBuilder":
+        """
+        Set whether build_inserts groups rows into multi-row INSERTs.
+
+        Args:
+            enabled: Whether to emit one INSERT per batch of rows
+
+        Returns:
+            Self for method chaining
+        """
+        self._multi_row_inserts = enabled
+        return self
+
     def with_template(self, template: str) -> "SQLBuilder":
         """
         Set a custom SQL template.
@@ -173,6 +370,7 @@ class SQLBuilder:
             Self for method chaining
         """
         self._template = template
+        self._rebuild_skeleton()
         return self
 
     def build_insert(self, row: Dict[str, Any]) -> str:
@@ -187,28 +385,27 @@ class SQLBuilder:
         """
         if self._template:
             return self._build_from_template(row)
+        return self._build_insert_values(
+            [row.get(data_col) for data_col in self._column_mapping.values()]
+        )
 
-        columns = []
-        values = []
+    def _build_insert_values(self, row_values: Sequence[Any]) -> str:
+        """
+        Build a single INSERT statement from the mapped values of a row.
 
-        # Add auto-increment column if configured
-        if self._auto_increment_enabled:
-            auto_value = self._get_auto_increment_value()
-            if auto_value:
-                columns.append(self._auto_increment_column)
-                values.append(auto_value)
-                self._current_value += 1
+        Args:
+            row_values: One raw value per mapped column, in mapping order
 
-        # Add mapped columns
-        for sql_col, data_col in self._column_mapping.items():
-            columns.append(sql_col)
-            value = row.get(data_col)
-            values.append(self._format_value(value))
+        Returns:
+            SQL INSERT statement
+        """
+        # Add auto-increment value if configured
+        values = self._auto_increment_values(1) or []
 
-        columns_str = ", ".join(columns)
-        values_str = ", ".join(values)
+        # Add mapped values
+        values.extend(self._format_value(value) for value in row_values)
 
-        return f"INSERT INTO {self._table_name} ({columns_str}) VALUES ({values_str});"
+        return f"{self._insert_prefix}({', '.join(values)});"
 
     def build_all(self, data: pd.DataFrame) -> List[str]:
         """
@@ -220,21 +417,240 @@ class SQLBuilder:
         Returns:
             List of SQL INSERT statements
         """
-        statements = []
+        return list(self.iter_all(data))
 
+    def iter_all(self, data: pd.DataFrame) -> Iterator[str]:
+        """
+        Yield the statements of build_all one batch at a time.
+
+        Rows are formatted batch_size at a time, so only one batch of
+        statements is held in memory while the caller writes them out.
+
+        Args:
+            data: DataFrame containing the data
+
+        Yields:
+            SQL statements, wrapped in a transaction if configured
+        """
         # Add transaction start if configured
         if self._include_transaction:
-            statements.append(self._get_transaction_start())
+            yield self._get_transaction_start()
 
         # Build insert statements
-        for _, row in data.iterrows():
-            statements.append(self.build_insert(row.to_dict()))
+        batch_size = max(self._batch_size, 1)
+        for start in range(0, len(data), batch_size):
+            yield from self.build_inserts(data.iloc[start : start + batch_size])
 
         # Add transaction end if configured
         if self._include_transaction:
-            statements.append(self._get_transaction_end())
+            yield self._get_transaction_end()
 
-        return statements
+    def iter_inserts(self, data: pd.DataFrame) -> Iterator[str]:
+        """
+        Yield an INSERT statement for each row in a DataFrame.
+
+        Auto-increment values carry over between calls, so a sheet can be
+        fed through in consecutive chunks.
+
+        Args:
+            data: DataFrame containing the data
+
+        Yields:
+            SQL INSERT statements
+        """
+        if self._template:
+            n_rows = len(data)
+            value_columns = self._format_columns(data)
+            pattern = self._template_format
+            if self._template_auto_id:
+                value_columns.append(self._template_auto_ids(n_rows))
+            for values in self._rows(value_columns, n_rows):
+                yield pattern.format(*values)
+            return
+
+        prefix = self._insert_prefix
+        for values in self._insert_rows(data):
+            yield f"{prefix}({', '.join(values)});"
+
+    def build_batched(
+        self, data: pd.DataFrame, batch_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Build multi-row INSERT statements covering batch_size rows each.
+
+        Rows are formatted exactly as iter_inserts formats them. A custom
+        template describes a whole statement, so templated rows are still
+        built one statement per row.
+
+        Args:
+            data: DataFrame containing the data
+            batch_size: Rows per statement, defaulting to the builder's
+
+        Returns:
+            List of SQL INSERT statements
+        """
+        if self._template:
+            return list(self.iter_inserts(data))
+
+        batch_size = max(batch_size or self._batch_size, 1)
+        tuples = [f"({', '.join(values)})" for values in self._insert_rows(data)]
+        return [
+            self._insert_prefix + ",\n".join(tuples[start : start + batch_size]) + ";"
+            for start in range(0, len(tuples), batch_size)
+        ]
+
+    def build_inserts(self, data: pd.DataFrame) -> List[str]:
+        """
+        Build the INSERT statements for a DataFrame.
+
+        Args:
+            data: DataFrame containing the data
+
+        Returns:
+            Multi-row INSERTs when enabled, otherwise one INSERT per row
+        """
+        if self._multi_row_inserts:
+            return self.build_batched(data)
+        return list(self.iter_inserts(data))
+
+    def _insert_rows(self, data: pd.DataFrame) -> Iterator[Tuple[str, ...]]:
+        """
+        Format a DataFrame into the row values of its INSERT statements.
+
+        Args:
+            data: DataFrame containing the data
+
+        Returns:
+            Rows of SQL literals, in the column order of the INSERT prefix
+        """
+        n_rows = len(data)
+        value_columns = self._format_columns(data)
+        auto_values = self._auto_increment_values(n_rows)
+        if auto_values is not None:
+            value_columns.insert(0, auto_values)
+        return self._rows(value_columns, n_rows)
+
+    def _format_columns(self, data: pd.DataFrame) -> List[List[str]]:
+        """
+        Format each mapped column of a DataFrame as SQL literals.
+
+        Each column is formatted as a whole, dispatching on its dtype once,
+        instead of formatting the rows value by value. Mapped columns the
+        data lacks are NULL.
+
+        Args:
+            data: DataFrame containing the data
+
+        Returns:
+            One list of SQL literals per mapped column, in mapping order
+        """
+        n_rows = len(data)
+        return [
+            (
+                self._format_column(data[data_col])
+                if data_col in data.columns
+                else ["NULL"] * n_rows
+            )
+            for data_col in self._column_mapping.values()
+        ]
+
+    @staticmethod
+    def _rows(value_columns: List[List[str]], n_rows: int) -> Iterator[Tuple[str, ...]]:
+        """Zip formatted columns into rows, keeping the row count with no columns."""
+        return zip(*value_columns) if value_columns else repeat((), n_rows)
+
+    def _format_column(self, values: pd.Series) -> List[str]:
+        """
+        Format a column of values as SQL literals, as _format_value would.
+
+        Strings, booleans, integers, floats (plain or nullable) and datetimes
+        are formatted column-wise; any other column falls back to
+        _format_value per value.
+
+        Args:
+            values: Column of raw values
+
+        Returns:
+            One SQL literal per value
+        """
+        dtype = values.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind != "O":
+            if dtype.kind == "b":
+                style = self._literal_style
+                return np.where(values.to_numpy(), style.true, style.false).tolist()
+            if dtype.kind in "iu":
+                # Arrow's C++ cast spells integers exactly like str() does
+                return pa.array(values.to_numpy()).cast(pa.string()).to_pylist()
+            if dtype.kind == "f":
+                return ["NULL" if v != v else str(v) for v in values.tolist()]
+            if dtype.kind == "M":
+                formatted = "'" + values.dt.strftime(_TIMESTAMP_FORMAT) + "'"
+                formatted += self._literal_style.timestamp_suffix
+                return formatted.where(values.notna(), "NULL").tolist()
+
+        elif dtype.kind in "biuf" and hasattr(dtype, "numpy_dtype"):
+            # Nullable extension columns: format the filled numpy values in
+            # one pass, then overwrite the positions of the null mask
+            nulls = values.isna().to_numpy()
+            filled = values.to_numpy(
+                dtype=dtype.numpy_dtype, na_value=dtype.numpy_dtype.type(0)
+            )
+            formatted = self._format_column(pd.Series(filled, copy=False))
+            for position in np.flatnonzero(nulls).tolist():
+                formatted[position] = "NULL"
+            return formatted
+
+        elif pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+            nulls = values.isna().to_numpy()
+            if not nulls.any():
+                return self._quote_strings(values)
+            if all(_is_null(value) for value in values[nulls]):
+                quoted = self._quote_strings(values.where(~nulls, ""))
+                return np.where(nulls, "NULL", quoted).tolist()
+
+        return [self._format_value(value) for value in values.tolist()]
+
+    def _quote_strings(self, values: pd.Series) -> List[str]:
+        """Quote a column of strings as SQL literals, as _format_value does."""
+        # Plain str.replace over a list skips the per-element overhead of
+        # the pandas .str accessor; it also beats str.translate here
+        strings = values.tolist()
+        for old, new in self._literal_style.escapes:
+            strings = [value.replace(old, new) for value in strings]
+        return [f"'{value}'" for value in strings]
+
+    def _auto_increment_values(self, n_rows: int) -> Optional[List[str]]:
+        """
+        Produce the auto-increment column values for the next n_rows rows.
+
+        Args:
+            n_rows: Number of rows being built
+
+        Returns:
+            One value expression per row, or None when the column is omitted
+        """
+        if not self._auto_increment_enabled or not (
+            self._auto_counted or self._auto_expression is not None
+        ):
+            return None
+        return self._take_auto_values(n_rows, self._auto_counted)
+
+    def _take_auto_values(self, n_rows: int, counted: bool) -> List[str]:
+        """
+        Advance the auto-increment counter by n_rows and return their values.
+
+        Args:
+            n_rows: Number of rows being built
+            counted: Whether rows get running numbers instead of the expression
+
+        Returns:
+            One value expression per row
+        """
+        start = self._current_value
+        self._current_value += n_rows
+        if counted:
+            return [str(value) for value in range(start, start + n_rows)]
+        return [self._auto_expression] * n_rows
 
     def build_with_header(self, data: pd.DataFrame) -> List[str]:
         """
@@ -246,17 +662,36 @@ class SQLBuilder:
         Returns:
             List of SQL statements with header
         """
-        statements = [
+        statements = self.build_header(len(data))
+        statements.extend(self.build_all(data))
+        return statements
+
+    def build_header(self, total_rows: int) -> List[str]:
+        """
+        Build the header comment lines of a SQL script.
+
+        Args:
+            total_rows: Number of data rows the script covers
+
+        Returns:
+            List of header lines, ending with a blank line
+        """
+        return [
             "-- Generated SQL statements",
             f"-- Database: {self._database_type.value}",
             f"-- Table: {self._table_name}",
             f"-- Generated at: {datetime.now().isoformat()}",
-            f"-- Total rows: {len(data)}",
+            f"-- Total rows: {total_rows}",
             "",
         ]
 
-        statements.extend(self.build_all(data))
-        return statements
+    def build_transaction_start(self) -> Optional[str]:
+        """Return the transaction start statement, or None if disabled."""
+        return self._get_transaction_start() if self._include_transaction else None
+
+    def build_transaction_end(self) -> Optional[str]:
+        """Return the transaction end statement, or None if disabled."""
+        return self._get_transaction_end() if self._include_transaction else None
 
     def _build_from_template(self, row: Dict[str, Any]) -> str:
         """
@@ -268,43 +703,28 @@ class SQLBuilder:
         Returns:
             SQL statement built from template
         """
-        sql = self._template
-
-        # Replace auto_id placeholder
-        if "{auto_id}" in sql and self._auto_increment_enabled:
-            auto_value = self._get_auto_increment_value()
-            sql = sql.replace("{auto_id}", auto_value or str(self._current_value))
-            self._current_value += 1
-
-        # Replace column placeholders
-        for sql_col, data_col in self._column_mapping.items():
-            value = row.get(data_col)
-            formatted_value = self._format_value(value)
-            sql = sql.replace(f"{{{sql_col}}}", formatted_value)
+        values = [
+            self._format_value(row.get(data_col))
+            for data_col in self._column_mapping.values()
+        ]
+        if self._template_auto_id:
+            values.extend(self._template_auto_ids(1))
+        return self._template_format.format(*values)
 
-        # Replace special placeholders
-        sql = sql.replace("{current_timestamp}", self._get_current_timestamp())
-        sql = sql.replace("{current_date}", self._get_current_date())
+    def _template_auto_ids(self, n_rows: int) -> List[str]:
+        """
+        Produce the {auto_id} values for the next n_rows template rows.
 
-        return sql
+        Args:
+            n_rows: Number of rows being built
 
-    def _get_auto_increment_value(self) -> Optional[str]:
-        """Get the auto-increment value expression."""
-        if self._auto_increment_type == SQLAutoIncrementType.NONE:
-            return None
-        elif self._auto_increment_type == SQLAutoIncrementType.MANUAL_SEQUENCE:
-            if self._database_type == DatabaseType.POSTGRESQL:
-                return f"nextval('{self._sequence_name}')"
-            else:
-                return str(self._current_value)
-        elif self._auto_increment_type == SQLAutoIncrementType.UUID_GENERATE:
-            if self._database_type == DatabaseType.POSTGRESQL:
-                return "uuid_generate_v4()"
-            else:
-                return "UUID()"
-        else:
-            # For SERIAL/AUTO_INCREMENT, value is auto-generated by DB
-            return None
+        Returns:
+            One value expression per row
+        """
+        # Database-generated keys still get a running number in templates
+        return self._take_auto_values(
+            n_rows, self._auto_counted or self._auto_expression is None
+        )
 
     def _format_value(self, value: Any) -> str:
         """
@@ -316,44 +736,36 @@ class SQLBuilder:
         Returns:
             Formatted SQL value string
         """
-        if value is None or (isinstance(value, float) and pd.isna(value)):
+        if _is_null(value):
             return "NULL"
 
+        style = self._literal_style
+
         if isinstance(value, str):
-            # Escape quotes based on database type
-            if self._database_type == DatabaseType.MYSQL:
-                escaped = value.replace("'", "\\'").replace('"', '\\"')
-            else:
-                escaped = value.replace("'", "''")
-            return f"'{escaped}'"
+            # Escape quotes the way the target database expects
+            for old, new in style.escapes:
+                value = value.replace(old, new)
+            return f"'{value}'"
 
-        elif isinstance(value, bool):
-            if self._database_type == DatabaseType.POSTGRESQL:
-                return "TRUE" if value else "FALSE"
-            else:
-                return "1" if value else "0"
+        elif isinstance(value, (bool, np.bool_)):
+            return style.true if value else style.false
 
         elif isinstance(value, (int, float)):
             return str(value)
 
+        elif isinstance(value, (np.integer, np.floating)):
+            return str(value.item())
+
         elif isinstance(value, (datetime, date)):
-            formatted = value.strftime("%Y-%m-%d %H:%M:%S")
-            if self._database_type == DatabaseType.POSTGRESQL:
-                return f"'{formatted}'::timestamp"
-            else:
-                return f"'{formatted}'"
+            formatted = value.strftime(_TIMESTAMP_FORMAT)
+            return f"'{formatted}'{style.timestamp_suffix}"
 
         else:
             return f"'{str(value)}'"
 
     def _get_transaction_start(self) -> str:
         """Get transaction start statement."""
-        if self._database_type == DatabaseType.POSTGRESQL:
-            return "BEGIN;"
-        elif self._database_type == DatabaseType.MYSQL:
-            return "START TRANSACTION;"
-        else:
-            return "BEGIN TRANSACTION;"
+        return self._literal_style.transaction_start
 
     def _get_transaction_end(self) -> str:
         """Get transaction end statement."""
@@ -361,16 +773,8 @@ class SQLBuilder:
 
     def _get_current_timestamp(self) -> str:
         """Get current timestamp function for database type."""
-        if self._database_type == DatabaseType.SQLITE:
-            return "datetime('now')"
-        else:
-            return "NOW()"
+        return self._literal_style.current_timestamp
 
     def _get_current_date(self) -> str:
         """Get current date function for database type."""
-        if self._database_type == DatabaseType.POSTGRESQL:
-            return "CURRENT_DATE"
-        elif self._database_type == DatabaseType.MYSQL:
-            return "CURDATE()"
-        else:
-            return "date('now')"
+        return self._literal_style.current_date
@@ -1,18 +1,116 @@
 """
 Background Workflow Executor
 
-This module provides background task execution for workflows using ThreadPoolExecutor.
-It allows workflows to run asynchronously without blocking the API response.
+This module provides background task execution for workflows using a thread pool,
+or a process pool for CPU-bound workflows. It allows workflows to run asynchronously
+without blocking the API response.
 """
 
 import logging
 import threading
-from typing import Dict, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, Future
+import time
+from collections import deque
+from typing import Deque, Dict, Any, List, Literal, Optional, Callable, Tuple
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime
+from functools import partial
 
 logger = logging.getLogger(__name__)
 
+# Jobs are spread over this many independently locked dicts
+_SHARD_COUNT = 16
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Format epoch seconds as a local ISO timestamp, passing None through."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+class Job:
+    """
+    Tracking record for one background workflow job.
+
+    Slots keep each record small and make status updates plain attribute
+    stores, which matters when many jobs are tracked at once. Timestamps
+    are epoch seconds from time.time(). The public status dictionary is
+    rebuilt by update() whenever the job changes, so polling it never
+    copies or formats anything.
+    """
+
+    __slots__ = (
+        "job_id",
+        "status",
+        "submitted_at",
+        "started_at",
+        "completed_at",
+        "result",
+        "error",
+        "future",
+        "_status",
+    )
+
+    def __init__(self, job_id: str, submitted_at: float):
+        """
+        Initialize a pending job.
+
+        Args:
+            job_id: Unique job identifier
+            submitted_at: Submission time in epoch seconds
+        """
+        self.job_id = job_id
+        self.status = "pending"
+        self.submitted_at = submitted_at
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.future: Optional[Future] = None
+        self._status = self._build_status()
+
+    def update(self, status: str, **fields: Any) -> None:
+        """
+        Set job fields, then the status, and rebuild the status dictionary.
+
+        Args:
+            status: New job status
+            **fields: Other job attributes to set first
+        """
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.status = status
+        self._status = self._build_status()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the job's status dictionary, without the future.
+
+        The same dictionary is returned until the job next changes; treat
+        it as read-only.
+
+        Returns:
+            Dictionary representation of the job
+        """
+        return self._status
+
+    def _build_status(self) -> Dict[str, Any]:
+        """Build the status dictionary from the current fields."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "submitted_at": _isoformat(self.submitted_at),
+            "started_at": _isoformat(self.started_at),
+            "completed_at": _isoformat(self.completed_at),
+            "result": self.result,
+            "error": self.error,
+        }
+
 
 class BackgroundWorkflowExecutor:
     """
@@ -23,35 +121,93 @@ class BackgroundWorkflowExecutor:
     - Job status tracking
     - Thread-safe operation
     - Callback support for completion
+
+    Jobs are kept in lock-sharded dicts so submissions and updates for
+    different jobs rarely contend. Status reads take no lock: a single
+    dict lookup is atomic in CPython, and writers swap in a job's whole
+    status dictionary at once.
     """
 
-    def __init__(self, max_workers: int = 5):
+    def __init__(
+        self,
+        max_workers: int = 5,
+        executor_kind: Literal["thread", "process"] = "thread",
+        max_queue_size: Optional[int] = None,
+        block_when_full: bool = False,
+    ):
         """
         Initialize background executor.
 
+        Threads suit the usual I/O-bound workflows. A process pool lets
+        CPU-bound workflows run on several cores; workflow functions, their
+        arguments and results must then be picklable, on_complete runs in
+        this process when the job's future finishes, and jobs go straight
+        from pending to their final status.
+
+        The pools queue submissions without limit, so max_queue_size caps
+        how many jobs may be pending or running at once; further
+        submissions either wait for a slot or are refused.
+
         Args:
             max_workers: Maximum number of concurrent workflow executions
+            executor_kind: "thread" for a thread pool, "process" for a
+                process pool
+            max_queue_size: Maximum unfinished jobs, or None for no limit
+            block_when_full: Wait for a free slot instead of raising when
+                max_queue_size jobs are unfinished
         """
+        if executor_kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {executor_kind}")
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(
-            max_workers=max_workers,
-            thread_name_prefix="WorkflowExecutor"
+        self.executor_kind = executor_kind
+        self.executor: Executor
+        if executor_kind == "process":
+            self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="WorkflowExecutor"
+            )
+        self._shards: List[Tuple[threading.Lock, Dict[str, Job]]] = [
+            (threading.Lock(), {}) for _ in range(_SHARD_COUNT)
+        ]
+        # (completed_at, job_id) in completion order, so cleanup only
+        # visits jobs that are old enough to remove
+        self._completed: Deque[Tuple[float, str]] = deque()
+        self._completed_lock = threading.Lock()
+        self.block_when_full = block_when_full
+        self._slots: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_queue_size)
+            if max_queue_size is not None
+            else None
         )
-        self.active_jobs: Dict[str, Dict[str, Any]] = {}
-        self.lock = threading.Lock()
         logger.info(
-            f"BackgroundWorkflowExecutor initialized with {max_workers} workers"
+            f"BackgroundWorkflowExecutor initialized with {max_workers} "
+            f"{executor_kind} workers"
         )
 
+    @property
+    def active_jobs(self) -> Dict[str, Job]:
+        """Snapshot of all tracked jobs, keyed by job ID."""
+        jobs: Dict[str, Job] = {}
+        for lock, shard in self._shards:
+            with lock:
+                jobs.update(shard)
+        return jobs
+
+    def _shard(self, job_id: str) -> Tuple[threading.Lock, Dict[str, Job]]:
+        """Get the lock and job dict responsible for a job ID."""
+        return self._shards[hash(job_id) % _SHARD_COUNT]
+
     def submit_workflow(
         self,
         job_id: str,
-        workflow_func: Callable,
-        *args,
+        workflow_func: Callable[..., Any],
+        *args: Any,
         on_complete: Optional[
             Callable[[bool, Any, Optional[str]], None]
         ] = None,
-        **kwargs
+        **kwargs: Any
     ) -> str:
         """
         Submit a workflow for background execution.
@@ -65,99 +221,160 @@ class BackgroundWorkflowExecutor:
 
         Returns:
             Job ID for tracking
+
+        Raises:
+            RuntimeError: If max_queue_size jobs are unfinished and
+                block_when_full is off
         """
         logger.info(
             f"Submitting workflow job {job_id} for background execution"
         )
 
+        # Reserve a queue slot; the job's done callback frees it
+        if self._slots is not None and not self._slots.acquire(
+            blocking=self.block_when_full
+        ):
+            raise RuntimeError(
+                f"Workflow queue full, cannot submit job {job_id}"
+            )
+
         # Register job
-        with self.lock:
-            self.active_jobs[job_id] = {
-                "job_id": job_id,
-                "status": "pending",
-                "submitted_at": datetime.now().isoformat(),
-                "started_at": None,
-                "completed_at": None,
-                "result": None,
-                "error": None,
-            }
-
-        # Define wrapper to track execution
-        def _execute_with_tracking():
-            """Wrapper function to track job execution."""
-            try:
-                # Mark as running
-                with self.lock:
-                    if job_id in self.active_jobs:
-                        self.active_jobs[job_id]["status"] = "running"
-                        self.active_jobs[job_id]["started_at"] = (
-                            datetime.now().isoformat()
-                        )
-
-                logger.info(f"Starting execution of job {job_id}")
-
-                # Execute the workflow
-                result = workflow_func(*args, **kwargs)
-
-                # Mark as completed
-                with self.lock:
-                    if job_id in self.active_jobs:
-                        self.active_jobs[job_id]["status"] = "completed"
-                        self.active_jobs[job_id]["completed_at"] = (
-                            datetime.now().isoformat()
-                        )
-                        self.active_jobs[job_id]["result"] = result
-
-                logger.info(f"Job {job_id} completed successfully")
-
-                # Call completion callback if provided
-                if on_complete:
-                    try:
-                        on_complete(True, result, None)
-                    except Exception as e:
-                        logger.error(
-                            f"Error in completion callback for "
-                            f"job {job_id}: {e}"
-                        )
-
-                return result
+        lock, jobs = self._shard(job_id)
+        with lock:
+            jobs[job_id] = Job(job_id, time.time())
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Job {job_id} failed: {error_msg}")
-
-                # Mark as failed
-                with self.lock:
-                    if job_id in self.active_jobs:
-                        self.active_jobs[job_id]["status"] = "failed"
-                        self.active_jobs[job_id]["completed_at"] = (
-                            datetime.now().isoformat()
-                        )
-                        self.active_jobs[job_id]["error"] = error_msg
-
-                # Call completion callback if provided
-                if on_complete:
-                    try:
-                        on_complete(False, None, error_msg)
-                    except Exception as cb_error:
-                        logger.error(
-                            f"Error in completion callback for "
-                            f"job {job_id}: {cb_error}"
-                        )
-
-                raise
-
-        # Submit to executor
-        future: Future = self.executor.submit(_execute_with_tracking)
+        try:
+            if self.executor_kind == "process":
+                # Only picklable callables cross to a worker process, so the
+                # workflow runs as is and the job never reports "running"
+                future: Future = self.executor.submit(
+                    workflow_func, *args, **kwargs
+                )
+            else:
+                future = self.executor.submit(
+                    self._run_job, job_id, workflow_func, args, kwargs
+                )
+        except Exception:
+            with lock:
+                jobs.pop(job_id, None)
+            if self._slots is not None:
+                self._slots.release()
+            raise
+
+        # The future finishes the job once it is done, in either mode
+        future.add_done_callback(
+            partial(self._finish_from_future, job_id, on_complete=on_complete)
+        )
 
         # Store future reference
-        with self.lock:
-            if job_id in self.active_jobs:
-                self.active_jobs[job_id]["future"] = future
+        with lock:
+            job = jobs.get(job_id)
+            if job is not None:
+                job.future = future
 
-        logger.info(f"Workflow job {job_id} submitted to thread pool")
+        logger.info(
+            f"Workflow job {job_id} submitted to {self.executor_kind} pool"
+        )
         return job_id
 
+    def _run_job(
+        self,
+        job_id: str,
+        workflow_func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Mark a job running and execute its workflow in a worker thread.
+
+        Args:
+            job_id: Job identifier
+            workflow_func: Function to execute
+            args: Positional arguments for workflow_func
+            kwargs: Keyword arguments for workflow_func
+
+        Returns:
+            The workflow's return value
+        """
+        lock, jobs = self._shard(job_id)
+        with lock:
+            job = jobs.get(job_id)
+            if job is not None:
+                job.update("running", started_at=time.time())
+
+        logger.info(f"Starting execution of job {job_id}")
+        return workflow_func(*args, **kwargs)
+
+    def _finish_from_future(
+        self,
+        job_id: str,
+        future: Future,
+        on_complete: Optional[Callable[[bool, Any, Optional[str]], None]] = None,
+    ) -> None:
+        """
+        Record the outcome of a job's finished future.
+
+        Args:
+            job_id: Job identifier
+            future: Finished future of the job
+            on_complete: Optional callback (success, result, error)
+        """
+        if self._slots is not None:
+            self._slots.release()
+        if future.cancelled():
+            # cancel_job has already recorded the cancellation
+            return
+        error = future.exception()
+        if error is not None:
+            self._finish_job(job_id, None, str(error), on_complete)
+        else:
+            self._finish_job(job_id, future.result(), None, on_complete)
+
+    def _finish_job(
+        self,
+        job_id: str,
+        result: Any,
+        error: Optional[str],
+        on_complete: Optional[Callable[[bool, Any, Optional[str]], None]],
+    ) -> None:
+        """
+        Mark a job completed or failed and run its completion callback.
+
+        Args:
+            job_id: Job identifier
+            result: Workflow result, when it succeeded
+            error: Error message, when it failed
+            on_complete: Optional callback (success, result, error)
+        """
+        success = error is None
+        if success:
+            logger.info(f"Job {job_id} completed successfully")
+        else:
+            logger.error(f"Job {job_id} failed: {error}")
+
+        lock, jobs = self._shard(job_id)
+        with lock:
+            job = jobs.get(job_id)
+            if job is not None:
+                if success:
+                    job.update(
+                        "completed", completed_at=time.time(), result=result
+                    )
+                else:
+                    job.update(
+                        "failed", completed_at=time.time(), error=error
+                    )
+                self._completed.append((job.completed_at, job_id))
+
+        # Call completion callback if provided
+        if on_complete:
+            try:
+                on_complete(success, result, error)
+            except Exception as e:
+                logger.error(
+                    f"Error in completion callback for job {job_id}: {e}"
+                )
+
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the status of a background job.
@@ -168,14 +385,8 @@ class BackgroundWorkflowExecutor:
         Returns:
             Job status information or None if not found
         """
-        with self.lock:
-            if job_id not in self.active_jobs:
-                return None
-
-            # Create a copy without the future object
-            job_info = self.active_jobs[job_id].copy()
-            job_info.pop("future", None)
-            return job_info
+        job = self._shard(job_id)[1].get(job_id)
+        return job.to_dict() if job is not None else None
 
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -187,46 +398,48 @@ class BackgroundWorkflowExecutor:
         Returns:
             True if job was cancelled, False otherwise
         """
-        with self.lock:
-            if job_id not in self.active_jobs:
+        lock, jobs = self._shard(job_id)
+        with lock:
+            job = jobs.get(job_id)
+            if job is None:
                 return False
 
-            future = self.active_jobs[job_id].get("future")
-            if future and future.cancel():
-                self.active_jobs[job_id]["status"] = "cancelled"
-                self.active_jobs[job_id]["completed_at"] = (
-                    datetime.now().isoformat()
-                )
+            if job.future and job.future.cancel():
+                job.update("cancelled", completed_at=time.time())
+                self._completed.append((job.completed_at, job_id))
                 logger.info(f"Job {job_id} cancelled")
                 return True
 
             return False
 
-    def cleanup_completed_jobs(self, max_age_seconds: int = 3600):
+    def cleanup_completed_jobs(self, max_age_seconds: int = 3600) -> None:
         """
         Clean up old completed/failed jobs.
 
+        Finished jobs are queued in completion order, so a pass only
+        visits the jobs it removes.
+
         Args:
             max_age_seconds: Maximum age in seconds for completed jobs
         """
-        now = datetime.now()
-        with self.lock:
-            jobs_to_remove = []
-            for job_id, job_info in self.active_jobs.items():
-                if job_info["status"] in ["completed", "failed", "cancelled"]:
-                    completed_at_str = job_info.get("completed_at")
-                    if completed_at_str:
-                        completed_at = datetime.fromisoformat(completed_at_str)
-                        age = (now - completed_at).total_seconds()
-                        if age > max_age_seconds:
-                            jobs_to_remove.append(job_id)
-
-            for job_id in jobs_to_remove:
-                del self.active_jobs[job_id]
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        with self._completed_lock:
+            completed = self._completed
+            while completed and completed[0][0] < cutoff:
+                completed_at, job_id = completed.popleft()
+                lock, jobs = self._shard(job_id)
+                with lock:
+                    job = jobs.get(job_id)
+                    # Skip IDs that were resubmitted since this entry
+                    if job is None or job.completed_at != completed_at:
+                        continue
+                    del jobs[job_id]
                 logger.info(f"Cleaned up old job {job_id}")
+                removed += 1
 
-            if jobs_to_remove:
-                logger.info(f"Cleaned up {len(jobs_to_remove)} old jobs")
+        if removed:
+            logger.info(f"Cleaned up {removed} old jobs")
 
     def get_active_job_count(self) -> int:
         """
@@ -235,13 +448,12 @@ class BackgroundWorkflowExecutor:
         Returns:
             Number of active jobs
         """
-        with self.lock:
-            return sum(
-                1 for job in self.active_jobs.values()
-                if job["status"] in ["pending", "running"]
-            )
+        return sum(
+            1 for job in self.active_jobs.values()
+            if job.status in ["pending", "running"]
+        )
 
-    def shutdown(self, wait: bool = True):
+    def shutdown(self, wait: bool = True) -> None:
         """
         Shutdown the executor.
 
@@ -251,7 +463,7 @@ class BackgroundWorkflowExecutor:
         logger.info("Shutting down BackgroundWorkflowExecutor")
         self.executor.shutdown(wait=wait)
 
-    def __del__(self):
+    def __del__(self) -> None:
         """Cleanup on deletion."""
         try:
             self.shutdown(wait=False)
@@ -263,17 +475,23 @@ class BackgroundWorkflowExecutor:
 _global_executor: Optional[BackgroundWorkflowExecutor] = None
 
 
-def get_background_executor(max_workers: int = 5) -> BackgroundWorkflowExecutor:
+def get_background_executor(
+    max_workers: int = 5,
+    executor_kind: Literal["thread", "process"] = "thread",
+) -> BackgroundWorkflowExecutor:
     """
     Get the global background executor instance.
 
     Args:
         max_workers: Maximum number of workers (only used on first call)
+        executor_kind: "thread" or "process" pool (only used on first call)
 
     Returns:
         Background executor instance
     """
     global _global_executor
     if _global_executor is None:
-        _global_executor = BackgroundWorkflowExecutor(max_workers=max_workers)
+        _global_executor = BackgroundWorkflowExecutor(
+            max_workers=max_workers, executor_kind=executor_kind
+        )
     return _global_executor
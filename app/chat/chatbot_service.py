@@ -7,6 +7,9 @@ intent classification, state management, message handling, and workflow executio
 
 import uuid
 import logging
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
@@ -24,6 +27,25 @@ from app.chat.models import Message, MessageType, WorkflowStep, ConversationStat
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for overlapping workflow persistence with output file copies
+_persist_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="workflow-persist")
+
+
+def _step_row(step: WorkflowStep) -> tuple:
+    """Build the ChatDatabase.save_workflow_steps row for a workflow step."""
+    return (
+        step.step_id,
+        step.operation,
+        step.arguments,
+        step.status.value,
+        step.input_file,
+        step.output_file,
+        step.progress,
+        step.error_message,
+        step.started_at.isoformat() if step.started_at else None,
+        step.completed_at.isoformat() if step.completed_at else None,
+    )
+
 
 class ChatBotService:
     """
@@ -67,6 +89,15 @@ class ChatBotService:
         # Setup message handler chain
         self._setup_message_handlers()
 
+        # WebSocket bridge for workflow notifications (None when unavailable)
+        try:
+            from app.chat.websocket_bridge import websocket_bridge
+
+            self._ws = websocket_bridge
+        except Exception as e:
+            logger.warning(f"WebSocket not available: {e}")
+            self._ws = None
+
         logger.info("ChatBotService initialized")
 
     def _setup_message_handlers(self):
@@ -369,35 +400,22 @@ class ChatBotService:
             return {"success": False, "error": "No uploaded file found"}
 
         # Create workflow steps
-        steps = []
-        for step_data in workflow_steps:
-            step = WorkflowStep(
+        steps = [
+            WorkflowStep(
                 step_id=str(uuid.uuid4()),
                 operation=step_data.get("operation"),
                 arguments=step_data.get("arguments", {}),
             )
-            steps.append(step)
-            # Save workflow step to database
-            self.repository.database.save_workflow_step(
-                chat_id,
-                step.step_id,
-                step.operation,
-                step.arguments,
-                step.status.value,
-                step.input_file,
-                step.output_file,
-                step.progress,
-                step.error_message,
-                step.started_at.isoformat() if step.started_at else None,
-                step.completed_at.isoformat() if step.completed_at else None,
-            )
+            for step_data in workflow_steps
+        ]
+        # Save workflow steps to database in one transaction
+        self.repository.database.save_workflow_steps(chat_id, [_step_row(step) for step in steps])
 
-        # Import WebSocket bridge for progress updates
-        try:
-            from app.chat.websocket_bridge import websocket_bridge
+        ws = self._ws
 
-            # Send workflow started notification
-            websocket_bridge.send_message(
+        # Send workflow started notification
+        if ws:
+            ws.send_message(
                 chat_id,
                 {
                     "type": "workflow_started",
@@ -406,66 +424,54 @@ class ChatBotService:
                     "message": "🚀 Starting workflow execution...",
                 },
             )
-        except Exception as e:
-            logger.warning(f"WebSocket not available: {e}")
 
         # Create progress callback
         def progress_callback(step, progress, message):
             """Send progress updates to WebSocket clients."""
-            try:
-                from app.chat.websocket_bridge import websocket_bridge
-
-                ws_message = {
-                    "type": "progress",
-                    "chat_id": chat_id,
-                    "step_id": step.step_id,
-                    "operation": step.operation,
-                    "progress": progress,
-                    "status": (
-                        step.status.value if hasattr(step.status, "value") else str(step.status)
-                    ),
-                    "message": message,
-                }
-                websocket_bridge.send_message(chat_id, ws_message)
-            except Exception as e:
-                logger.warning(f"Failed to send WebSocket progress update: {e}")
+            if ws:
+                ws.send_message(
+                    chat_id,
+                    {
+                        "type": "progress",
+                        "chat_id": chat_id,
+                        "step_id": step.step_id,
+                        "operation": step.operation,
+                        "progress": progress,
+                        "status": (
+                            step.status.value if hasattr(step.status, "value") else str(step.status)
+                        ),
+                        "message": message,
+                    },
+                )
 
         # Execute workflow
         try:
             results = self.executor.execute_workflow(steps, latest_file, progress_callback)
 
-            # Save updated workflow steps to database (they were updated during execution)
-            for step in steps:
-                self.repository.database.save_workflow_step(
-                    chat_id,
-                    step.step_id,
-                    step.operation,
-                    step.arguments,
-                    step.status.value,
-                    step.input_file,
-                    step.output_file,
-                    step.progress,
-                    step.error_message,
-                    step.started_at.isoformat() if step.started_at else None,
-                    step.completed_at.isoformat() if step.completed_at else None,
-                )
+            # Save updated workflow steps (they were updated during execution)
+            # while the output files are copied
+            steps_saved = _persist_pool.submit(
+                self.repository.database.save_workflow_steps,
+                chat_id,
+                [_step_row(step) for step in steps],
+            )
 
             # Save output files
-            from app.chat.storage import ConversationStorage
-
             storage = self.repository.storage
-
-            output_files = []
-            for i, result in enumerate(results):
-                if result.get("output_file_path"):
-                    saved_path = storage.save_output_file(
-                        chat_id,
-                        conversation.partition_key,
-                        result["output_file_path"],
-                        is_final=(i == len(results) - 1),
-                    )
-                    self.repository.database.save_file(chat_id, saved_path, "output")
-                    output_files.append(saved_path)
+            copies = [
+                _persist_pool.submit(
+                    storage.save_output_file,
+                    chat_id,
+                    conversation.partition_key,
+                    result["output_file_path"],
+                    is_final=(i == len(results) - 1),
+                )
+                for i, result in enumerate(results)
+                if result.get("output_file_path")
+            ]
+            output_files = [copy.result() for copy in copies]
+            self.repository.database.save_files(chat_id, output_files, "output")
+            steps_saved.result()
 
             # Update conversation
             conversation.status = ConversationStatus.COMPLETED
@@ -476,10 +482,8 @@ class ChatBotService:
             self.state_manager.clear_pending_workflow(chat_id)
 
             # Send completion notification
-            try:
-                from app.chat.websocket_bridge import websocket_bridge
-
-                websocket_bridge.send_message(
+            if ws:
+                ws.send_message(
                     chat_id,
                     {
                         "type": "workflow_completed",
@@ -489,8 +493,6 @@ class ChatBotService:
                         "message": "✅ Workflow completed successfully!",
                     },
                 )
-            except Exception as e:
-                logger.warning(f"WebSocket notification failed: {e}")
 
             # Add completion message
             self.repository.add_message(
@@ -519,10 +521,8 @@ class ChatBotService:
             self.state_manager.transition_state(chat_id, BotState.FAILED)
 
             # Send error notification
-            try:
-                from app.chat.websocket_bridge import websocket_bridge
-
-                websocket_bridge.send_message(
+            if ws:
+                ws.send_message(
                     chat_id,
                     {
                         "type": "workflow_failed",
@@ -531,8 +531,6 @@ class ChatBotService:
                         "message": f"❌ Workflow failed: {str(e)}",
                     },
                 )
-            except Exception as ws_err:
-                logger.warning(f"WebSocket notification failed: {ws_err}")
 
             # Add error message
             self.repository.add_message(
@@ -602,9 +600,8 @@ Type **help** for more information or just tell me what you'd like to do!"""
             return {"success": False, "error": "No uploaded file found"}
 
         # Generate job ID with timestamp to prevent collisions
-        import time
         timestamp = int(time.time() * 1000)  # milliseconds
-        job_id = f"{chat_id}_workflow_{timestamp}_{uuid.uuid4().hex[:8]}"
+        job_id = f"{chat_id}_workflow_{timestamp}_{secrets.token_hex(4)}"
 
         # Get background executor
         executor = get_background_executor()
@@ -10,7 +10,7 @@ import json
 import shutil
 import os
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from pathlib import Path
 
 
@@ -77,6 +77,25 @@ class ChatDatabase:
     )
     """
 
+    # Upsert shared by single and bulk workflow step saves
+    UPSERT_WORKFLOW_STEP = """
+    INSERT INTO workflow_steps
+    (step_id, chat_id, operation, arguments, status, input_file,
+     output_file, progress, error_message, started_at, completed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(step_id) DO UPDATE SET
+        status = excluded.status,
+        progress = excluded.progress,
+        output_file = excluded.output_file,
+        error_message = excluded.error_message,
+        completed_at = excluded.completed_at
+    """
+
+    INSERT_FILE = """
+    INSERT INTO files (chat_id, file_path, file_type, created_at)
+    VALUES (?, ?, ?, ?)
+    """
+
     # Indexes for performance
     CREATE_INDEXES = [
         "CREATE INDEX IF NOT EXISTS idx_conv_status ON conversations(status)",
@@ -296,14 +315,26 @@ class ChatDatabase:
             file_path: Path to the file
             file_type: Type of file (uploaded or output)
         """
+        self.save_files(chat_id, [file_path], file_type)
+
+    def save_files(self, chat_id: str, file_paths: Sequence[str], file_type: str) -> None:
+        """
+        Save metadata for several files of one type in a single transaction.
+
+        Args:
+            chat_id: Conversation identifier
+            file_paths: Paths to the files
+            file_type: Type of the files (uploaded or output)
+        """
+        if not file_paths:
+            return
+
+        created_at = datetime.utcnow().isoformat()
         conn = self._get_connection()
         try:
-            conn.execute(
-                """
-                INSERT INTO files (chat_id, file_path, file_type, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (chat_id, file_path, file_type, datetime.utcnow().isoformat()),
+            conn.executemany(
+                self.INSERT_FILE,
+                [(chat_id, file_path, file_type, created_at) for file_path in file_paths],
             )
             conn.commit()
         finally:
@@ -464,34 +495,46 @@ class ChatDatabase:
             started_at: Optional start timestamp
             completed_at: Optional completion timestamp
         """
-        conn = self._get_connection()
-        try:
-            conn.execute(
-                """
-                INSERT INTO workflow_steps
-                (step_id, chat_id, operation, arguments, input_file, output_file,
-                 status, progress, error_message, started_at, completed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(step_id) DO UPDATE SET
-                    status = excluded.status,
-                    progress = excluded.progress,
-                    output_file = excluded.output_file,
-                    error_message = excluded.error_message,
-                    completed_at = excluded.completed_at
-                """,
+        self.save_workflow_steps(
+            chat_id,
+            [
                 (
                     step_id,
-                    chat_id,
                     operation,
-                    json.dumps(arguments),
+                    arguments,
+                    status,
                     input_file,
                     output_file,
-                    status,
                     progress,
                     error_message,
                     started_at,
                     completed_at,
-                ),
+                )
+            ],
+        )
+
+    def save_workflow_steps(self, chat_id: str, steps: Sequence[Tuple[Any, ...]]) -> None:
+        """
+        Save several workflow steps with one executemany in a single transaction.
+
+        Args:
+            chat_id: Conversation identifier
+            steps: One tuple per step, holding the save_workflow_step arguments
+                after chat_id: (step_id, operation, arguments, status,
+                input_file, output_file, progress, error_message, started_at,
+                completed_at)
+        """
+        if not steps:
+            return
+
+        conn = self._get_connection()
+        try:
+            conn.executemany(
+                self.UPSERT_WORKFLOW_STEP,
+                [
+                    (step_id, chat_id, operation, json.dumps(arguments), *rest)
+                    for step_id, operation, arguments, *rest in steps
+                ],
             )
             conn.commit()
         finally:
@@ -285,26 +285,32 @@ class ConversationRepository:
                 )
             
             # Restore workflow steps to database
-            for step_data in conversation_metadata.get("workflow_steps", []):
-                self.database.save_workflow_step(
-                    restored_chat_id,
-                    step_data["step_id"],
-                    step_data["operation"],
-                    step_data["arguments"],
-                    step_data["status"],
-                    step_data.get("input_file"),
-                    step_data.get("output_file"),
-                    step_data.get("progress", 0),
-                    step_data.get("error_message"),
-                    step_data.get("started_at"),
-                    step_data.get("completed_at")
-                )
+            self.database.save_workflow_steps(
+                restored_chat_id,
+                [
+                    (
+                        step_data["step_id"],
+                        step_data["operation"],
+                        step_data["arguments"],
+                        step_data["status"],
+                        step_data.get("input_file"),
+                        step_data.get("output_file"),
+                        step_data.get("progress", 0),
+                        step_data.get("error_message"),
+                        step_data.get("started_at"),
+                        step_data.get("completed_at")
+                    )
+                    for step_data in conversation_metadata.get("workflow_steps", [])
+                ]
+            )
             
             # Restore file metadata to database
-            for file_path in conversation_metadata.get("uploaded_files", []):
-                self.database.save_file(restored_chat_id, file_path, "uploaded")
-            for file_path in conversation_metadata.get("output_files", []):
-                self.database.save_file(restored_chat_id, file_path, "output")
+            self.database.save_files(
+                restored_chat_id, conversation_metadata.get("uploaded_files", []), "uploaded"
+            )
+            self.database.save_files(
+                restored_chat_id, conversation_metadata.get("output_files", []), "output"
+            )
             
             return self._dict_to_conversation(conversation_metadata)
         else:
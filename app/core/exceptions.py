@@ -165,6 +165,18 @@ def register_error_handlers(app: Flask) -> None:
         )
         return jsonify(response), 404
 
+    @app.errorhandler(413)
+    def handle_request_too_large(error):
+        """Handle 413 Request Entity Too Large errors."""
+        limit_mb = (app.config.get("MAX_CONTENT_LENGTH") or 0) // (1024 * 1024)
+        response = (
+            ResponseBuilder()
+            .with_status_code(413)
+            .with_message(f"Request exceeds the {limit_mb} MB upload limit")
+            .build()
+        )
+        return jsonify(response), 413
+
     @app.errorhandler(500)
     def handle_internal_error(error):
         """Handle 500 Internal Server errors."""
@@ -0,0 +1,56 @@
+"""
+Request Class Module
+
+This module provides the Flask request class used by the Pycelize
+application, which spools large uploads straight into the upload folder.
+"""
+
+import tempfile
+from typing import IO, Optional
+
+from flask import Request, current_app
+
+# Uploads up to this size stay in memory, matching werkzeug's default
+_IN_MEMORY_UPLOAD_SIZE = 500 * 1024
+
+
+class PycelizeRequest(Request):
+    """
+    Request class that spools large file uploads into the upload folder.
+
+    Werkzeug spools large uploads to anonymous temporary files, so saving
+    one to the upload folder copies every byte a second time. Spooling to
+    a named temporary file inside UPLOAD_FOLDER instead lets
+    FileUtils.save_upload hard-link the upload into place.
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None,
+    ) -> IO[bytes]:
+        """
+        Get a stream for a file upload.
+
+        Args:
+            total_content_length: Total content length of the request body
+            content_type: Mimetype of the uploaded file
+            filename: Name of the uploaded file
+            content_length: Length of this file, if the client sent it
+
+        Returns:
+            Writable and readable binary stream for the upload
+        """
+        upload_folder = current_app.config.get("UPLOAD_FOLDER")
+        if upload_folder and (
+            total_content_length is None
+            or total_content_length > _IN_MEMORY_UPLOAD_SIZE
+        ):
+            return tempfile.NamedTemporaryFile(
+                dir=upload_folder, prefix=".upload-", suffix=".part"
+            )
+        return super()._get_file_stream(
+            total_content_length, content_type, filename, content_length
+        )
@@ -107,6 +107,15 @@ class ColumnMappingRequest:
         )
 
 
+# (snake_case key, camelCase key, default) for AutoIncrementConfig.from_dict
+_AUTO_INCREMENT_KEYS = (
+    ("column_name", "columnName", "id"),
+    ("increment_type", "incrementType", "postgresql_serial"),
+    ("start_value", "startValue", 1),
+    ("sequence_name", "sequenceName", None),
+)
+
+
 @dataclass
 class AutoIncrementConfig:
     """
@@ -134,22 +143,13 @@ class AutoIncrementConfig:
         """
         if not data:
             return cls()
-        
-        # Helper function to get value from both camelCase and snake_case keys
-        def get_value(key_snake: str, key_camel: str, default: Any = None) -> Any:
-            if key_snake in data:
-                return data[key_snake]
-            if key_camel in data:
-                return data[key_camel]
-            return default
-        
-        return cls(
-            enabled=data.get("enabled", False),
-            column_name=get_value("column_name", "columnName", "id"),
-            increment_type=get_value("increment_type", "incrementType", "postgresql_serial"),
-            start_value=get_value("start_value", "startValue", 1),
-            sequence_name=get_value("sequence_name", "sequenceName"),
-        )
+
+        values = {"enabled": data.get("enabled", False)}
+        for key_snake, key_camel, default in _AUTO_INCREMENT_KEYS:
+            values[key_snake] = (
+                data[key_snake] if key_snake in data else data.get(key_camel, default)
+            )
+        return cls(**values)
 
 
 @dataclass
@@ -6,8 +6,10 @@ allowing values from a source file to be mapped into a target file.
 """
 
 import os
+from time import time_ns
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from app.core.config import Config
@@ -189,6 +191,50 @@ class BindingService:
 
         return bound_df, binding_stats
 
+    def _available_columns(
+        self, file_path: str, sheet_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        List every column of an Excel sheet without reading its rows.
+
+        Bind files are read with only the requested columns, so error
+        details re-read the header to report the full column list.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Optional specific sheet name to read
+
+        Returns:
+            Column names in sheet order
+        """
+        return list(
+            self.excel_service.read_excel(file_path, sheet_name, nrows=0).columns
+        )
+
+    @staticmethod
+    def _composite_key_indexer(
+        source_df: pd.DataFrame,
+        bind_df: pd.DataFrame,
+        key_columns: List[str],
+    ) -> np.ndarray:
+        """
+        Locate each source row's composite key in the bind DataFrame.
+
+        The key columns are hashed together in a single pass through a
+        MultiIndex, which must be unique on the bind side.
+
+        Args:
+            source_df: DataFrame whose rows are looked up
+            bind_df: DataFrame with unique composite keys
+            key_columns: Columns forming the composite key
+
+        Returns:
+            Positional index into bind_df for each source row, -1 if unmatched
+        """
+        bind_keys = pd.MultiIndex.from_frame(bind_df[key_columns])
+        source_keys = pd.MultiIndex.from_frame(source_df[key_columns])
+        return bind_keys.get_indexer(source_keys)
+
     def bind_excel_single_key(
         self,
         source_path: str,
@@ -248,7 +294,9 @@ class BindingService:
         try:
             # Read both Excel files
             source_df = self.excel_service.read_excel(source_path, source_sheet)
-            bind_df = self.excel_service.read_excel(bind_path, bind_sheet)
+            bind_df = self.excel_service.read_excel(
+                bind_path, bind_sheet, usecols=[comparison_column, *bind_columns]
+            )
 
             logger.info(
                 f"Loaded source: {len(source_df)} rows, bind: {len(bind_df)} rows"
@@ -268,7 +316,9 @@ class BindingService:
                 raise ValidationError(
                     f"Comparison column '{comparison_column}' not found in bind file",
                     details={
-                        "available_columns": list(bind_df.columns),
+                        "available_columns": self._available_columns(
+                            bind_path, bind_sheet
+                        ),
                         "requested_column": comparison_column,
                     },
                 )
@@ -281,7 +331,9 @@ class BindingService:
                 raise ValidationError(
                     f"Bind columns not found in bind file: {missing_bind_cols}",
                     details={
-                        "available_columns": list(bind_df.columns),
+                        "available_columns": self._available_columns(
+                            bind_path, bind_sheet
+                        ),
                         "missing_columns": missing_bind_cols,
                     },
                 )
@@ -331,8 +383,7 @@ class BindingService:
             # Generate output path if not provided
             if output_path is None:
                 base_name = os.path.splitext(os.path.basename(source_path))[0]
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_filename = f"{base_name}_bound_single_{timestamp}.xlsx"
+                output_filename = f"{base_name}_bound_single_{time_ns():x}.xlsx"
                 output_path = os.path.join(self.output_folder, output_filename)
 
             # Write result to Excel
@@ -440,7 +491,9 @@ class BindingService:
 
             # Read both Excel files
             source_df = self.excel_service.read_excel(source_path, source_sheet)
-            bind_df = self.excel_service.read_excel(bind_path, bind_sheet)
+            bind_df = self.excel_service.read_excel(
+                bind_path, bind_sheet, usecols=[*comparison_columns, *bind_columns]
+            )
 
             logger.info(
                 f"Loaded source: {len(source_df)} rows, bind: {len(bind_df)} rows"
@@ -466,7 +519,9 @@ class BindingService:
                 raise ValidationError(
                     f"Comparison columns not found in bind file: {missing_in_bind}",
                     details={
-                        "available_columns": list(bind_df.columns),
+                        "available_columns": self._available_columns(
+                            bind_path, bind_sheet
+                        ),
                         "missing_columns": missing_in_bind,
                     },
                 )
@@ -479,7 +534,9 @@ class BindingService:
                 raise ValidationError(
                     f"Bind columns not found in bind file: {missing_bind_cols}",
                     details={
-                        "available_columns": list(bind_df.columns),
+                        "available_columns": self._available_columns(
+                            bind_path, bind_sheet
+                        ),
                         "missing_columns": missing_bind_cols,
                     },
                 )
@@ -507,33 +564,34 @@ class BindingService:
                 subset=comparison_columns, keep="first"
             )
 
-            # Perform left join on multiple columns
-            result_df = pd.merge(
-                source_df,
-                bind_subset,
-                on=comparison_columns,
-                how="left",
-                suffixes=("", "_bind"),
+            # Perform left join on multiple columns: hash each composite key
+            # once and gather the matching bind rows by position
+            indexer = self._composite_key_indexer(
+                source_df, bind_subset, comparison_columns
+            )
+            gathered = (
+                bind_subset[
+                    [col for col in bind_columns if col not in comparison_columns]
+                ]
+                .reset_index(drop=True)
+                .reindex(indexer)
+                .set_axis(source_df.index)
             )
+            result_df = pd.concat([source_df, gathered], axis=1)
 
             # Calculate statistics
             source_rows = len(source_df)
             bind_rows = len(bind_df)
-            result_rows = len(result_df)
 
-            # Count matched rows (rows where at least one bind column is not NaN)
-            matched_rows = 0
-            for col in bind_columns:
-                matched_rows = result_df[col].notna().sum()
-                break  # Use first bind column to count matches
+            # Count matched rows (rows whose composite key was found)
+            matched_rows = int((indexer >= 0).sum())
 
             unmatched_rows = source_rows - matched_rows
 
             # Generate output path if not provided
             if output_path is None:
                 base_name = os.path.splitext(os.path.basename(source_path))[0]
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_filename = f"{base_name}_bound_multi_{timestamp}.xlsx"
+                output_filename = f"{base_name}_bound_multi_{time_ns():x}.xlsx"
                 output_path = os.path.join(self.output_folder, output_filename)
 
             # Write result to Excel
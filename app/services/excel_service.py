@@ -5,11 +5,27 @@ This module provides Excel file processing functionality including
 reading, writing, column extraction, and data manipulation.
 """
 
+import hashlib
+import io
 import os
-from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
+import tempfile
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from datetime import date, datetime
 import pandas as pd
-from openpyxl import Workbook
+import pyarrow as pa
+from pyarrow import ipc
+from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
@@ -19,6 +35,35 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import python_calamine  # noqa: F401
+
+    _CALAMINE_AVAILABLE = True
+except ImportError:
+    _CALAMINE_AVAILABLE = False
+
+# Block size used when hashing workbooks for the read cache
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+# String dtype used for each read_excel dtype_backend
+_BACKEND_STRING_DTYPES = {
+    "pyarrow": "string[pyarrow]",
+    "numpy_nullable": "string[python]",
+}
+
+
+def _calamine_cell(value: Any) -> Any:
+    """Convert a calamine cell to the value openpyxl reports for it."""
+    if value == "":
+        return None
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+# Column dtype reported for data read with dtype=str ("object" or "str")
+_STRING_DTYPE_NAME = str(pd.Series(dtype=str).dtype)
+
 
 class ExcelService:
     """
@@ -35,6 +80,9 @@ class ExcelService:
         config: Application configuration
         max_column_width: Maximum column width for auto-adjustment
         default_sheet_name: Default name for data sheets
+        read_engine: pandas engine used to read workbooks (None for default)
+        read_cache_folder: Folder for Arrow copies of parsed workbooks (None disables)
+        read_cache_max_entries: Number of cached workbooks kept in read_cache_folder
 
     Example:
         >>> service = ExcelService(config)
@@ -55,18 +103,36 @@ class ExcelService:
         self.include_info_sheet = config.get("excel.include_info_sheet", True)
         self.output_folder = config.get("file.output_folder", "outputs")
 
+        # "auto" reads with calamine when python-calamine is installed
+        read_engine = config.get("excel.read_engine", "auto")
+        if read_engine == "auto":
+            read_engine = "calamine" if _CALAMINE_AVAILABLE else None
+        self.read_engine: Optional[str] = read_engine
+        self.read_cache_folder: Optional[str] = config.get("excel.read_cache_folder")
+        self.read_cache_max_entries = config.get("excel.read_cache_max_entries", 64)
+
         # Ensure output folder exists
         os.makedirs(self.output_folder, exist_ok=True)
 
     def read_excel(
-        self, file_path: str, sheet_name: Optional[str] = None
+        self,
+        file_path: Union[str, BinaryIO],
+        sheet_name: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        usecols: Optional[Iterable[str]] = None,
+        nrows: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Read an Excel file into a DataFrame.
 
         Args:
-            file_path: Path to the Excel file
+            file_path: Path to the Excel file, or a seekable file-like object
             sheet_name: Optional specific sheet name to read
+            dtype_backend: Optional storage for the text columns ('pyarrow' or
+                'numpy_nullable')
+            usecols: Optional column names to keep; names missing from the
+                file are ignored rather than raising
+            nrows: Optional number of data rows to read
 
         Returns:
             DataFrame containing the Excel data
@@ -77,10 +143,30 @@ class ExcelService:
         try:
             logger.info(f"Reading Excel file: {file_path}")
 
+            kwargs = {"dtype": str, "keep_default_na": False}
             if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str, keep_default_na=False)
-            else:
-                df = pd.read_excel(file_path, dtype=str, keep_default_na=False)
+                kwargs["sheet_name"] = sheet_name
+            if usecols is not None:
+                wanted = frozenset(usecols)
+                kwargs["usecols"] = lambda column: column in wanted
+            if nrows is not None:
+                kwargs["nrows"] = nrows
+            if self.read_engine:
+                kwargs["engine"] = self.read_engine
+
+            df = pd.read_excel(file_path, **kwargs)
+            if usecols is not None and df.columns.empty:
+                # None of the requested columns exist, which also drops every
+                # row; read the sheet again to keep its row count
+                del kwargs["usecols"]
+                if hasattr(file_path, "seek"):
+                    file_path.seek(0)
+                df = pd.read_excel(file_path, **kwargs).iloc[:, :0]
+            # Cells are always read as text, so the backend only picks how the
+            # strings are stored. Passing it to pandas would parse blank cells
+            # of numeric columns as that column's Arrow type and fail.
+            if dtype_backend:
+                df = df.astype(_BACKEND_STRING_DTYPES[dtype_backend])
 
             logger.info(f"Successfully read {len(df)} rows, {len(df.columns)} columns")
             return df
@@ -89,6 +175,254 @@ class ExcelService:
             logger.error(f"Error reading Excel file: {str(e)}")
             raise FileProcessingError(f"Failed to read Excel file: {str(e)}")
 
+    def read_excel_cached(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None,
+        usecols: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read an Excel file through an Arrow IPC cache keyed by its content.
+
+        The first read of a workbook parses it with read_excel and stores the
+        sheet as an Arrow IPC file named after the SHA-1 of the file bytes.
+        Later reads of identical bytes memory-map that file instead of parsing
+        the workbook again. Falls back to read_excel when the cache is disabled.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Optional specific sheet name to read
+            usecols: Optional column names to keep; names missing from the
+                file are ignored rather than raising
+
+        Returns:
+            DataFrame containing the Excel data
+
+        Raises:
+            FileProcessingError: If file cannot be read
+        """
+        if not self.read_cache_folder:
+            return self.read_excel(file_path, sheet_name=sheet_name, usecols=usecols)
+
+        cache_path = self._read_cache_path(file_path, sheet_name)
+        try:
+            with pa.memory_map(cache_path) as source:
+                table = ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            data = self.read_excel(file_path, sheet_name=sheet_name)
+            self._write_read_cache(data, cache_path)
+            if usecols is not None:
+                wanted = frozenset(usecols)
+                data = data[[column for column in data.columns if column in wanted]]
+            return data
+
+        logger.info(f"Read {table.num_rows} cached rows for Excel file: {file_path}")
+        if usecols is not None:
+            wanted = frozenset(usecols)
+            table = table.select(
+                [column for column in table.column_names if column in wanted]
+            )
+        return table.to_pandas(split_blocks=True)
+
+    def _read_cache_path(self, file_path: str, sheet_name: Optional[str]) -> str:
+        """Build the read cache path for a workbook from its content hash."""
+        digest = hashlib.sha1()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        digest.update(f"\0{sheet_name or ''}\0{self.read_engine or ''}".encode())
+        return os.path.join(self.read_cache_folder, f"{digest.hexdigest()}.arrow")
+
+    def _write_read_cache(self, data: pd.DataFrame, cache_path: str) -> None:
+        """
+        Store a parsed sheet in the read cache, evicting the oldest entries.
+
+        Sheets whose headers are not all strings cannot round-trip through
+        Arrow and are not cached. Cache write failures are logged and ignored.
+        """
+        if not all(isinstance(column, str) for column in data.columns):
+            return
+        try:
+            os.makedirs(self.read_cache_folder, exist_ok=True)
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            fd, tmp_path = tempfile.mkstemp(dir=self.read_cache_folder, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as sink:
+                    with ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            entries = [
+                entry
+                for entry in os.scandir(self.read_cache_folder)
+                if entry.name.endswith(".arrow")
+            ]
+            if len(entries) > self.read_cache_max_entries:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[: len(entries) - self.read_cache_max_entries]:
+                    os.unlink(entry.path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not cache Excel read at {cache_path}: {str(e)}")
+
+    def read_excel_stream(
+        self,
+        stream: BinaryIO,
+        sheet_name: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Read an uploaded Excel stream into a DataFrame without saving it to disk.
+
+        Args:
+            stream: File-like object holding the workbook bytes
+            sheet_name: Optional specific sheet name to read
+            dtype_backend: Optional storage for the text columns ('pyarrow' or
+                'numpy_nullable')
+
+        Returns:
+            DataFrame containing the Excel data
+
+        Raises:
+            FileProcessingError: If the stream cannot be read
+        """
+        return self.read_excel(self._seekable(stream), sheet_name, dtype_backend)
+
+    def iter_excel(
+        self,
+        file_path: str,
+        batch_size: int,
+        sheet_name: Optional[str] = None,
+        usecols: Optional[Iterable[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read an Excel file as a sequence of DataFrames of at most batch_size rows.
+
+        The worksheet is streamed row by row in read-only mode, so only one
+        batch is held in memory at a time. Values and header names come out
+        the same as read_excel's (strings, blanks as '').
+
+        Args:
+            file_path: Path to the Excel file
+            batch_size: Maximum number of rows per DataFrame
+            sheet_name: Optional specific sheet name to read
+            usecols: Optional column names to keep; names missing from the
+                file are ignored rather than raising
+
+        Yields:
+            DataFrames holding consecutive rows of the sheet
+
+        Raises:
+            FileProcessingError: If file cannot be read
+        """
+        try:
+            logger.info(f"Streaming Excel file: {file_path}")
+            rows = self._sheet_rows(file_path, sheet_name)
+
+            header = list(next(rows, ()))
+            while header and header[-1] is None:
+                header.pop()
+            names = self._header_names(header)
+            if usecols is not None:
+                wanted = frozenset(usecols)
+                positions = [i for i, name in enumerate(names) if name in wanted]
+            else:
+                positions = list(range(len(names)))
+            columns = [names[i] for i in positions]
+
+            batch: List[List[str]] = []
+            yielded = False
+            # Blank rows are only kept once a later row has data, matching
+            # pandas, which drops trailing blank rows
+            blank_rows = 0
+            for row in rows:
+                if all(value is None for value in row):
+                    blank_rows += 1
+                    continue
+                for _ in range(blank_rows):
+                    batch.append([""] * len(positions))
+                    if len(batch) >= batch_size:
+                        yield pd.DataFrame(batch, columns=columns)
+                        batch = []
+                        yielded = True
+                blank_rows = 0
+
+                batch.append(
+                    [self._cell_text(row[i]) if i < len(row) else "" for i in positions]
+                )
+                if len(batch) >= batch_size:
+                    yield pd.DataFrame(batch, columns=columns)
+                    batch = []
+                    yielded = True
+
+            # A sheet with only a header still yields one empty DataFrame,
+            # so callers see its columns just as read_excel would show them
+            if batch or not yielded:
+                yield pd.DataFrame(batch, columns=columns)
+        except Exception as e:
+            logger.error(f"Error reading Excel file: {str(e)}")
+            raise FileProcessingError(f"Failed to read Excel file: {str(e)}")
+
+    def _sheet_rows(
+        self, file_path: str, sheet_name: Optional[str] = None
+    ) -> Iterator[Sequence[Any]]:
+        """
+        Yield the raw cell values of a worksheet row by row, blanks as None.
+
+        Uses calamine when it is the read engine and the sheet starts at A1,
+        otherwise openpyxl in read-only mode.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Optional specific sheet name to read
+
+        Yields:
+            Cell values of each row
+        """
+        if self.read_engine == "calamine":
+            from python_calamine import CalamineWorkbook
+
+            workbook = CalamineWorkbook.from_path(file_path)
+            try:
+                sheet = (
+                    workbook.get_sheet_by_name(sheet_name)
+                    if sheet_name
+                    else workbook.get_sheet_by_index(0)
+                )
+                # iter_rows does not pad sheets whose data starts after A1
+                if sheet.start in (None, (0, 0)):
+                    for row in sheet.iter_rows():
+                        yield [_calamine_cell(value) for value in row]
+                    return
+            finally:
+                workbook.close()
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            yield from worksheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _cell_text(value: Any) -> str:
+        """Render a cell value the way read_excel(dtype=str) does."""
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    @staticmethod
+    def _seekable(stream: BinaryIO) -> BinaryIO:
+        """Rewind a seekable stream, or buffer a forward-only one in memory."""
+        if stream.seekable():
+            stream.seek(0)
+            return stream
+        return io.BytesIO(stream.read())
+
     def write_excel(
         self,
         data: pd.DataFrame,
@@ -292,28 +626,39 @@ class ExcelService:
             List of sheet names
         """
         try:
-            return pd.ExcelFile(file_path).sheet_names
+            return pd.ExcelFile(file_path, engine=self.read_engine).sheet_names
         except Exception as e:
             logger.error(f"Error reading sheet names: {str(e)}")
             raise FileProcessingError(f"Failed to read sheet names: {str(e)}")
 
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
+    def get_file_info(
+        self, file_path: Union[str, BinaryIO], file_name: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get information about an Excel file.
 
         Args:
-            file_path: Path to the Excel file
+            file_path: Path to the Excel file, or an uploaded stream
+            file_name: Optional display name (required context for streams)
 
         Returns:
             Dictionary containing file information
         """
         try:
-            df = self.read_excel(file_path)
-            sheet_names = self.get_sheet_names(file_path)
+            if isinstance(file_path, str):
+                source = file_path
+                file_name = file_name or os.path.basename(file_path)
+            else:
+                source = self._seekable(file_path)
+                file_path = file_name
+
+            with pd.ExcelFile(source, engine=self.read_engine) as excel_file:
+                sheet_names = excel_file.sheet_names
+                df = excel_file.parse(dtype=str, keep_default_na=False)
 
             return {
                 "file_path": file_path,
-                "file_name": os.path.basename(file_path),
+                "file_name": file_name,
                 "sheets": sheet_names,
                 "rows": len(df),
                 "columns": len(df.columns),
@@ -323,6 +668,147 @@ class ExcelService:
         except Exception as e:
             raise FileProcessingError(f"Failed to get file info: {str(e)}")
 
+    def peek(self, file_path: Union[str, BinaryIO]) -> Dict[str, Any]:
+        """
+        Read the header row and row count of an Excel file's first sheet.
+
+        Only the header row is decoded and no DataFrame is built. The row
+        count matches read_excel's: like pandas, it ends at the last row
+        holding a value, so formatted but empty rows below the data are not
+        counted.
+
+        Args:
+            file_path: Path to the Excel file, or an uploaded stream
+
+        Returns:
+            Dictionary with 'columns', 'n_rows' and 'sheets'
+
+        Raises:
+            FileProcessingError: If the workbook cannot be read
+        """
+        try:
+            if not isinstance(file_path, str):
+                file_path = self._seekable(file_path)
+
+            peeked = None
+            if self.read_engine == "calamine":
+                peeked = self._peek_calamine(file_path)
+                if peeked is None and not isinstance(file_path, str):
+                    file_path.seek(0)
+            if peeked is None:
+                peeked = self._peek_openpyxl(file_path)
+            sheet_names, header, row_count = peeked
+
+            while header and header[-1] is None:
+                header.pop()
+            columns = self._header_names(header)
+
+            return {
+                "columns": columns,
+                "n_rows": row_count if columns else 0,
+                "sheets": sheet_names,
+            }
+        except Exception as e:
+            raise FileProcessingError(f"Failed to read Excel headers: {str(e)}")
+
+    @staticmethod
+    def _peek_calamine(
+        file_path: Union[str, BinaryIO],
+    ) -> Optional[Tuple[List[str], List[Any], int]]:
+        """
+        Peek at the first sheet with calamine, whose sheet height ends at the
+        last row holding a value.
+
+        Returns:
+            Sheet names, raw header cells and data row count, or None when
+            the sheet does not start at A1
+        """
+        from python_calamine import CalamineWorkbook
+
+        if isinstance(file_path, str):
+            workbook = CalamineWorkbook.from_path(file_path)
+        else:
+            workbook = CalamineWorkbook.from_filelike(file_path)
+        try:
+            sheet = workbook.get_sheet_by_index(0)
+            if sheet.start not in (None, (0, 0)):
+                return None
+            header = [_calamine_cell(value) for value in next(sheet.iter_rows(), ())]
+            return workbook.sheet_names, header, max(sheet.height - 1, 0)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _peek_openpyxl(
+        file_path: Union[str, BinaryIO],
+    ) -> Tuple[List[str], List[Any], int]:
+        """
+        Peek at the first sheet with openpyxl in read-only mode.
+
+        The sheet dimensions include formatted but empty rows, so the data
+        rows are scanned for the last one holding a value.
+
+        Returns:
+            Sheet names, raw header cells and data row count
+        """
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = list(next(rows, ()))
+            row_count = 0
+            for index, row in enumerate(rows, 1):
+                if row.count(None) < len(row):
+                    row_count = index
+            return workbook.sheetnames, header, row_count
+        finally:
+            workbook.close()
+
+    def get_file_info_fast(
+        self, file_path: Union[str, BinaryIO], file_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get information about an Excel file without parsing its cell data.
+
+        Built on peek; the result has the same shape as get_file_info.
+
+        Args:
+            file_path: Path to the Excel file, or an uploaded stream
+            file_name: Optional display name (required context for streams)
+
+        Returns:
+            Dictionary containing file information
+        """
+        if isinstance(file_path, str):
+            file_name = file_name or os.path.basename(file_path)
+
+        try:
+            peeked = self.peek(file_path)
+        except FileProcessingError as e:
+            raise FileProcessingError(f"Failed to get file info: {e.message}")
+
+        column_names = peeked["columns"]
+        return {
+            "file_path": file_path if isinstance(file_path, str) else file_name,
+            "file_name": file_name,
+            "sheets": peeked["sheets"],
+            "rows": peeked["n_rows"],
+            "columns": len(column_names),
+            "column_names": column_names,
+            "data_types": {col: _STRING_DTYPE_NAME for col in column_names},
+        }
+
+    @staticmethod
+    def _header_names(header: List[Any]) -> List[Any]:
+        """Name header cells the way pandas does (blank and duplicate headers)."""
+        names: List[Any] = []
+        seen: Dict[Any, int] = {}
+        for index, value in enumerate(header):
+            name = f"Unnamed: {index}" if value is None else value
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            names.append(f"{name}.{count}" if count else name)
+        return names
+
     def _create_data_sheet(
         self, workbook: Workbook, data: pd.DataFrame, sheet_name: str, auto_adjust: bool
     ) -> None:
@@ -397,7 +883,7 @@ class ExcelService:
         logger.info(f"Extracting columns {columns} to file: {output_path}")
 
         # Validate columns
-        missing_columns = [col for col in columns if col not in data.columns]
+        missing_columns = list(pd.Index(columns).difference(data.columns, sort=False))
         if missing_columns:
             raise ValidationError(
                 f"Columns not found in data: {', '.join(missing_columns)}"
@@ -6,11 +6,23 @@ with support for column mapping and custom template-based generation.
 """
 
 import os
-import json
 import re
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from itertools import repeat
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from datetime import datetime
-from copy import deepcopy
+import orjson
 import pandas as pd
 import numpy as np
 
@@ -21,6 +33,121 @@ from app.utils.template_parser import TemplateParser
 
 logger = get_logger(__name__)
 
+# Accepted values for the null_handling and aggregation_mode options
+NULL_HANDLING_STRATEGIES = frozenset(("include", "exclude", "default"))
+AGGREGATION_MODES = frozenset(("array", "single", "nested"))
+
+# Compiled template: renders the template for one row of placeholder values
+RenderFn = Callable[[Dict[str, Any]], Any]
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> RenderFn:
+    """
+    Parse a JSON template string and compile it, memoized per template.
+
+    Args:
+        template: JSON template string
+
+    Returns:
+        Render function for the template
+
+    Raises:
+        ValidationError: If the template is not a valid, non-empty JSON object
+    """
+    try:
+        template_obj = orjson.loads(template)
+    except orjson.JSONDecodeError as e:
+        raise ValidationError(f"Invalid JSON template: {str(e)}")
+    if not isinstance(template_obj, dict):
+        raise ValidationError("Template must be a JSON string or dictionary")
+    if not template_obj:
+        raise ValidationError("Template cannot be empty")
+    return _compile_node(template_obj)
+
+
+def _compile_node(template_obj: Any) -> RenderFn:
+    """
+    Compile a template structure into a render function.
+
+    Placeholders are found and parsed once here rather than for every row.
+
+    Args:
+        template_obj: Template object/structure
+
+    Returns:
+        Function building a fresh substituted structure from row data
+    """
+    if isinstance(template_obj, dict):
+        items = [(key, _compile_node(value)) for key, value in template_obj.items()]
+        return lambda row_data: {key: render(row_data) for key, render in items}
+
+    if isinstance(template_obj, list):
+        renders = [_compile_node(item) for item in template_obj]
+        return lambda row_data: [render(row_data) for render in renders]
+
+    if not isinstance(template_obj, str):
+        # Numbers, booleans and None are returned as-is
+        return lambda row_data: template_obj
+
+    placeholders = [
+        (f"{{{text}}}", *TemplateParser.parse_placeholder(text))
+        for text in TemplateParser.find_all_placeholders(template_obj)
+    ]
+    if not placeholders:
+        return lambda row_data: template_obj
+
+    # A string that is exactly one placeholder yields the typed value itself
+    if len(placeholders) == 1 and template_obj == placeholders[0][0]:
+        _, name, type_hint, default_value = placeholders[0]
+
+        def render_value(row_data: Dict[str, Any]) -> Any:
+            value = _placeholder_value(row_data, name, default_value)
+            if value is None:
+                return None
+            converted_value = TemplateParser.convert_value(value, type_hint)
+            if type_hint in ("int", "float", "bool") and converted_value is not None:
+                return converted_value
+            if converted_value is None:
+                return None
+            return (
+                converted_value
+                if isinstance(converted_value, str)
+                else str(converted_value)
+            )
+
+        return render_value
+
+    # Multiple placeholders or mixed content: replace in string
+    def render_text(row_data: Dict[str, Any]) -> str:
+        result = template_obj
+        for placeholder_full, name, type_hint, default_value in placeholders:
+            converted_value = TemplateParser.convert_value(
+                _placeholder_value(row_data, name, default_value), type_hint
+            )
+            result = result.replace(
+                placeholder_full,
+                "" if converted_value is None else str(converted_value),
+            )
+        return result
+
+    return render_text
+
+
+def _placeholder_value(
+    row_data: Dict[str, Any], name: str, default_value: Optional[str]
+) -> Any:
+    """Look up a placeholder's value, falling back to its default when empty."""
+    value = row_data.get(name)
+    # Treat empty string as None if default is specified
+    if (
+        value is None
+        or pd.isna(value)
+        or (isinstance(value, str) and value == "" and default_value is not None)
+    ):
+        return default_value
+    return value
+
 
 class JSONGenerationService:
     """
@@ -97,64 +224,45 @@ class JSONGenerationService:
         logger.info(f"Generating JSON from {len(data)} rows with column mapping")
 
         try:
-            # Validate DataFrame is not empty
             if data.empty:
                 logger.warning("DataFrame is empty, generating empty JSON array")
-                json_data = [] if array_wrapper else {}
+                records = iter(())
             else:
                 # Validate all mapped columns exist in DataFrame
-                missing_columns = [
-                    col for col in column_mapping.keys() if col not in data.columns
-                ]
+                missing_columns = list(
+                    pd.Index(list(column_mapping.keys())).difference(
+                        data.columns, sort=False
+                    )
+                )
                 if missing_columns:
                     raise ValidationError(
                         f"Columns not found in data: {', '.join(missing_columns)}"
                     )
 
-                # Generate JSON objects for each row
-                json_objects = []
-                for idx, row in data.iterrows():
-                    json_obj = {}
-                    for source_col, target_key in column_mapping.items():
-                        value = row[source_col]
-
-                        # Convert pandas/numpy types to native Python types
-                        if pd.isna(value):
-                            value = None
-                        elif isinstance(value, (np.integer, np.floating)):
-                            value = value.item()
-                        elif isinstance(value, (pd.Timestamp, datetime)):
-                            value = value.isoformat() if pd.notna(value) else None
-                        elif isinstance(value, np.bool_):
-                            value = bool(value)
-
-                        json_obj[target_key] = value
-
-                    # Handle null values based on strategy
-                    json_obj = self._handle_null_values(json_obj, null_handling)
-                    json_objects.append(json_obj)
-
-                # Wrap in array or return single object
-                if array_wrapper:
-                    json_data = json_objects
-                else:
-                    json_data = (
-                        json_objects[0] if len(json_objects) == 1 else json_objects
-                    )
-
-            # Write to JSON file with proper formatting
-            with open(output_path, "w", encoding="utf-8") as f:
-                if pretty_print:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
+                # Build JSON objects lazily, one row at a time, with the
+                # output keys and null strategy resolved once up front
+                make_record = self._record_factory(
+                    list(column_mapping.values()), null_handling
+                )
+                records = map(make_record, self._iter_rows(data, column_mapping.keys()))
+
+            # Stream objects to the file as they are built
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                if not array_wrapper and data.empty:
+                    f.write(b"{}")
+                    total_records = 1
+                elif not array_wrapper and len(data) == 1:
+                    f.write(self._dumps(next(records), pretty_print))
+                    total_records = 1
                 else:
-                    json.dump(json_data, f, ensure_ascii=False)
+                    total_records = self._write_json_array(f, records, pretty_print)
 
             # Get file size
             file_size = os.path.getsize(output_path)
 
             result = {
                 "output_path": output_path,
-                "total_records": len(json_data) if isinstance(json_data, list) else 1,
+                "total_records": total_records,
                 "file_size": file_size,
                 "timestamp": datetime.now().isoformat(),
             }
@@ -211,98 +319,73 @@ class JSONGenerationService:
         logger.info(f"Generating JSON with template from {len(data)} rows")
 
         try:
-            # Parse template (if string, convert to dict)
+            # Compile the template once; string templates are memoized
             if isinstance(template, str):
-                try:
-                    template_dict = json.loads(template)
-                except json.JSONDecodeError as e:
-                    raise ValidationError(f"Invalid JSON template: {str(e)}")
+                render = _compile_template(template)
             elif isinstance(template, dict):
-                template_dict = template
+                if not template:
+                    raise ValidationError("Template cannot be empty")
+                render = _compile_node(template)
             else:
                 raise ValidationError("Template must be a JSON string or dictionary")
 
-            # Validate template structure
-            if not template_dict:
-                raise ValidationError("Template cannot be empty")
-
             # Validate DataFrame is not empty
             if data.empty:
                 logger.warning("DataFrame is empty, generating empty JSON array")
-                json_data = []
+                records = iter(())
             else:
                 # Validate all mapped columns exist in DataFrame
-                missing_columns = [
-                    col for col in column_mapping.values() if col not in data.columns
-                ]
+                missing_columns = list(
+                    pd.Index(list(column_mapping.values())).difference(
+                        data.columns, sort=False
+                    )
+                )
                 if missing_columns:
                     raise ValidationError(
                         f"Columns not found in data: {', '.join(missing_columns)}"
                     )
 
-                # Generate JSON objects for each row
-                json_objects = []
-                for idx, row in data.iterrows():
-                    # Create row data dictionary
-                    row_data = {}
-                    for placeholder, column in column_mapping.items():
-                        value = row[column]
-
-                        # Convert pandas/numpy types to native Python types
-                        if pd.isna(value):
-                            value = None
-                        elif isinstance(value, (np.integer, np.floating)):
-                            value = value.item()
-                        elif isinstance(value, (pd.Timestamp, datetime)):
-                            value = value.isoformat() if pd.notna(value) else None
-                        elif isinstance(value, np.bool_):
-                            value = bool(value)
-                        else:
-                            value = str(value)
-
-                        row_data[placeholder] = value
-
-                    # Deep copy template and substitute placeholders
-                    json_obj = self._substitute_placeholders(
-                        deepcopy(template_dict), row_data, column_mapping
-                    )
-                    json_objects.append(json_obj)
-
-                # Aggregate results based on aggregation_mode
-                if aggregation_mode == "array":
-                    json_data = json_objects
-                elif aggregation_mode == "single":
-                    json_data = (
-                        json_objects[0] if len(json_objects) == 1 else json_objects
-                    )
-                elif aggregation_mode == "nested":
-                    json_data = {"items": json_objects, "count": len(json_objects)}
-                else:
+                if aggregation_mode not in AGGREGATION_MODES:
                     raise ValidationError(
                         f"Invalid aggregation_mode: {aggregation_mode}. "
                         f"Must be 'array', 'single', or 'nested'"
                     )
 
-            # Write formatted JSON to file
-            with open(output_path, "w", encoding="utf-8") as f:
-                if pretty_print:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
+                # Build JSON objects lazily, one row at a time
+                placeholders = list(column_mapping.keys())
+                records = (
+                    render(dict(zip(placeholders, values)))
+                    for values in self._iter_rows(
+                        data, column_mapping.values(), stringify=True
+                    )
+                )
+
+            # Stream objects to the file as they are built
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                if data.empty:
+                    f.write(b"[]")
+                    total_records = 0
+                elif aggregation_mode == "single" and len(data) == 1:
+                    f.write(self._dumps(next(records), pretty_print))
+                    total_records = 1
+                elif aggregation_mode == "nested":
+                    # Same layout as {"items": [...], "count": n}; the count
+                    # is known once every item has been written
+                    f.write(b'{\n  "items": ' if pretty_print else b'{"items":')
+                    total_records = self._write_json_array(
+                        f, records, pretty_print, depth=1
+                    )
+                    f.write(
+                        f',\n  "count": {total_records}\n}}'.encode()
+                        if pretty_print
+                        else f',"count":{total_records}}}'.encode()
+                    )
                 else:
-                    json.dump(json_data, f, ensure_ascii=False)
+                    total_records = self._write_json_array(f, records, pretty_print)
 
             # Get file size
             file_size = os.path.getsize(output_path)
 
-            # Calculate total records
-            if aggregation_mode == "nested":
-                total_records = (
-                    json_data.get("count", 0) if isinstance(json_data, dict) else 0
-                )
-            elif isinstance(json_data, list):
-                total_records = len(json_data)
-            else:
-                total_records = 1
-
             result = {
                 "output_path": output_path,
                 "total_records": total_records,
@@ -324,6 +407,132 @@ class JSONGenerationService:
                 f"Failed to generate JSON with template: {str(e)}"
             )
 
+    @classmethod
+    def _iter_rows(
+        cls, data: pd.DataFrame, columns: Iterable[str], stringify: bool = False
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate rows of selected columns as JSON-native Python values.
+
+        Each column is converted once with Series.tolist() and a vectorized
+        null mask, which avoids building a Series per row as iterrows does.
+        Columns pandas reports as numeric or all-string skip the per-value
+        conversion.
+
+        Args:
+            data: Source DataFrame
+            columns: Columns to read, in output order
+            stringify: Convert values that are not numbers, booleans or
+                dates to strings (template substitution)
+
+        Returns:
+            Iterator of value tuples, one per row
+        """
+        converted = []
+        for column in columns:
+            series = data[column]
+            values = series.tolist()
+            missing = series.isna().to_numpy()
+            # Numeric and all-string columns are already JSON-native after
+            # tolist(); only nulls need replacing
+            if series.dtype.kind in "biuf" or pd.api.types.infer_dtype(
+                series, skipna=True
+            ) in ("string", "empty"):
+                if missing.any():
+                    values = [
+                        None if is_missing else value
+                        for value, is_missing in zip(values, missing)
+                    ]
+                converted.append(values)
+                continue
+            converted.append(
+                [
+                    None if is_missing else cls._to_native(value, stringify)
+                    for value, is_missing in zip(values, missing)
+                ]
+            )
+
+        if not converted:
+            return repeat((), len(data))
+        return zip(*converted)
+
+    @staticmethod
+    def _to_native(value: Any, stringify: bool = False) -> Any:
+        """
+        Convert a non-null cell value to a JSON-native Python type.
+
+        Args:
+            value: Cell value
+            stringify: Convert values of other types to strings
+
+        Returns:
+            Converted value
+        """
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, (pd.Timestamp, datetime)):
+            return value.isoformat()
+        return str(value) if stringify else value
+
+    @staticmethod
+    def _dumps(obj: Any, pretty_print: bool) -> bytes:
+        """
+        Serialize one object the way json.dump would lay it out.
+
+        Args:
+            obj: Object to serialize
+            pretty_print: Indent with two spaces
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty_print:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    @classmethod
+    def _write_json_array(
+        cls,
+        fp: BinaryIO,
+        objects: Iterable[Any],
+        pretty_print: bool,
+        depth: int = 0,
+    ) -> int:
+        """
+        Write objects as a JSON array, one element at a time.
+
+        The indented layout matches json.dump(indent=2) for an array nested
+        ``depth`` levels deep.
+
+        Args:
+            fp: Binary file to write to
+            objects: Objects to write
+            pretty_print: Indent with two spaces
+            depth: Nesting level of the array in the document
+
+        Returns:
+            Number of objects written
+        """
+        if pretty_print:
+            pad = b"\n" + b"  " * (depth + 1)
+            close = b"\n" + b"  " * depth + b"]"
+        else:
+            pad, close = b"", b"]"
+
+        count = 0
+        for obj in objects:
+            chunk = cls._dumps(obj, pretty_print)
+            if pretty_print:
+                chunk = chunk.replace(b"\n", pad)
+            fp.write((b"," if count else b"[") + pad + chunk)
+            count += 1
+
+        fp.write(close if count else b"[]")
+        return count
+
     def _substitute_placeholders(
         self,
         template_obj: Any,
@@ -335,6 +544,8 @@ class JSONGenerationService:
 
         This method handles different types (dict, list, string, number)
         and replaces placeholders using enhanced syntax with the TemplateParser.
+        Bulk generation compiles the template once instead of calling this
+        per row.
 
         Args:
             template_obj: Template object/structure
@@ -351,119 +562,45 @@ class JSONGenerationService:
             >>> print(result)
             {'id': '1', 'name': 'John Doe'}
         """
-        if isinstance(template_obj, dict):
-            # Recursively process dictionary values
-            result = {}
-            for key, value in template_obj.items():
-                result[key] = self._substitute_placeholders(
-                    value, row_data, column_mapping
-                )
-            return result
+        return _compile_node(template_obj)(row_data)
 
-        elif isinstance(template_obj, list):
-            # Recursively process list items
-            return [
-                self._substitute_placeholders(item, row_data, column_mapping)
-                for item in template_obj
-            ]
-
-        elif isinstance(template_obj, str):
-            # Replace placeholders in string using TemplateParser
-            result = template_obj
-
-            # Find all placeholders in the string
-            placeholders = TemplateParser.find_all_placeholders(result)
-
-            # Special case: if the string is exactly one placeholder with a type hint,
-            # return the typed value directly instead of a string
-            if len(placeholders) == 1:
-                placeholder_text = placeholders[0]
-                placeholder_full = f"{{{placeholder_text}}}"
-                if result == placeholder_full:
-                    # Parse the placeholder
-                    name, type_hint, default_value = TemplateParser.parse_placeholder(
-                        placeholder_text
-                    )
-
-                    # Get value from row_data
-                    value = row_data.get(name)
-
-                    # Handle None/null/empty values
-                    if (
-                        value is None
-                        or pd.isna(value)
-                        or (
-                            isinstance(value, str)
-                            and value == ""
-                            and default_value is not None
-                        )
-                    ):
-                        if default_value is not None:
-                            value = default_value
-                        else:
-                            return None
-
-                    # Apply type conversion if specified
-                    converted_value = TemplateParser.convert_value(value, type_hint)
-
-                    # Return the typed value directly for JSON types (int, float, bool)
-                    if (
-                        type_hint in ("int", "float", "bool")
-                        and converted_value is not None
-                    ):
-                        return converted_value
-
-                    # For other types or no type hint, return as string
-                    if converted_value is None:
-                        return None
-                    return (
-                        str(converted_value)
-                        if not isinstance(converted_value, str)
-                        else converted_value
-                    )
-
-            # Multiple placeholders or mixed content: replace in string
-            for placeholder_text in placeholders:
-                # Parse the placeholder to extract name, type, and default
-                name, type_hint, default_value = TemplateParser.parse_placeholder(
-                    placeholder_text
-                )
+    @staticmethod
+    def _record_factory(
+        keys: List[str], strategy: str = "include"
+    ) -> Callable[[Tuple[Any, ...]], Dict[str, Any]]:
+        """
+        Build a function turning a row of values into a JSON object.
 
-                # Get value from row_data
-                value = row_data.get(name)
-
-                # Handle None/null/empty values
-                # Treat empty string as None if default is specified
-                if (
-                    value is None
-                    or pd.isna(value)
-                    or (
-                        isinstance(value, str)
-                        and value == ""
-                        and default_value is not None
-                    )
-                ):
-                    if default_value is not None:
-                        value = default_value
-                    else:
-                        value = None
-
-                # Apply type conversion if specified
-                converted_value = TemplateParser.convert_value(value, type_hint)
-
-                # Replace placeholder with value
-                placeholder_full = f"{{{placeholder_text}}}"
-                if converted_value is None:
-                    # Replace with empty string
-                    result = result.replace(placeholder_full, "")
-                else:
-                    result = result.replace(placeholder_full, str(converted_value))
+        The result matches applying _handle_null_values to
+        dict(zip(keys, values)), without the intermediate dictionary.
 
-            return result
+        Args:
+            keys: Output keys, in column order
+            strategy: Null handling strategy ("include", "exclude", "default")
 
-        else:
-            # Return other types as-is (numbers, booleans, None)
-            return template_obj
+        Returns:
+            Function mapping a value tuple to a dictionary
+        """
+        if strategy == "exclude" and len(set(keys)) < len(keys):
+            # Repeated keys keep their last value, so filter after merging
+            return lambda values: {
+                key: value
+                for key, value in dict(zip(keys, values)).items()
+                if value is not None
+            }
+        if strategy == "exclude":
+            return lambda values: {
+                key: value for key, value in zip(keys, values) if value is not None
+            }
+        if strategy == "default":
+            return lambda values: {
+                key: "" if value is None else value for key, value in zip(keys, values)
+            }
+        if strategy != "include":
+            logger.warning(
+                f"Invalid null_handling strategy: {strategy}, using 'include'"
+            )
+        return lambda values: dict(zip(keys, values))
 
     def _handle_null_values(
         self, data_dict: Dict[str, Any], strategy: str = "include"
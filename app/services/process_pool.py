@@ -0,0 +1,443 @@
+"""
+Process Pool Module
+
+This module runs CPU-bound Excel jobs (parse, transform, write) in a shared
+process pool so that pandas/openpyxl work holding the GIL in one request
+does not stall every other request served by the same worker.
+
+Job functions are top-level so they can be pickled. Each job receives the
+application Config and builds the service it needs inside the child process;
+only file paths and small parameters cross the process boundary.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from app.core.config import Config
+from app.core.exceptions import ValidationError
+from app.models.request import (
+    AutoIncrementConfig,
+    NormalizationConfig,
+    SQLGenerationRequest,
+)
+from app.services.binding_service import BindingService
+from app.services.excel_service import ExcelService
+from app.services.json_generation_service import JSONGenerationService
+from app.services.normalization_service import NormalizationService
+from app.services.sql_generation_service import SQLGenerationService
+
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_cpu_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating it on first use.
+
+    Args:
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        The shared ProcessPoolExecutor
+    """
+    global _cpu_pool
+    if _cpu_pool is None:
+        with _cpu_pool_lock:
+            if _cpu_pool is None:
+                _cpu_pool = ProcessPoolExecutor(
+                    max_workers=max_workers or os.cpu_count()
+                )
+    return _cpu_pool
+
+
+def run_cpu_bound(config: Config, job: Callable[..., Any], **kwargs: Any) -> Any:
+    """
+    Run a job in the process pool and wait for its result.
+
+    Setting ``excel.process_pool_workers`` to 0 runs the job inline in the
+    calling process instead.
+
+    Args:
+        config: Application configuration passed to the job
+        job: Top-level job function taking the config as first argument
+        **kwargs: Keyword arguments forwarded to the job
+
+    Returns:
+        The job's return value
+
+    Raises:
+        Any exception raised by the job
+    """
+    max_workers = config.get("excel.process_pool_workers")
+    if max_workers == 0:
+        return job(config, **kwargs)
+    return _get_pool(max_workers).submit(job, config, **kwargs).result()
+
+
+def extract_columns_to_file(
+    config: Config,
+    file_path: str,
+    columns: List[str],
+    output_path: str,
+    remove_duplicates: bool = False,
+) -> str:
+    """
+    Read an Excel file and write the selected columns to a new file.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        columns: Column names to extract
+        output_path: Path for the output Excel file
+        remove_duplicates: Whether to drop duplicate rows
+
+    Returns:
+        Path to the written file
+    """
+    service = ExcelService(config)
+    return service.extract_columns_to_file(
+        data=service.read_excel(file_path),
+        columns=columns,
+        output_path=output_path,
+        remove_duplicates=remove_duplicates,
+    )
+
+
+def map_columns_to_file(
+    config: Config, file_path: str, mapping: Dict[str, Any], output_path: str
+) -> str:
+    """
+    Read an Excel file, apply a column mapping and write the result.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        mapping: Column mapping rules
+        output_path: Path for the output Excel file
+
+    Returns:
+        Path to the written file
+    """
+    service = ExcelService(config)
+    mapped_df = service.apply_column_mapping(service.read_excel(file_path), mapping)
+    return service.write_excel(mapped_df, output_path)
+
+
+def bind_single_key(config: Config, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Run BindingService.bind_excel_single_key.
+
+    Args:
+        config: Application configuration
+        **kwargs: Arguments for bind_excel_single_key
+
+    Returns:
+        Binding result dictionary
+    """
+    return BindingService(config).bind_excel_single_key(**kwargs)
+
+
+def bind_multi_key(config: Config, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Run BindingService.bind_excel_multi_key.
+
+    Args:
+        config: Application configuration
+        **kwargs: Arguments for bind_excel_multi_key
+
+    Returns:
+        Binding result dictionary
+    """
+    return BindingService(config).bind_excel_multi_key(**kwargs)
+
+
+def bind_data(config: Config, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Run BindingService.bind_data.
+
+    Args:
+        config: Application configuration
+        **kwargs: Arguments for bind_data
+
+    Returns:
+        Binding result dictionary
+    """
+    return BindingService(config).bind_data(**kwargs)
+
+
+def _select_columns(
+    data: pd.DataFrame, columns: Optional[List[str]], remove_duplicates: bool = False
+) -> pd.DataFrame:
+    """
+    Keep the requested columns and optionally drop duplicate rows.
+
+    Args:
+        data: Source DataFrame
+        columns: Columns to keep (all columns when empty)
+        remove_duplicates: Whether to drop duplicate rows
+
+    Returns:
+        The selected DataFrame
+
+    Raises:
+        ValidationError: If a requested column does not exist
+    """
+    if columns:
+        missing_columns = list(pd.Index(columns).difference(data.columns, sort=False))
+        if missing_columns:
+            raise ValidationError(f"Columns not found: {', '.join(missing_columns)}")
+        data = data[columns]
+    if remove_duplicates:
+        data = data.drop_duplicates()
+    return data
+
+
+def _require_columns(data: pd.DataFrame, columns: Iterable[str]) -> None:
+    """
+    Check that columns read with usecols exist in the sheet.
+
+    read_excel drops usecols names the sheet does not have, so a mapping
+    naming only missing columns would otherwise read a frame with no columns
+    and be exported as an empty JSON array.
+
+    Args:
+        data: DataFrame read with usecols
+        columns: Column names the caller requested
+
+    Raises:
+        ValidationError: If a requested column does not exist
+    """
+    missing_columns = list(pd.Index(list(columns)).difference(data.columns, sort=False))
+    if missing_columns:
+        raise ValidationError(
+            f"Columns not found in data: {', '.join(missing_columns)}"
+        )
+
+
+def generate_json_file(
+    config: Config,
+    file_path: str,
+    output_path: str,
+    columns: List[str],
+    column_mapping: Dict[str, str],
+    **options: Any,
+) -> Dict[str, Any]:
+    """
+    Read an Excel file and write it out as JSON with a column mapping.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        output_path: Path for the output JSON file
+        columns: Columns to extract (all columns when empty)
+        column_mapping: Map of Excel columns to JSON keys (identity when empty)
+        **options: Remaining JSONGenerationService.generate_json arguments
+
+    Returns:
+        Generation result dictionary
+    """
+    data = ExcelService(config).read_excel_cached(
+        file_path, usecols=columns or list(column_mapping) or None
+    )
+    data = _select_columns(data, columns)
+    _require_columns(data, column_mapping)
+    if not column_mapping:
+        column_mapping = {col: col for col in data.columns}
+    return JSONGenerationService(config).generate_json(
+        data=data, column_mapping=column_mapping, output_path=output_path, **options
+    )
+
+
+def generate_json_with_template_file(
+    config: Config,
+    file_path: str,
+    output_path: str,
+    template: str,
+    column_mapping: Dict[str, str],
+    **options: Any,
+) -> Dict[str, Any]:
+    """
+    Read an Excel file and write it out as JSON using a template.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        output_path: Path for the output JSON file
+        template: JSON template string
+        column_mapping: Map of placeholders to Excel columns
+        **options: Remaining generate_json_with_template arguments
+
+    Returns:
+        Generation result dictionary
+    """
+    data = ExcelService(config).read_excel_cached(
+        file_path, usecols=column_mapping.values()
+    )
+    _require_columns(data, column_mapping.values())
+    return JSONGenerationService(config).generate_json_with_template(
+        data=data,
+        template=template,
+        column_mapping=column_mapping,
+        output_path=output_path,
+        **options,
+    )
+
+
+def generate_sql(
+    config: Config, file_path: str, sql_request: SQLGenerationRequest
+) -> Dict[str, Any]:
+    """
+    Read an Excel file and generate SQL statements in memory.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        sql_request: SQL generation request configuration
+
+    Returns:
+        SQL generation result dictionary
+    """
+    data = ExcelService(config).read_excel_cached(
+        file_path, usecols=sql_request.column_mapping.values()
+    )
+    return SQLGenerationService(config).generate_sql(data, sql_request)
+
+
+def generate_sql_file(
+    config: Config, file_path: str, sql_request: SQLGenerationRequest, output_path: str
+) -> Dict[str, Any]:
+    """
+    Stream an Excel file into a SQL file in batch_size chunks.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        sql_request: SQL generation request configuration
+        output_path: Path for the output SQL file
+
+    Returns:
+        Dictionary with output path and row/statement counts
+    """
+    chunks = ExcelService(config).iter_excel(
+        file_path, sql_request.batch_size, usecols=sql_request.column_mapping.values()
+    )
+    return SQLGenerationService(config).generate_sql_stream(
+        chunks, sql_request, output_path
+    )
+
+
+def generate_sql_text_file(
+    config: Config,
+    file_path: str,
+    sql_request: SQLGenerationRequest,
+    output_path: str,
+    columns: List[str],
+    usecols: Optional[List[str]] = None,
+    remove_duplicates: bool = False,
+) -> str:
+    """
+    Read an Excel file, generate SQL statements and export them to a file.
+
+    Unless rows are deduplicated (remove_duplicates or sql.auto_dedup),
+    which needs the whole sheet at once, the sheet is streamed in
+    batch_size chunks so memory stays bounded by the batch rather than
+    the file.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        sql_request: SQL generation request configuration
+        output_path: Path for the output text file
+        columns: Columns to extract (all columns when empty)
+        usecols: Columns to read from the sheet (all when None)
+        remove_duplicates: Whether to drop duplicate rows
+
+    Returns:
+        Path to the written file
+    """
+    service = SQLGenerationService(config)
+    if not (remove_duplicates or service.auto_dedup):
+        chunks = ExcelService(config).iter_excel(
+            file_path, sql_request.batch_size, usecols=usecols
+        )
+        selected = (_select_columns(chunk, columns) for chunk in chunks)
+        return service.generate_sql_stream(selected, sql_request, output_path)[
+            "output_path"
+        ]
+
+    data = ExcelService(config).read_excel_cached(file_path, usecols=usecols)
+    data = _select_columns(data, columns, remove_duplicates)
+    result = service.generate_sql(data, sql_request)
+    return service.export_sql(result["statements"], output_path)
+
+
+def generate_custom_sql_file(
+    config: Config,
+    file_path: str,
+    output_path: str,
+    template: str,
+    column_mapping: Dict[str, str],
+    auto_increment: AutoIncrementConfig,
+    columns: List[str],
+    sheet_name: Optional[str] = None,
+    usecols: Optional[List[str]] = None,
+    remove_duplicates: bool = False,
+) -> str:
+    """
+    Read an Excel file, render a custom SQL template per row and export it.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        output_path: Path for the output text file
+        template: SQL template with placeholders
+        column_mapping: Map of placeholders to Excel columns
+        auto_increment: Auto-increment configuration
+        columns: Columns to extract (all columns when empty)
+        sheet_name: Optional specific sheet name to read
+        usecols: Columns to read from the sheet (all when None)
+        remove_duplicates: Whether to drop duplicate rows
+
+    Returns:
+        Path to the written file
+    """
+    data = ExcelService(config).read_excel_cached(
+        file_path, sheet_name=sheet_name, usecols=usecols
+    )
+    data = _select_columns(data, columns, remove_duplicates)
+    service = SQLGenerationService(config)
+    statements = service.generate_custom_sql(
+        data, template, column_mapping, auto_increment
+    )
+    return service.export_sql(statements, output_path)
+
+
+def normalize_to_file(
+    config: Config,
+    file_path: str,
+    normalizations: List[NormalizationConfig],
+    output_path: str,
+) -> Dict[str, Any]:
+    """
+    Read an Excel file, apply normalizations and write the result.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the uploaded Excel file
+        normalizations: Normalization configurations to apply
+        output_path: Path for the output Excel file
+
+    Returns:
+        Normalization report
+    """
+    excel_service = ExcelService(config)
+    data = excel_service.read_excel_cached(file_path)
+    normalized_data, report = NormalizationService(config).normalize(
+        data, normalizations
+    )
+    excel_service.write_excel(normalized_data, output_path)
+    return report
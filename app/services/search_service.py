@@ -125,25 +125,25 @@ class SearchService:
 
         # String operators
         if operator == "equals":
-            return column_data.astype(str) == str(value)
+            return self._as_text(column_data) == str(value)
         elif operator == "not_equals":
-            return column_data.astype(str) != str(value)
+            return self._as_text(column_data) != str(value)
         elif operator == "contains":
-            return column_data.astype(str).str.contains(
+            return self._as_text(column_data).str.contains(
                 str(value), case=False, na=False
             )
         elif operator == "not_contains":
-            return ~column_data.astype(str).str.contains(
+            return ~self._as_text(column_data).str.contains(
                 str(value), case=False, na=False
             )
         elif operator == "starts_with":
-            return column_data.astype(str).str.startswith(str(value), na=False)
+            return self._as_text(column_data).str.startswith(str(value), na=False)
         elif operator == "ends_with":
-            return column_data.astype(str).str.endswith(str(value), na=False)
+            return self._as_text(column_data).str.endswith(str(value), na=False)
         elif operator == "is_empty":
-            return (column_data.astype(str) == "") | (column_data.isna())
+            return (self._as_text(column_data) == "") | (column_data.isna())
         elif operator == "is_not_empty":
-            return (column_data.astype(str) != "") & (~column_data.isna())
+            return (self._as_text(column_data) != "") & (~column_data.isna())
 
         # Numeric operators
         elif operator == "greater_than":
@@ -192,6 +192,27 @@ class SearchService:
         else:
             raise ValidationError(f"Unsupported operator: {operator}")
 
+    @staticmethod
+    def _as_text(column_data: pd.Series) -> pd.Series:
+        """
+        Return a column as strings for the string operators.
+
+        Columns that already use a string dtype (including Arrow-backed
+        strings) and hold no missing values are returned as-is, so the
+        comparison runs directly on the string kernels without a copy.
+
+        Args:
+            column_data: Column to convert
+
+        Returns:
+            Series of strings
+        """
+        dtype = column_data.dtype
+        if dtype != object and pd.api.types.is_string_dtype(dtype):
+            if not column_data.hasnans:
+                return column_data
+        return column_data.astype(str)
+
     @staticmethod
     def get_operator_suggestions(column_type: str) -> List[str]:
         """
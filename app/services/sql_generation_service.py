@@ -6,16 +6,22 @@ with support for multiple database types and auto-increment columns.
 """
 
 import os
-from typing import Any, Dict, List, Optional
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from datetime import datetime
 import pandas as pd
 
 from app.core.config import Config
-from app.core.exceptions import SQLGenerationError
+from app.core.exceptions import (
+    FileProcessingError,
+    SQLGenerationError,
+    ValidationError,
+)
 from app.core.logging import get_logger
 from app.models.enums import DatabaseType, SQLAutoIncrementType
 from app.models.request import SQLGenerationRequest, AutoIncrementConfig
 from app.builders.sql_builder import SQLBuilder
+from app.utils.file_utils import FileUtils
 from app.utils.template_parser import TemplateParser
 
 logger = get_logger(__name__)
@@ -50,6 +56,8 @@ class SQLGenerationService:
         self.output_folder = config.get("file.output_folder", "outputs")
         self.default_batch_size = config.get("sql.default_batch_size", 1000)
         self.include_transaction = config.get("sql.include_transaction", True)
+        self.auto_dedup = config.get("sql.auto_dedup", False)
+        self.multi_row_inserts = config.get("sql.multi_row_inserts", False)
 
         os.makedirs(self.output_folder, exist_ok=True)
 
@@ -59,6 +67,10 @@ class SQLGenerationService:
         """
         Generate SQL statements from DataFrame.
 
+        When sql.auto_dedup is enabled, identical rows are dropped first so
+        each distinct row produces one INSERT. When sql.multi_row_inserts is
+        enabled, each INSERT covers up to request.batch_size rows.
+
         Args:
             data: Source DataFrame
             request: SQL generation request configuration
@@ -74,32 +86,12 @@ class SQLGenerationService:
         )
 
         try:
-            # Parse database type
-            db_type = DatabaseType.from_string(request.database_type)
-
-            # Configure SQL builder
-            builder = SQLBuilder()
-            builder.with_table_name(request.table_name)
-            builder.with_database_type(db_type)
-            builder.with_column_mapping(request.column_mapping)
-            builder.with_transaction(request.include_transaction)
-            builder.with_batch_size(request.batch_size)
-
-            # Configure auto-increment if specified
-            if request.auto_increment and request.auto_increment.enabled:
-                auto_config = request.auto_increment
-                increment_type = SQLAutoIncrementType(auto_config.increment_type)
-
-                builder.with_auto_increment(
-                    column_name=auto_config.column_name,
-                    increment_type=increment_type,
-                    start_value=auto_config.start_value,
-                    sequence_name=auto_config.sequence_name,
-                )
+            if self.auto_dedup:
+                original_count = len(data)
+                data = data.drop_duplicates()
+                logger.info(f"Removed {original_count - len(data)} duplicate rows")
 
-            # Set custom template if provided
-            if request.template:
-                builder.with_template(request.template)
+            builder = self._configure_builder(request)
 
             # Generate SQL statements
             statements = builder.build_with_header(data)
@@ -121,6 +113,153 @@ class SQLGenerationService:
             logger.error(f"Error generating SQL: {str(e)}")
             raise SQLGenerationError(f"Failed to generate SQL: {str(e)}")
 
+    def generate_sql_stream(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        request: SQLGenerationRequest,
+        output_path: str,
+    ) -> Dict[str, Any]:
+        """
+        Generate SQL statements chunk by chunk and write them to a file.
+
+        Only one chunk and its statements are held in memory at a time. The
+        statements are spooled to a temporary file next to the output, then
+        copied behind the header once the row count is known. The file has
+        the same content as export_sql(generate_sql(...)["statements"]);
+        with sql.multi_row_inserts, each chunk gets its own INSERTs, so
+        chunks should hold request.batch_size rows.
+
+        Args:
+            chunks: DataFrames holding consecutive rows of the source data
+            request: SQL generation request configuration
+            output_path: Path for the output file
+
+        Returns:
+            Dictionary with output path and row/statement counts
+
+        Raises:
+            FileProcessingError: If reading a chunk fails
+            ValidationError: If a chunk fails validation
+            SQLGenerationError: If SQL generation fails
+        """
+        logger.info(f"Streaming SQL for table '{request.table_name}'")
+
+        try:
+            builder = self._configure_builder(request)
+            total_rows = 0
+            total_inserts = 0
+
+            spool_dir = os.path.dirname(output_path) or "."
+            with tempfile.TemporaryFile(dir=spool_dir) as spool:
+                for chunk in chunks:
+                    inserts = builder.build_inserts(chunk)
+                    if inserts:
+                        spool.write(("\n".join(inserts) + "\n").encode("utf-8"))
+                    total_rows += len(chunk)
+                    total_inserts += len(inserts)
+
+                lines = builder.build_header(total_rows)
+                start = builder.build_transaction_start()
+                end = builder.build_transaction_end()
+                if start is not None:
+                    lines.append(start)
+                total_statements = len(lines) + total_inserts + (end is not None)
+
+                with open(output_path, "wb") as f:
+                    f.write(self._export_header(total_statements).encode("utf-8"))
+                    f.write(("\n".join(lines) + "\n").encode("utf-8"))
+                    spool.seek(0)
+                    FileUtils.copy_stream(spool, f)
+                    if end is not None:
+                        f.write(f"{end}\n".encode("utf-8"))
+
+            logger.info(f"Streamed {total_statements} SQL statements")
+            return {
+                "output_path": output_path,
+                "total_rows": total_rows,
+                "total_statements": total_statements,
+            }
+
+        except (FileProcessingError, ValidationError):
+            raise
+        except Exception as e:
+            logger.error(f"Error generating SQL: {str(e)}")
+            raise SQLGenerationError(f"Failed to generate SQL: {str(e)}")
+
+    @staticmethod
+    def _iter_row_values(
+        data: pd.DataFrame, columns: List[str]
+    ) -> Iterator[Sequence[Any]]:
+        """
+        Yield the values of the given columns for each row of a DataFrame.
+
+        String columns are read column-wise, which avoids building a Series
+        per row. Other data goes through iterrows so values keep the types
+        row access gives them.
+
+        Args:
+            data: Source DataFrame
+            columns: Columns to read, in order
+
+        Returns:
+            Iterator over per-row value sequences
+        """
+        if all(
+            pd.api.types.infer_dtype(data[column], skipna=False) in ("string", "empty")
+            for column in columns
+        ):
+            if not columns:
+                return iter([()] * len(data))
+            return zip(*(data[column].tolist() for column in columns))
+        return ([row[column] for column in columns] for _, row in data.iterrows())
+
+    @staticmethod
+    def _export_header(total_statements: int) -> str:
+        """Build the comment header written at the top of exported SQL files."""
+        return (
+            f"-- Generated by Pycelize\n"
+            f"-- Generated at: {datetime.now().isoformat()}\n"
+            f"-- Total statements: {total_statements}\n\n"
+        )
+
+    def _configure_builder(self, request: SQLGenerationRequest) -> SQLBuilder:
+        """
+        Create a SQLBuilder configured for a generation request.
+
+        Args:
+            request: SQL generation request configuration
+
+        Returns:
+            Configured SQLBuilder
+        """
+        db_type = DatabaseType.from_string(request.database_type)
+
+        builder = SQLBuilder()
+        builder.with_table_name(request.table_name)
+        builder.with_database_type(db_type)
+        builder.with_column_mapping(request.column_mapping)
+        builder.with_transaction(request.include_transaction)
+        builder.with_batch_size(request.batch_size)
+        builder.with_multi_row_inserts(self.multi_row_inserts)
+
+        # Configure auto-increment if specified
+        if request.auto_increment and request.auto_increment.enabled:
+            auto_config = request.auto_increment
+            increment_type = SQLAutoIncrementType(auto_config.increment_type)
+
+            builder.with_auto_increment(
+                column_name=auto_config.column_name,
+                increment_type=increment_type,
+                start_value=auto_config.start_value,
+                sequence_name=auto_config.sequence_name,
+            )
+
+        # Set custom template if provided
+        if request.template:
+            builder.with_template(request.template)
+
+        return builder
+
     def export_sql(
         self, statements: List[str], output_path: str, add_header: bool = True
     ) -> str:
@@ -141,14 +280,13 @@ class SQLGenerationService:
         try:
             logger.info(f"Exporting SQL to: {output_path}")
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                if add_header:
-                    f.write(f"-- Generated by Pycelize\n")
-                    f.write(f"-- Generated at: {datetime.now().isoformat()}\n")
-                    f.write(f"-- Total statements: {len(statements)}\n\n")
+            header = self._export_header(len(statements)) if add_header else ""
+            body = "\n".join(statements) + "\n" if statements else ""
 
-                for statement in statements:
-                    f.write(f"{statement}\n")
+            # Assemble the file once and hand it to the kernel in one write
+            # instead of one buffered write per statement
+            with open(output_path, "wb") as f:
+                f.write((header + body).encode("utf-8"))
 
             logger.info(f"Successfully exported {len(statements)} statements")
             return output_path
@@ -157,7 +295,8 @@ class SQLGenerationService:
             logger.error(f"Error exporting SQL: {str(e)}")
             raise SQLGenerationError(f"Failed to export SQL: {str(e)}")
 
-    def get_supported_databases(self) -> List[str]:
+    @staticmethod
+    def get_supported_databases() -> List[str]:
         """Get list of supported database types."""
         return [db.value for db in DatabaseType]
 
@@ -237,11 +376,11 @@ class SQLGenerationService:
                     )
                 )
 
-            for idx, row in data.iterrows():
+            placeholder_names = list(column_mapping)
+            row_values = self._iter_row_values(data, list(column_mapping.values()))
+            for values in row_values:
                 # Build data dictionary for this row
-                row_data = {}
-                for placeholder, column in column_mapping.items():
-                    row_data[placeholder] = row[column]
+                row_data = dict(zip(placeholder_names, values))
 
                 # Add special placeholders
                 if auto_increment and auto_increment.enabled:
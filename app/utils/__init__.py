@@ -6,6 +6,18 @@ This module contains utility functions and helper classes.
 
 from app.utils.file_utils import FileUtils
 from app.utils.validators import Validators
-from app.utils.helpers import generate_output_filename
+from app.utils.helpers import (
+    as_bool,
+    generate_output_filename,
+    json_response,
+    parse_json_field,
+)
 
-__all__ = ["FileUtils", "Validators", "generate_output_filename"]
+__all__ = [
+    "FileUtils",
+    "Validators",
+    "as_bool",
+    "generate_output_filename",
+    "json_response",
+    "parse_json_field",
+]
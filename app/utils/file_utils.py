@@ -4,13 +4,32 @@ File Utility Functions
 This module provides utility functions for file operations.
 """
 
+import io
 import os
+import shutil
+import string
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional, Set, Tuple
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
 from app.models.enums import FileType
 
+# Shared pool for writing multi-file uploads concurrently
+_save_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upload-save")
+
+# Directories already created by ensure_directory in this process
+_ensured_directories: Set[str] = set()
+
+# Bytes requested per copy_file_range call in copy_stream
+_COPY_RANGE_SIZE = 1 << 26
+
+# Deletes every character secure_filename keeps unchanged
+_DROP_SAFE_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
+
 
 class FileUtils:
     """
@@ -63,29 +82,226 @@ class FileUtils:
         return ext in [e.lower() for e in allowed_extensions]
 
     @staticmethod
-    def secure_save_path(filename: str, upload_folder: str) -> str:
+    def secure_filename(filename: str) -> str:
+        """
+        Sanitize a filename the same way as werkzeug.utils.secure_filename.
+
+        Names made only of ASCII letters, digits, "_", "." and "-" need no
+        Unicode normalization or regex pass, only the leading/trailing dot
+        and underscore strip, so they skip werkzeug's slower path.
+
+        Args:
+            filename: Filename sent by the client
+
+        Returns:
+            Sanitized filename, possibly empty
+        """
+        if (
+            os.name != "nt"
+            and filename.isascii()
+            and not filename.translate(_DROP_SAFE_CHARS)
+        ):
+            return filename.strip("._")
+        return secure_filename(filename)
+
+    @staticmethod
+    def secure_save_path(
+        filename: str, upload_folder: str, already_sanitized: bool = False
+    ) -> str:
         """
         Generate a secure file path for saving.
 
         Args:
             filename: Original filename
             upload_folder: Target folder for upload
+            already_sanitized: Skip secure_filename when the caller has
+                already passed the name through it
 
         Returns:
             Full secure path for the file
         """
-        secure_name = secure_filename(filename)
+        secure_name = (
+            filename if already_sanitized else FileUtils.secure_filename(filename)
+        )
         return os.path.join(upload_folder, secure_name)
 
+    @staticmethod
+    def save_upload(
+        file_storage: FileStorage, dest_path: str, chunk_size: int = 1 << 20
+    ) -> str:
+        """
+        Save an uploaded file to disk.
+
+        When the upload has been spooled to a named temporary file on the
+        same filesystem, the file is hard-linked into place without copying
+        any bytes. Small uploads held in memory are written with a single
+        write call. Otherwise the stream is copied in large chunks.
+
+        Args:
+            file_storage: Uploaded file from request.files
+            dest_path: Destination path for the file
+            chunk_size: Copy buffer size in bytes
+
+        Returns:
+            The destination path
+        """
+        stream = file_storage.stream
+        src_name = getattr(stream, "name", None)
+
+        if isinstance(src_name, str) and os.path.isfile(src_name):
+            try:
+                stream.flush()
+                if os.path.lexists(dest_path):
+                    os.remove(dest_path)
+                os.link(src_name, dest_path)
+                return dest_path
+            except OSError:
+                pass
+
+        if isinstance(stream, io.BytesIO):
+            start = stream.tell()
+            with stream.getbuffer() as view, open(dest_path, "wb") as dst:
+                dst.write(view[start:])
+            stream.seek(0, io.SEEK_END)
+            return dest_path
+
+        with open(dest_path, "wb", buffering=0) as dst:
+            shutil.copyfileobj(stream, dst, length=chunk_size)
+        return dest_path
+
+    @staticmethod
+    def copy_stream(src: BinaryIO, dst: BinaryIO, chunk_size: int = 1 << 20) -> None:
+        """
+        Copy the rest of one file into another from their current positions.
+
+        When both sides are OS files the bytes are moved in the kernel with
+        os.copy_file_range, without passing through user-space buffers.
+        Streams without a file descriptor, platforms without the syscall and
+        filesystems that reject it fall back to shutil.copyfileobj.
+
+        Args:
+            src: Readable binary file
+            dst: Writable binary file
+            chunk_size: Buffer size in bytes for the fallback copy
+        """
+        try:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            src_fd = dst_fd = None
+
+        if src_fd is not None and hasattr(os, "copy_file_range"):
+            dst.flush()
+            src_offset, dst_offset = src.tell(), dst.tell()
+            try:
+                while True:
+                    copied = os.copy_file_range(
+                        src_fd, dst_fd, _COPY_RANGE_SIZE, src_offset, dst_offset
+                    )
+                    if not copied:
+                        break
+                    src_offset += copied
+                    dst_offset += copied
+            except OSError:
+                pass
+            # Explicit offsets leave the descriptors' positions untouched
+            src.seek(src_offset)
+            dst.seek(dst_offset)
+
+        shutil.copyfileobj(src, dst, chunk_size)
+
+    @staticmethod
+    def save_uploads(*uploads: Tuple[FileStorage, str]) -> List[str]:
+        """
+        Save several uploaded files to disk concurrently.
+
+        The writes are I/O-bound and release the GIL, so independent files
+        are saved in parallel on a shared thread pool.
+
+        Args:
+            *uploads: (file_storage, dest_path) pairs
+
+        Returns:
+            The destination paths, in argument order
+        """
+        if len(uploads) < 2 or len({dest for _, dest in uploads}) < len(uploads):
+            # A single file gains nothing from the pool; the same destination
+            # twice keeps the sequential last-write-wins order
+            return [FileUtils.save_upload(*upload) for upload in uploads]
+
+        futures = [
+            _save_pool.submit(FileUtils.save_upload, file_storage, dest_path)
+            for file_storage, dest_path in uploads
+        ]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    @contextmanager
+    def staged_uploads(
+        upload_folder: str, *file_storages: FileStorage
+    ) -> Iterator[List[str]]:
+        """
+        Save uploads under unique temporary names for the duration of a block.
+
+        Each upload gets its own mkstemp name (keeping the original
+        extension) so concurrent requests and same-named uploads never
+        collide. The files are removed when the block exits, even on error.
+
+        Args:
+            upload_folder: Folder to stage the files in
+            *file_storages: Uploaded files from request.files
+
+        Yields:
+            The staged file paths, in argument order
+        """
+        paths: List[str] = []
+        try:
+            for file_storage in file_storages:
+                fd, path = tempfile.mkstemp(
+                    suffix=Path(file_storage.filename or "").suffix,
+                    dir=upload_folder,
+                )
+                os.close(fd)
+                paths.append(path)
+            FileUtils.save_uploads(*zip(file_storages, paths))
+            yield paths
+        finally:
+            for path in paths:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    @contextmanager
+    def staged_upload(file_storage: FileStorage, upload_folder: str) -> Iterator[str]:
+        """
+        Save one upload under a unique temporary name for the duration of a block.
+
+        Args:
+            file_storage: Uploaded file from request.files
+            upload_folder: Folder to stage the file in
+
+        Yields:
+            The staged file path
+        """
+        with FileUtils.staged_uploads(upload_folder, file_storage) as (path,):
+            yield path
+
     @staticmethod
     def ensure_directory(path: str) -> None:
         """
         Ensure a directory exists, creating it if necessary.
 
+        Directories ensured once are remembered for the life of the
+        process, so repeat calls skip the stat/mkdir syscalls.
+
         Args:
             path: Directory path to ensure
         """
+        if path in _ensured_directories:
+            return
         os.makedirs(path, exist_ok=True)
+        _ensured_directories.add(path)
 
     @staticmethod
     def get_file_size(file_path: str) -> int:
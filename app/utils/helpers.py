@@ -6,8 +6,19 @@ This module provides general helper functions used throughout the application.
 
 import os
 import uuid
-from datetime import datetime
-from typing import Optional
+from time import time_ns
+from typing import Any, Dict, List, Optional
+
+import orjson
+from flask import Response
+
+from app.core.exceptions import ValidationError
+
+# orjson options matching what jsonify accepts: numpy scalars and non-string keys
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Form values accepted as a true boolean flag (compared case-insensitively)
+_TRUTHY = frozenset(("true", "1", "yes", "on", "t", "y"))
 
 
 def generate_output_filename(
@@ -24,14 +35,14 @@ def generate_output_filename(
     Returns:
         Generated output filename
     """
-    base_name = os.path.splitext(original_filename)[0]
-    original_ext = os.path.splitext(original_filename)[1]
+    base_name, original_ext = os.path.splitext(original_filename)
 
     new_ext = extension if extension else original_ext
     if not new_ext.startswith("."):
         new_ext = f".{new_ext}"
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Nanosecond hex stamp: unique across concurrent requests, no strftime
+    timestamp = f"{time_ns():x}"
 
     if suffix:
         return f"{base_name}_{suffix}_{timestamp}{new_ext}"
@@ -60,3 +71,104 @@ def sanitize_string(value: str) -> str:
     """
     # Remove potentially dangerous characters
     return value.replace("\x00", "").strip()
+
+
+def as_bool(value: Optional[str], default: bool = False) -> bool:
+    """
+    Interpret a form or query string value as a boolean flag.
+
+    Args:
+        value: Raw value, or None when the field was not sent
+        default: Result when the field was not sent
+
+    Returns:
+        True for "true", "1", "yes", "on", "t" or "y" in any case, else False
+    """
+    if value is None:
+        return default
+    # Clients almost always send an exact spelling; skip the normalizing copies
+    if value in _TRUTHY:
+        return True
+    return value.strip().lower() in _TRUTHY
+
+
+def parse_json_field(name: str, raw: str) -> Any:
+    """
+    Parse a JSON form field, reporting malformed input as a validation error.
+
+    Args:
+        name: Form field name used in the error message
+        raw: Raw field value
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValidationError: If the value is not valid JSON
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise ValidationError(f"Invalid {name} JSON: {str(e)}")
+
+
+def parse_column_list(name: str, raw: str) -> List[str]:
+    """
+    Parse a JSON form field holding a list of column names.
+
+    Args:
+        name: Form field name used in the error message
+        raw: Raw field value
+
+    Returns:
+        List of column names
+
+    Raises:
+        ValidationError: If the value is not a JSON array of strings
+    """
+    value = parse_json_field(name, raw)
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValidationError(f"{name} must be a JSON array of column names")
+    return value
+
+
+def parse_column_mapping(name: str, raw: str) -> Dict[str, str]:
+    """
+    Parse a JSON form field holding a mapping of names to column names.
+
+    Args:
+        name: Form field name used in the error message
+        raw: Raw field value
+
+    Returns:
+        Mapping of names to column names
+
+    Raises:
+        ValidationError: If the value is not a JSON object of strings
+    """
+    value = parse_json_field(name, raw)
+    if not isinstance(value, dict) or not all(
+        isinstance(column, str) for column in value.values()
+    ):
+        raise ValidationError(f"{name} must be a JSON object of column names")
+    return value
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """
+    Serialize a payload to a JSON response with orjson.
+
+    Drop-in replacement for flask.jsonify on the hot API paths.
+
+    Args:
+        payload: JSON-serializable response body
+        status_code: HTTP status code
+
+    Returns:
+        Flask Response with an application/json body
+    """
+    return Response(
+        orjson.dumps(payload, option=_ORJSON_OPTIONS),
+        status=status_code,
+        mimetype="application/json",
+    )
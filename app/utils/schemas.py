@@ -0,0 +1,110 @@
+"""
+Request Payload Schemas
+
+This module defines JSON Schemas for the parsed form payloads of the
+Excel endpoints. Schemas are compiled once at import time with
+fastjsonschema so each request runs a single generated validator
+function instead of hand-written checks.
+
+Each property schema carries a ``message`` keyword holding the
+human-readable error returned to the client when that property fails.
+"""
+
+from typing import Any, Callable, Dict
+
+import fastjsonschema
+
+from app.core.exceptions import ValidationError
+
+
+_NON_EMPTY_STRING_ARRAY = {"type": "array", "items": {"type": "string"}, "minItems": 1}
+
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "extract_columns": {
+        "type": "object",
+        "properties": {
+            "columns": {
+                "type": "array",
+                "minItems": 1,
+                "message": "No columns specified for extraction",
+            },
+        },
+    },
+    "map_columns": {
+        "type": "object",
+        "properties": {
+            "mapping": {
+                "type": "object",
+                "minProperties": 1,
+                "message": "No column mapping provided",
+            },
+        },
+    },
+    "bind_single_key": {
+        "type": "object",
+        "properties": {
+            "comparison_column": {
+                "type": "string",
+                "minLength": 1,
+                "message": "comparison_column parameter is required",
+            },
+            "bind_columns": {
+                **_NON_EMPTY_STRING_ARRAY,
+                "message": "At least one bind column must be specified",
+            },
+        },
+    },
+    "bind_multi_key": {
+        "type": "object",
+        "properties": {
+            "comparison_columns": {
+                **_NON_EMPTY_STRING_ARRAY,
+                "message": "At least one comparison column must be specified",
+            },
+            "bind_columns": {
+                **_NON_EMPTY_STRING_ARRAY,
+                "message": "At least one bind column must be specified",
+            },
+        },
+    },
+    "search": {
+        "type": "object",
+        "properties": {
+            "conditions": {
+                "type": "array",
+                "minItems": 1,
+                "message": "At least one search condition is required",
+            },
+            "logic": {
+                "enum": ["AND", "OR"],
+                "message": "Logic must be either 'AND' or 'OR'",
+            },
+            "output_format": {
+                "enum": ["xlsx", "csv", "json"],
+                "message": "Output format must be xlsx, csv, or json",
+            },
+        },
+    },
+}
+
+VALIDATORS: Dict[str, Callable[[Any], Any]] = {
+    name: fastjsonschema.compile(schema) for name, schema in SCHEMAS.items()
+}
+
+
+def validate_payload(schema_name: str, payload: Dict[str, Any]) -> None:
+    """
+    Validate a parsed request payload against a precompiled schema.
+
+    Args:
+        schema_name: Key of the schema in SCHEMAS
+        payload: Parsed form fields
+
+    Raises:
+        ValidationError: If the payload does not satisfy the schema
+    """
+    try:
+        VALIDATORS[schema_name](payload)
+    except fastjsonschema.JsonSchemaValueException as e:
+        message = e.definition.get("message", e.message) if e.definition else e.message
+        raise ValidationError(message)
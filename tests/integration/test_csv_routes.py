@@ -0,0 +1,37 @@
+"""
+Integration tests for the CSV routes
+
+Tests the CSV endpoints end to end through the Flask test client.
+"""
+
+import io
+
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create test client with a temporary upload folder."""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    return app.test_client()
+
+
+class TestInfoRoute:
+    """Test the /csv/info endpoint."""
+
+    def test_info_reports_upload_name_not_staged_path(self, client, tmp_path):
+        """Test that the staged temporary path is not exposed."""
+        response = client.post(
+            "/api/v1/csv/info",
+            data={"file": (io.BytesIO(b"id,name\n1,Alice\n"), "my data.csv")},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert data["file_path"] == data["file_name"] == "my_data.csv"
+        assert str(tmp_path) not in response.get_data(as_text=True)
@@ -0,0 +1,99 @@
+"""
+Integration tests for the Excel routes
+
+Tests the Excel endpoints end to end through the Flask test client with
+workbooks that hold blank cells or formatted empty rows.
+"""
+
+import io
+import json
+
+import pytest
+from openpyxl import Workbook
+
+from app import create_app
+
+
+@pytest.fixture(params=["calamine", "openpyxl"])
+def client(request, tmp_path):
+    """Create test client reading workbooks with each engine."""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    app.config["PYCELIZE"]._config["excel"]["read_engine"] = request.param
+    return app.test_client()
+
+
+def _workbook_with_blank_amounts():
+    """Build a workbook whose numeric column has a blank cell."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["id", "amount"])
+    ws.append(["A", 1.5])
+    ws.append(["B", None])
+    ws.append(["C", 3])
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer, "amounts.xlsx"
+
+
+def _workbook_with_styled_trailing_rows():
+    """Build a workbook with formatted but empty rows below three data rows."""
+    from openpyxl.styles import Font
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["id", "name"])
+    for row in (["1", "A"], ["2", "B"], ["3", "C"]):
+        ws.append(row)
+    for row in range(5, 12):
+        ws.cell(row=row, column=1).font = Font(bold=True)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer, "styled.xlsx"
+
+
+class TestInfoRoute:
+    """Test the /excel/info endpoint."""
+
+    def test_info_ignores_styled_trailing_rows(self, client):
+        """Test that formatted empty rows below the data are not counted."""
+        response = client.post(
+            "/api/v1/excel/info",
+            data={"file": _workbook_with_styled_trailing_rows()},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["data"]["rows"] == 3
+
+
+class TestSearchRoute:
+    """Test the /excel/search endpoint."""
+
+    @pytest.mark.parametrize(
+        "operator, value, filtered_rows",
+        [("greater_than", 1, 2), ("is_empty", None, 1)],
+    )
+    def test_search_numeric_column_with_blank_cells(
+        self, client, operator, value, filtered_rows
+    ):
+        """Test that blank cells in a numeric column do not fail the read."""
+        response = client.post(
+            "/api/v1/excel/search",
+            data={
+                "file": _workbook_with_blank_amounts(),
+                "conditions": json.dumps(
+                    [{"column": "amount", "operator": operator, "value": value}]
+                ),
+                "output_format": "json",
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert data["total_rows"] == 3
+        assert data["filtered_rows"] == filtered_rows
@@ -0,0 +1,61 @@
+"""
+Integration tests for the file routes
+
+Tests the binding preview end to end through the Flask test client.
+"""
+
+import io
+import json
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Font
+
+from app import create_app
+
+
+@pytest.fixture(params=["calamine", "openpyxl"])
+def client(request, tmp_path):
+    """Create test client reading workbooks with each engine."""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    app.config["PYCELIZE"]._config["excel"]["read_engine"] = request.param
+    return app.test_client()
+
+
+def _workbook(header, name):
+    """Build a three-row workbook with formatted empty rows below the data."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(header)
+    for i in range(3):
+        ws.append([f"{column}-{i}" for column in header])
+    for row in range(5, 12):
+        ws.cell(row=row, column=1).font = Font(bold=True)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer, name
+
+
+class TestBindPreviewRoute:
+    """Test the /files/bind/preview endpoint."""
+
+    def test_preview_ignores_styled_trailing_rows(self, client):
+        """Test that row counts leave out formatted empty rows."""
+        response = client.post(
+            "/api/v1/files/bind/preview",
+            data={
+                "source_file": _workbook(["id", "name"], "source.xlsx"),
+                "target_file": _workbook(["id", "city"], "target.xlsx"),
+                "column_mapping": json.dumps({"id": "id"}),
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert data["source_rows"] == 3
+        assert data["target_rows"] == 3
+        assert data["mapping_valid"] is True
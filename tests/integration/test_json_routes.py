@@ -0,0 +1,107 @@
+"""
+Integration tests for the JSON generation routes
+
+Tests that column mappings naming columns the uploaded sheet does not
+have are rejected with 422 rather than producing an empty JSON file.
+"""
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create test client with a temporary upload folder."""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    return app.test_client()
+
+
+def _workbook():
+    """Build a small workbook upload."""
+    buffer = io.BytesIO()
+    pd.DataFrame({"Name": ["Alice", "Bob"], "City": ["Paris", "Rome"]}).to_excel(
+        buffer, index=False
+    )
+    buffer.seek(0)
+    return buffer, "people.xlsx"
+
+
+class TestMissingMappedColumns:
+    """Test mappings whose columns are all missing from the sheet."""
+
+    def test_generate_rejects_all_missing_columns(self, client):
+        """Test that /json/generate reports every missing mapped column."""
+        response = client.post(
+            "/api/v1/json/generate",
+            data={
+                "file": _workbook(),
+                "column_mapping": json.dumps({"n": "Name", "c": "City"}),
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 422
+        assert "Columns not found in data: n, c" in response.get_json()["message"]
+
+    def test_generate_with_template_rejects_all_missing_columns(self, client):
+        """Test that /json/generate-with-template reports missing columns."""
+        response = client.post(
+            "/api/v1/json/generate-with-template",
+            data={
+                "file": _workbook(),
+                "template": json.dumps({"name": "{{n}}"}),
+                "column_mapping": json.dumps({"n": "Nmae"}),
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 422
+        assert "Columns not found in data: Nmae" in response.get_json()["message"]
+
+
+class TestTemplateShape:
+    """Test templates that parse as JSON but are not objects."""
+
+    @pytest.mark.parametrize("template", ["[1, 2]", '"{n}"'])
+    def test_generate_with_template_rejects_non_object(self, client, template):
+        """Test that list and scalar templates are rejected with 422."""
+        response = client.post(
+            "/api/v1/json/generate-with-template",
+            data={
+                "file": _workbook(),
+                "template": template,
+                "column_mapping": json.dumps({"n": "Name"}),
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 422
+        assert "Template must be a JSON string or dictionary" in (
+            response.get_json()["message"]
+        )
+
+
+class TestMalformedColumnFields:
+    """Test column fields that are valid JSON of the wrong shape."""
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("columns", '"Name"'), ("column_mapping", "[1, 2]")],
+    )
+    def test_generate_rejects_wrong_shape(self, client, field, value):
+        """Test that wrong-shaped columns and mappings are rejected with 422."""
+        response = client.post(
+            "/api/v1/json/generate",
+            data={"file": _workbook(), field: value},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 422
+        assert f"{field} must be a JSON" in response.get_json()["message"]
@@ -0,0 +1,83 @@
+"""
+Integration tests for upload handling
+
+Tests that requests declaring a body larger than MAX_CONTENT_LENGTH are
+rejected with 413 before any route parses the form, and that large
+uploads are spooled into the upload folder.
+"""
+
+import io
+import os
+
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture
+def app():
+    """Create test application with a small upload limit."""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024
+    return app
+
+
+@pytest.fixture
+def upload_app(tmp_path):
+    """Create test application with a temporary upload folder."""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['UPLOAD_FOLDER'] = str(tmp_path)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client."""
+    return app.test_client()
+
+
+class TestUploadLimit:
+    """Test oversized upload rejection."""
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        ["/api/v1/json/generate", "/api/v1/sql/generate", "/api/v1/excel/info"],
+    )
+    def test_oversized_upload_returns_413(self, client, endpoint):
+        """Test that oversized uploads get a JSON 413 instead of a 500."""
+        data = {'file': (io.BytesIO(b'x' * (2 * 1024 * 1024)), 'big.xlsx')}
+
+        response = client.post(endpoint, data=data, content_type='multipart/form-data')
+
+        assert response.status_code == 413
+        assert response.get_json()['status_code'] == 413
+        assert "1 MB" in response.get_json()['message']
+
+
+class TestUploadSpooling:
+    """Test where uploaded files are spooled."""
+
+    def test_large_upload_is_spooled_to_upload_folder(self, upload_app, tmp_path):
+        """Test that large uploads land in a named file in the upload folder."""
+        from flask import request
+
+        payload = b'x' * (600 * 1024)
+        with upload_app.test_request_context(
+            '/', method='POST', data={'file': (io.BytesIO(payload), 'big.xlsx')}
+        ):
+            stream = request.files['file'].stream
+
+            assert os.path.dirname(stream.name) == str(tmp_path)
+            assert stream.read() == payload
+
+    def test_small_upload_stays_in_memory(self, upload_app, tmp_path):
+        """Test that small uploads are not written to the upload folder."""
+        from flask import request
+
+        with upload_app.test_request_context(
+            '/', method='POST', data={'file': (io.BytesIO(b'small'), 'a.xlsx')}
+        ):
+            assert request.files['file'].read() == b'small'
+            assert os.listdir(tmp_path) == []
@@ -0,0 +1,190 @@
+"""
+Unit tests for BackgroundWorkflowExecutor
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.chat.background_executor import BackgroundWorkflowExecutor
+
+
+class TestBackgroundWorkflowExecutor:
+    """Test suite for BackgroundWorkflowExecutor."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.executor = BackgroundWorkflowExecutor(max_workers=2)
+
+    def teardown_method(self):
+        """Shut the executor down."""
+        self.executor.shutdown(wait=True)
+
+    def _wait(self, job_id):
+        """Wait until a job has reached a final status."""
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            status = self.executor.get_job_status(job_id)
+            if status and status["status"] in ("completed", "failed", "cancelled"):
+                return
+            time.sleep(0.01)
+        raise AssertionError(f"Job {job_id} did not finish")
+
+    def test_completed_job_status(self):
+        """Test that a finished job reports its result and timestamps."""
+        done = threading.Event()
+        outcome = []
+
+        def on_complete(success, result, error):
+            outcome.append((success, result, error))
+            done.set()
+
+        self.executor.submit_workflow(
+            "job-1", lambda x: x * 2, 21, on_complete=on_complete
+        )
+        assert done.wait(5)
+        self._wait("job-1")
+
+        status = self.executor.get_job_status("job-1")
+
+        assert outcome == [(True, 42, None)]
+        assert status["status"] == "completed"
+        assert status["result"] == 42
+        assert status["started_at"] and status["completed_at"]
+        assert "future" not in status
+
+    def test_failed_job_status(self):
+        """Test that a raising job is recorded as failed with its error."""
+
+        def fail():
+            raise ValueError("boom")
+
+        self.executor.submit_workflow("job-2", fail)
+        self._wait("job-2")
+
+        status = self.executor.get_job_status("job-2")
+
+        assert status["status"] == "failed"
+        assert status["error"] == "boom"
+        assert self.executor.get_active_job_count() == 0
+
+    def test_unknown_job(self):
+        """Test that unknown jobs have no status and cannot be cancelled."""
+        assert self.executor.get_job_status("missing") is None
+        assert self.executor.cancel_job("missing") is False
+
+    @pytest.mark.parametrize("max_age_seconds, remaining", [(3600, 1), (-1, 0)])
+    def test_cleanup_completed_jobs(self, max_age_seconds, remaining):
+        """Test that only finished jobs older than the cutoff are removed."""
+        self.executor.submit_workflow("job-3", lambda: None)
+        self._wait("job-3")
+
+        self.executor.cleanup_completed_jobs(max_age_seconds=max_age_seconds)
+
+        assert len(self.executor.active_jobs) == remaining
+
+    def test_status_timestamps_are_iso(self):
+        """Test that stored epoch times are reported as ISO timestamps."""
+        from datetime import datetime
+
+        self.executor.submit_workflow("job-4", lambda: None)
+        self._wait("job-4")
+
+        status = self.executor.get_job_status("job-4")
+        submitted = datetime.fromisoformat(status["submitted_at"])
+        completed = datetime.fromisoformat(status["completed_at"])
+
+        assert submitted <= completed
+        assert isinstance(self.executor.active_jobs["job-4"].completed_at, float)
+
+    def test_jobs_across_shards(self):
+        """Test that jobs spread over shards are all tracked and counted."""
+        job_ids = [f"job-{i}" for i in range(40)]
+        for job_id in job_ids:
+            self.executor.submit_workflow(job_id, lambda: None)
+        for job_id in job_ids:
+            self._wait(job_id)
+
+        assert sorted(self.executor.active_jobs) == sorted(job_ids)
+        assert self.executor.get_active_job_count() == 0
+        assert all(
+            self.executor.get_job_status(job_id)["status"] == "completed"
+            for job_id in job_ids
+        )
+
+    def test_status_dict_is_reused_until_job_changes(self):
+        """Test that polling returns the prebuilt dict until the job changes."""
+        from app.chat.background_executor import Job
+
+        job = Job("job-5", 0.0)
+        first = job.to_dict()
+
+        assert job.to_dict() is first
+        job.update("running", started_at=1.0)
+        assert job.to_dict() is not first
+        assert first["status"] == "pending"
+        assert job.to_dict()["status"] == "running"
+
+
+class TestProcessBackgroundExecutor:
+    """Test suite for BackgroundWorkflowExecutor backed by processes."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.executor = BackgroundWorkflowExecutor(
+            max_workers=1, executor_kind="process"
+        )
+
+    def teardown_method(self):
+        """Shut the executor down."""
+        self.executor.shutdown(wait=True)
+
+    def test_process_jobs_record_outcome(self):
+        """Test that results and errors from worker processes are tracked."""
+        done = threading.Event()
+        outcomes = []
+
+        def on_complete(success, result, error):
+            outcomes.append((success, result, error))
+            if len(outcomes) == 2:
+                done.set()
+
+        self.executor.submit_workflow("ok", pow, 2, 10, on_complete=on_complete)
+        self.executor.submit_workflow("bad", int, "x", on_complete=on_complete)
+        assert done.wait(30)
+
+        assert self.executor.get_job_status("ok")["result"] == 1024
+        assert self.executor.get_job_status("bad")["status"] == "failed"
+        assert (True, 1024, None) in outcomes
+
+    def test_unknown_executor_kind(self):
+        """Test that an unknown executor kind is rejected."""
+        with pytest.raises(ValueError, match="Unknown executor kind"):
+            BackgroundWorkflowExecutor(executor_kind="fiber")
+
+
+class TestBoundedBackgroundExecutor:
+    """Test suite for BackgroundWorkflowExecutor with a queue limit."""
+
+    def test_full_queue_rejects_until_a_job_finishes(self):
+        """Test that submissions beyond max_queue_size are refused."""
+        executor = BackgroundWorkflowExecutor(max_workers=1, max_queue_size=1)
+        release = threading.Event()
+        try:
+            executor.submit_workflow("first", release.wait, 5)
+
+            with pytest.raises(RuntimeError, match="queue full"):
+                executor.submit_workflow("second", lambda: None)
+            assert executor.get_job_status("second") is None
+
+            release.set()
+            deadline = time.monotonic() + 5
+            while executor.get_job_status("first")["status"] != "completed":
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            executor.submit_workflow("third", lambda: None)
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
@@ -0,0 +1,70 @@
+"""
+Unit tests for ChatDatabase
+"""
+
+import pytest
+
+from app.chat.database import ChatDatabase
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create a database holding one conversation."""
+    database = ChatDatabase(str(tmp_path / "chat.db"))
+    database.save_conversation(
+        {
+            "chat_id": "chat-1",
+            "participant_name": "tester",
+            "status": "created",
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+        }
+    )
+    return database
+
+
+class TestChatDatabase:
+    """Test suite for ChatDatabase bulk writes."""
+
+    def test_save_workflow_steps_upserts(self, database):
+        """Test that saving steps again updates their status in place."""
+        steps = [
+            (
+                "s1",
+                "excel/extract",
+                {"columns": ["a"]},
+                "pending",
+                "in.xlsx",
+                None,
+                0,
+                None,
+                None,
+                None,
+            ),
+            ("s2", "excel/sort", {}, "pending", None, None, 0, None, None, None),
+        ]
+        database.save_workflow_steps("chat-1", steps)
+        database.save_workflow_steps(
+            "chat-1",
+            [step[:3] + ("completed", "in.xlsx", "out.xlsx", 100) + step[7:] for step in steps],
+        )
+
+        saved = database.get_workflow_steps("chat-1")
+
+        assert [step["step_id"] for step in saved] == ["s1", "s2"]
+        assert all(step["status"] == "completed" for step in saved)
+        assert saved[0]["arguments"] == {"columns": ["a"]}
+        assert saved[0]["input_file"] == "in.xlsx"
+        assert saved[0]["output_file"] == "out.xlsx"
+        assert saved[0]["progress"] == 100
+
+    def test_save_files(self, database):
+        """Test that files saved in bulk are listed by type."""
+        database.save_files("chat-1", ["a.xlsx", "b.xlsx"], "output")
+        database.save_files("chat-1", [], "uploaded")
+        database.save_file("chat-1", "c.csv", "uploaded")
+
+        assert database.get_files("chat-1") == {
+            "uploaded": ["c.csv"],
+            "output": ["a.xlsx", "b.xlsx"],
+        }
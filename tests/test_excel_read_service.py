@@ -5,6 +5,7 @@ This module contains unit tests specifically for ExcelService read operations,
 including tests for preserving leading zeros and raw cell values.
 """
 
+import io
 import os
 import pytest
 import pandas as pd
@@ -136,3 +137,159 @@ excel:
         
         assert df['code'].iloc[0] == '002'
         assert df['code'].dtype == 'object' or isinstance(df['code'].dtype, pd.StringDtype)
+
+    def test_read_excel_stream_preserves_leading_zeros(self, service, excel_with_leading_zeros):
+        """Test reading an uploaded stream without saving it to disk."""
+        with open(excel_with_leading_zeros, "rb") as f:
+            stream = io.BytesIO(f.read())
+        stream.seek(0, io.SEEK_END)
+
+        df = service.read_excel_stream(stream)
+
+        assert df['zip_code'].iloc[0] == '021201'
+        assert len(df) == 3
+
+    def test_get_file_info_from_stream(self, service, excel_with_leading_zeros):
+        """Test file info for an uploaded stream uses the given file name."""
+        with open(excel_with_leading_zeros, "rb") as f:
+            info = service.get_file_info(io.BytesIO(f.read()), file_name="upload.xlsx")
+
+        assert info['file_name'] == "upload.xlsx"
+        assert info['sheets'] == ["Test"]
+        assert info['rows'] == 3
+        assert info['column_names'] == ['zip_code', 'phone', 'product_code', 'customer_id']
+
+    def test_get_file_info_fast_matches_full_read(self, service, tmp_path):
+        """Test that the metadata-only info matches the full DataFrame read."""
+        excel_path = tmp_path / "test_info.xlsx"
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['id', 'name', 'name', None, 'note'])
+        ws.append(['001', 'A', 'B', 'x', 'n1'])
+        ws.append(['002', 'C', 'D', 'y', 'n2'])
+        wb.create_sheet("Other")
+        wb.save(excel_path)
+
+        fast = service.get_file_info_fast(str(excel_path))
+
+        assert fast == service.get_file_info(str(excel_path))
+        assert fast['column_names'] == ['id', 'name', 'name.1', 'Unnamed: 3', 'note']
+        assert fast['sheets'] == ["Sheet", "Other"]
+
+    @pytest.fixture
+    def excel_with_styled_trailing_rows(self, tmp_path):
+        """Create an Excel file with formatted but empty rows below the data."""
+        from openpyxl.styles import Font
+
+        excel_path = tmp_path / "test_styled_rows.xlsx"
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['id', 'name'])
+        ws.append(['1', 'Alice'])
+        ws.append([None, None])
+        ws.append(['3', 'Carol'])
+        for row in range(5, 12):
+            ws.cell(row=row, column=1).font = Font(bold=True)
+        wb.save(excel_path)
+
+        return excel_path
+
+    @pytest.mark.parametrize("read_engine", ["calamine", "openpyxl"])
+    def test_peek_ignores_styled_trailing_rows(
+        self, service, excel_with_styled_trailing_rows, read_engine
+    ):
+        """Test that peek counts rows like read_excel, without styled blanks."""
+        service.read_engine = read_engine
+        path = str(excel_with_styled_trailing_rows)
+
+        peeked = service.peek(path)
+        with open(path, 'rb') as f:
+            peeked_stream = service.peek(io.BytesIO(f.read()))
+
+        assert peeked['columns'] == ['id', 'name']
+        assert peeked['n_rows'] == len(service.read_excel(path)) == 3
+        assert peeked_stream == peeked
+
+    def test_peek_reads_headers_and_row_count(self, service, excel_with_leading_zeros):
+        """Test that peek returns headers and row count from a stream."""
+        with open(excel_with_leading_zeros, "rb") as f:
+            peeked = service.peek(io.BytesIO(f.read()))
+
+        assert peeked['columns'] == ['zip_code', 'phone', 'product_code', 'customer_id']
+        assert peeked['n_rows'] == 3
+
+    def test_read_excel_usecols_ignores_missing(self, service, excel_with_leading_zeros):
+        """Test that usecols keeps only the requested columns that exist."""
+        df = service.read_excel(
+            str(excel_with_leading_zeros), usecols=['customer_id', 'zip_code', 'missing']
+        )
+
+        assert list(df.columns) == ['zip_code', 'customer_id']
+        assert df['zip_code'].iloc[0] == "021201"
+
+    @pytest.mark.parametrize("read_engine", ["calamine", "openpyxl"])
+    def test_iter_excel_matches_read_excel(self, service, tmp_path, read_engine):
+        """Test that streamed batches hold the same values as a full read."""
+        from datetime import date, datetime
+
+        service.read_engine = read_engine
+
+        excel_path = tmp_path / "test_iter.xlsx"
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(['id', 'name', 'name', None, 'when'])
+        ws.append(['001', 1.0, 2.5, True, datetime(2024, 1, 2, 3, 4, 5)])
+        ws.append([None, None, None, None, None])
+        ws.append(['003', 'C', None, 'y', date(2024, 5, 6)])
+        ws.append([None, None, None, None, None])
+        wb.save(excel_path)
+
+        batches = list(service.iter_excel(str(excel_path), batch_size=2))
+        streamed = pd.concat(batches, ignore_index=True)
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        pd.testing.assert_frame_equal(
+            streamed, service.read_excel(str(excel_path)), check_dtype=False
+        )
+
+        (subset,) = service.iter_excel(
+            str(excel_path), batch_size=10, usecols=['when', 'id', 'missing']
+        )
+        assert list(subset.columns) == ['id', 'when']
+
+    def test_read_excel_cached_matches_read_excel(
+        self, config, excel_with_leading_zeros, tmp_path
+    ):
+        """Test that cached reads match a full read and skip re-parsing."""
+        from unittest.mock import patch
+
+        config._config["excel"]["read_cache_folder"] = str(tmp_path / "cache")
+        service = ExcelService(config)
+        path = str(excel_with_leading_zeros)
+
+        first = service.read_excel_cached(path)
+        with patch.object(service, "read_excel", side_effect=AssertionError):
+            second = service.read_excel_cached(path)
+            subset = service.read_excel_cached(path, usecols=['customer_id', 'missing'])
+
+        pd.testing.assert_frame_equal(first, service.read_excel(path))
+        pd.testing.assert_frame_equal(second, first)
+        assert list(subset.columns) == ['customer_id']
+        assert len(os.listdir(tmp_path / "cache")) == 1
+
+    def test_read_cache_is_disabled_by_default(self, config, excel_with_leading_zeros):
+        """Test that the shipped configuration leaves the read cache off."""
+        from app import create_app
+
+        app_config = create_app().config["PYCELIZE"]
+        service = ExcelService(config)
+        path = str(excel_with_leading_zeros)
+
+        assert app_config.get("excel.read_cache_folder") is None
+        assert service.read_cache_folder is None
+        pd.testing.assert_frame_equal(
+            service.read_excel_cached(path), service.read_excel(path)
+        )
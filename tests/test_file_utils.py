@@ -0,0 +1,152 @@
+"""
+Tests for File Utilities
+
+This module contains unit tests for FileUtils upload handling.
+"""
+
+import io
+import os
+import tempfile
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from app.utils.file_utils import FileUtils
+
+
+class TestSaveUpload:
+    """Test cases for FileUtils.save_upload."""
+
+    def test_save_in_memory_upload(self, tmp_path):
+        """Test that an in-memory upload is copied to disk."""
+        upload = FileStorage(stream=io.BytesIO(b"hello"), filename="a.xlsx")
+        dest = str(tmp_path / "a.xlsx")
+
+        assert FileUtils.save_upload(upload, dest) == dest
+        with open(dest, "rb") as f:
+            assert f.read() == b"hello"
+
+    def test_save_in_memory_upload_from_current_position(self, tmp_path):
+        """Test that an in-memory upload is written from its current position."""
+        stream = io.BytesIO(b"skip-hello")
+        stream.seek(5)
+        dest = str(tmp_path / "a.xlsx")
+
+        FileUtils.save_upload(FileStorage(stream=stream, filename="a.xlsx"), dest)
+
+        with open(dest, "rb") as f:
+            assert f.read() == b"hello"
+        # The buffer view is released, so the stream can still be resized
+        stream.write(b"!")
+
+    def test_save_spooled_upload_links_file(self, tmp_path):
+        """Test that a named temporary upload is linked without copying."""
+        with tempfile.NamedTemporaryFile(dir=tmp_path) as spooled:
+            spooled.write(b"spooled")
+            spooled.seek(0)
+            upload = FileStorage(stream=spooled, filename="b.xlsx")
+            dest = str(tmp_path / "b.xlsx")
+
+            FileUtils.save_upload(upload, dest)
+
+            assert os.path.samefile(spooled.name, dest)
+
+        with open(dest, "rb") as f:
+            assert f.read() == b"spooled"
+
+    def test_save_uploads_writes_all_files(self, tmp_path):
+        """Test that several uploads are saved concurrently."""
+        uploads = [
+            (
+                FileStorage(stream=io.BytesIO(b"one"), filename="1.xlsx"),
+                str(tmp_path / "1.xlsx"),
+            ),
+            (
+                FileStorage(stream=io.BytesIO(b"two"), filename="2.xlsx"),
+                str(tmp_path / "2.xlsx"),
+            ),
+        ]
+
+        paths = FileUtils.save_uploads(*uploads)
+
+        assert paths == [dest for _, dest in uploads]
+        with open(paths[1], "rb") as f:
+            assert f.read() == b"two"
+
+    def test_staged_uploads_are_removed(self, tmp_path):
+        """Test that staged uploads get unique names and are deleted on exit."""
+        first = FileStorage(stream=io.BytesIO(b"one"), filename="same.xlsx")
+        second = FileStorage(stream=io.BytesIO(b"two"), filename="same.xlsx")
+
+        with FileUtils.staged_uploads(str(tmp_path), first, second) as paths:
+            assert len(set(paths)) == 2
+            assert all(path.endswith(".xlsx") for path in paths)
+            with open(paths[1], "rb") as f:
+                assert f.read() == b"two"
+
+        assert os.listdir(tmp_path) == []
+
+
+class TestEnsureDirectory:
+    """Test cases for FileUtils.ensure_directory."""
+
+    def test_creates_directory_once(self, tmp_path, monkeypatch):
+        """Test that a directory is created once and then remembered."""
+        target = str(tmp_path / "nested" / "dir")
+        calls = []
+        real_makedirs = os.makedirs
+        monkeypatch.setattr(
+            os, "makedirs", lambda *a, **k: calls.append(a) or real_makedirs(*a, **k)
+        )
+
+        FileUtils.ensure_directory(target)
+        FileUtils.ensure_directory(target)
+
+        assert os.path.isdir(target)
+        assert calls.count((target,)) == 1
+
+
+class TestCopyStream:
+    """Test cases for FileUtils.copy_stream."""
+
+    def test_copies_between_files_from_current_positions(self, tmp_path):
+        """Test that the copy starts at both files' positions and advances them."""
+        payload = os.urandom(3 << 20)
+        with tempfile.TemporaryFile(dir=tmp_path) as src:
+            src.write(b"skip" + payload)
+            src.seek(4)
+            with open(tmp_path / "out.bin", "wb") as dst:
+                dst.write(b"head")
+                FileUtils.copy_stream(src, dst)
+                dst.write(b"tail")
+
+        assert (tmp_path / "out.bin").read_bytes() == b"head" + payload + b"tail"
+
+    def test_copies_from_in_memory_stream(self, tmp_path):
+        """Test the buffered fallback for streams without a file descriptor."""
+        with open(tmp_path / "out.bin", "wb") as dst:
+            FileUtils.copy_stream(io.BytesIO(b"hello"), dst)
+
+        assert (tmp_path / "out.bin").read_bytes() == b"hello"
+
+
+class TestSecureFilename:
+    """Test cases for FileUtils.secure_filename."""
+
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "report.xlsx",
+            "sales_2024-q1.csv",
+            "..hidden__",
+            "My File.xlsx",
+            "../../etc/passwd",
+            "résumé.xlsx",
+            "",
+        ],
+    )
+    def test_matches_werkzeug(self, filename):
+        """Test that both the fast path and fallback match werkzeug."""
+        from werkzeug.utils import secure_filename
+
+        assert FileUtils.secure_filename(filename) == secure_filename(filename)
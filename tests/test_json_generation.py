@@ -266,6 +266,31 @@ file:
         assert json_data[0]["name"] == "Alice"
         assert json_data[0]["email"] == "alice@test.com"
 
+    def test_template_string_is_compiled_once(
+        self, service, sample_dataframe, output_file
+    ):
+        """Test that repeated string templates reuse the compiled template."""
+        from app.services.json_generation_service import _compile_template
+
+        template_str = '{"id": "{age:int}", "label": "{full_name} <{email}>"}'
+        column_mapping = {"full_name": "Name", "email": "Email", "age": "Age"}
+
+        _compile_template.cache_clear()
+        for _ in range(2):
+            service.generate_json_with_template(
+                data=sample_dataframe,
+                template=template_str,
+                column_mapping=column_mapping,
+                output_path=output_file,
+            )
+
+        assert _compile_template.cache_info().hits == 1
+
+        with open(output_file, "r", encoding="utf-8") as f:
+            json_data = json.load(f)
+
+        assert json_data[0] == {"id": 25, "label": "Alice <alice@test.com>"}
+
     def test_generate_json_with_template_nested_mode(
         self, service, sample_dataframe, output_file
     ):
@@ -411,6 +436,21 @@ file:
 
         assert "Invalid JSON template" in str(exc_info.value)
 
+    @pytest.mark.parametrize("template_str", ["[1, 2]", '"{name}"', "42", "[]"])
+    def test_generate_json_with_template_not_an_object(
+        self, service, sample_dataframe, output_file, template_str
+    ):
+        """Test that JSON templates that are not objects are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            service.generate_json_with_template(
+                data=sample_dataframe,
+                template=template_str,
+                column_mapping={"name": "Name"},
+                output_path=output_file,
+            )
+
+        assert "Template must be a JSON string or dictionary" in str(exc_info.value)
+
     def test_generate_json_with_template_missing_column(
         self, service, sample_dataframe, output_file
     ):
@@ -466,6 +506,26 @@ file:
         # Should be compact (no indentation)
         assert "\n  " not in content
 
+    def test_generate_json_pretty_layout_matches_json_dump(
+        self, service, sample_dataframe, output_file
+    ):
+        """Test that streamed pretty output matches json.dump(indent=2)."""
+        template = {"person": {"name": "{name}", "tags": ["{email}"]}}
+        column_mapping = {"name": "Name", "email": "Email"}
+
+        service.generate_json_with_template(
+            data=sample_dataframe,
+            template=template,
+            column_mapping=column_mapping,
+            output_path=output_file,
+            aggregation_mode="nested",
+        )
+
+        with open(output_file, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        assert content == json.dumps(json.loads(content), indent=2, ensure_ascii=False)
+
     def test_substitute_placeholders_dict(self, service):
         """Test placeholder substitution in dictionary."""
         template = {
@@ -535,6 +595,41 @@ file:
         assert result["name"] == "Alice"
         assert result["email"] == ""
 
+    @pytest.mark.parametrize("strategy", ["include", "exclude", "default"])
+    def test_record_factory_matches_handle_null_values(self, service, strategy):
+        """Test that row records match dict building plus null handling."""
+        rows = [("Alice", None, 1), (None, "b@test.com", None)]
+
+        for keys in (["name", "email", "age"], ["name", "email", "name"]):
+            make_record = service._record_factory(keys, strategy)
+            for values in rows:
+                expected = service._handle_null_values(
+                    dict(zip(keys, values)), strategy
+                )
+                assert make_record(values) == expected
+
+    def test_generate_json_mixed_column_types(self, service, output_file):
+        """Test that string, numeric and datetime columns convert correctly."""
+        df = pd.DataFrame(
+            {
+                "Name": ["Alice", None],
+                "Score": [1.5, float("nan")],
+                "Joined": pd.to_datetime(["2024-01-02", None]),
+            }
+        )
+
+        service.generate_json(
+            df, {"Name": "name", "Score": "score", "Joined": "joined"}, output_file
+        )
+
+        with open(output_file, "r", encoding="utf-8") as f:
+            json_data = json.load(f)
+
+        assert json_data == [
+            {"name": "Alice", "score": 1.5, "joined": "2024-01-02T00:00:00"},
+            {"name": None, "score": None, "joined": None},
+        ]
+
     def test_json_native_types_with_pure_placeholders(self, service, output_file):
         """Test that pure placeholders with type hints produce native JSON types."""
         df = pd.DataFrame(
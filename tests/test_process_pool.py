@@ -0,0 +1,177 @@
+"""
+Tests for the CPU Process Pool
+
+This module contains unit tests for running Excel jobs through
+the process pool.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from app.core.config import Config
+from app.core.exceptions import ValidationError
+from app.services import process_pool
+
+
+def _make_config(tmp_path, workers):
+    """Write a minimal configuration file and load it."""
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(f"""
+file:
+  output_folder: "{tmp_path / 'outputs'}"
+
+excel:
+  include_info_sheet: false
+  process_pool_workers: {workers}
+""")
+    return Config(str(config_path))
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Create a small Excel file to process."""
+    path = tmp_path / "input.xlsx"
+    pd.DataFrame({"id": ["001", "002"], "name": ["A", "B"]}).to_excel(path, index=False)
+    return str(path)
+
+
+class TestRunCpuBound:
+    """Test cases for run_cpu_bound."""
+
+    @pytest.mark.parametrize("workers", [0, 1])
+    def test_extract_columns_to_file(self, tmp_path, sample_file, workers):
+        """Test that the job writes the same output inline and in the pool."""
+        config = _make_config(tmp_path, workers)
+        output_path = str(tmp_path / f"out_{workers}.xlsx")
+
+        result = process_pool.run_cpu_bound(
+            config,
+            process_pool.extract_columns_to_file,
+            file_path=sample_file,
+            columns=["id"],
+            output_path=output_path,
+        )
+
+        assert result == output_path
+        assert os.path.exists(output_path)
+        assert pd.read_excel(output_path, dtype=str)["id"].tolist() == ["001", "002"]
+
+    def test_job_errors_are_reraised(self, tmp_path, sample_file):
+        """Test that an error raised in a worker process reaches the caller."""
+        config = _make_config(tmp_path, 1)
+
+        with pytest.raises(ValidationError, match="not found"):
+            process_pool.run_cpu_bound(
+                config,
+                process_pool.bind_single_key,
+                source_path=sample_file,
+                bind_path=sample_file,
+                comparison_column="missing",
+                bind_columns=["name"],
+            )
+
+    @pytest.mark.parametrize("workers", [0, 1])
+    def test_generate_json_file(self, tmp_path, sample_file, workers):
+        """Test that JSON generation reads, selects and writes in one job."""
+        config = _make_config(tmp_path, workers)
+        output_path = str(tmp_path / f"out_{workers}.json")
+
+        result = process_pool.run_cpu_bound(
+            config,
+            process_pool.generate_json_file,
+            file_path=sample_file,
+            output_path=output_path,
+            columns=["id"],
+            column_mapping={},
+            pretty_print=False,
+        )
+
+        assert result["total_records"] == 2
+        with open(output_path) as f:
+            assert f.read() == '[{"id":"001"},{"id":"002"}]'
+
+    @pytest.mark.parametrize("workers", [0, 1])
+    def test_generate_sql_text_file_streams_same_output(
+        self, tmp_path, sample_file, workers
+    ):
+        """Test that the streamed and in-memory text exports match."""
+        from app.models.request import SQLGenerationRequest
+
+        config = _make_config(tmp_path, workers)
+        sql_request = SQLGenerationRequest(
+            table_name="users",
+            column_mapping={"id": "id", "name": "name"},
+            database_type="postgresql",
+            batch_size=1,
+        )
+
+        outputs = []
+        for remove_duplicates in (False, True):
+            output_path = str(tmp_path / f"out_{workers}_{remove_duplicates}.sql")
+            process_pool.run_cpu_bound(
+                config,
+                process_pool.generate_sql_text_file,
+                file_path=sample_file,
+                sql_request=sql_request,
+                output_path=output_path,
+                columns=["id", "name"],
+                remove_duplicates=remove_duplicates,
+            )
+            with open(output_path) as f:
+                outputs.append(
+                    [line for line in f if not line.startswith("-- Generated at")]
+                )
+
+        assert outputs[0] == outputs[1]
+        assert sum(line.startswith("INSERT") for line in outputs[0]) == 2
+
+    def test_generate_sql_text_file_missing_column(self, tmp_path, sample_file):
+        """Test that a missing column is a validation error when streaming."""
+        from app.models.request import SQLGenerationRequest
+
+        config = _make_config(tmp_path, 0)
+        sql_request = SQLGenerationRequest(
+            table_name="users", column_mapping={"id": "id"}
+        )
+
+        with pytest.raises(ValidationError, match="missing"):
+            process_pool.generate_sql_text_file(
+                config,
+                file_path=sample_file,
+                sql_request=sql_request,
+                output_path=str(tmp_path / "out.sql"),
+                columns=["missing"],
+            )
+
+    @pytest.mark.parametrize("workers", [0, 1])
+    def test_generate_sql_all_missing_columns_keeps_rows(
+        self, tmp_path, sample_file, workers
+    ):
+        """Test that a mapping naming only missing columns still emits every row."""
+        from app.models.request import SQLGenerationRequest
+
+        config = _make_config(tmp_path, workers)
+        sql_request = SQLGenerationRequest(
+            table_name="users", column_mapping={"code": "missing"}
+        )
+        output_path = str(tmp_path / f"out_{workers}.sql")
+
+        in_memory = process_pool.run_cpu_bound(
+            config,
+            process_pool.generate_sql,
+            file_path=sample_file,
+            sql_request=sql_request,
+        )
+        streamed = process_pool.run_cpu_bound(
+            config,
+            process_pool.generate_sql_file,
+            file_path=sample_file,
+            sql_request=sql_request,
+            output_path=output_path,
+        )
+
+        inserts = [s for s in in_memory["statements"] if s.startswith("INSERT")]
+        assert in_memory["total_rows"] == streamed["total_rows"] == 2
+        assert inserts == ["INSERT INTO users (code) VALUES (NULL);"] * 2
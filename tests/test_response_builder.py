@@ -43,6 +43,18 @@ class TestResponseBuilder:
         assert response["message"] == "Operation successful"
         assert response["total"] == 5
 
+    def test_from_template_matches_success(self):
+        """Test that a filled template has the same shape as success()."""
+        template = ResponseBuilder.template("Done")
+        response = ResponseBuilder.from_template(template, {"download_url": "x"})
+        expected = ResponseBuilder.success(data={"download_url": "x"}, message="Done")
+
+        assert list(response) == list(expected)
+        assert list(response["meta"]) == list(expected["meta"])
+        assert response["data"] == {"download_url": "x"}
+        assert response["message"] == "Done"
+        assert template["data"] is None
+
     def test_error_convenience_method(self):
         """Test error convenience method."""
         response = ResponseBuilder.error(
@@ -63,3 +75,142 @@ class TestResponseBuilder:
         assert response["meta"]["api_version"] == "v2.0.0"
         assert response["meta"]["locale"] == "fr_FR"
         assert "requested_time" in response["meta"]
+
+    def test_meta_uses_app_config(self):
+        """Test that meta reads version and locale from the app config."""
+        from app import create_app
+
+        app = create_app()
+        config = app.config["PYCELIZE"]
+
+        with app.app_context():
+            first = ResponseBuilder.success()["meta"]
+            second = ResponseBuilder.error()["meta"]
+
+        assert first["api_version"] == config.get("app.version")
+        assert first["locale"] == config.get("api.locale")
+        assert second["api_version"] == first["api_version"]
+
+    def test_request_ids_are_unique_hex(self):
+        """Test that request IDs are 32 hex characters and never repeat."""
+        import re
+
+        ids = [ResponseBuilder.success()["meta"]["request_id"] for _ in range(100)]
+
+        assert all(re.fullmatch(r"[0-9a-f]{32}", request_id) for request_id in ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_response_helpers_serialize_with_status(self):
+        """Test that success_response/error_response return JSON Responses."""
+        import orjson
+
+        ok = ResponseBuilder.success_response(data={"a": 1}, message="Done", total=1)
+        failed = ResponseBuilder.error_response("Bad input", 422, {"field": "x"})
+
+        assert ok.status_code == 200
+        assert ok.mimetype == "application/json"
+        assert orjson.loads(ok.get_data())["data"] == {"a": 1}
+        assert failed.status_code == 422
+        body = orjson.loads(failed.get_data())
+        assert body["status_code"] == 422
+        assert body["data"] == {"error_type": "Error", "details": {"field": "x"}}
+
+
+class TestJsonResponse:
+    """Test cases for the orjson-backed json_response helper."""
+
+    def test_serializes_numpy_and_non_string_keys(self):
+        """Test that numpy scalars and integer keys serialize like jsonify."""
+        import numpy as np
+        import orjson
+        from app.utils.helpers import json_response
+
+        response = json_response({"count": np.int64(3), 2024: "year"}, 201)
+
+        assert response.status_code == 201
+        assert response.mimetype == "application/json"
+        assert orjson.loads(response.get_data()) == {"count": 3, "2024": "year"}
+
+
+class TestAsBool:
+    """Test cases for the as_bool form flag helper."""
+
+    @pytest.mark.parametrize(
+        "value, default, expected",
+        [
+            ("true", False, True),
+            (" TRUE ", False, True),
+            ("on", False, True),
+            ("false", True, False),
+            ("", True, False),
+            (None, True, True),
+            (None, False, False),
+        ],
+    )
+    def test_as_bool(self, value, default, expected):
+        """Test truthy spellings, falsy values and the missing-field default."""
+        from app.utils.helpers import as_bool
+
+        assert as_bool(value, default) is expected
+
+
+class TestParseJsonField:
+    """Test cases for the parse_json_field helper."""
+
+    def test_parses_valid_json(self):
+        """Test that valid JSON is returned as Python values."""
+        from app.utils.helpers import parse_json_field
+
+        assert parse_json_field("columns", '["a", "b"]') == ["a", "b"]
+
+    def test_invalid_json_raises_validation_error(self):
+        """Test that malformed JSON names the offending field."""
+        from app.core.exceptions import ValidationError
+        from app.utils.helpers import parse_json_field
+
+        with pytest.raises(ValidationError, match="Invalid column_mapping JSON"):
+            parse_json_field("column_mapping", "{not json")
+
+    @pytest.mark.parametrize("raw", ['"name"', '{"a": "b"}', "[1, 2]", "null"])
+    def test_column_list_must_be_array_of_strings(self, raw):
+        """Test that columns must parse to a list of strings."""
+        from app.core.exceptions import ValidationError
+        from app.utils.helpers import parse_column_list
+
+        with pytest.raises(ValidationError, match="columns must be a JSON array"):
+            parse_column_list("columns", raw)
+
+    @pytest.mark.parametrize("raw", ["[1, 2]", '"name"', '{"a": 1}', '{"a": null}'])
+    def test_column_mapping_must_be_object_of_strings(self, raw):
+        """Test that a column mapping must parse to an object of strings."""
+        from app.core.exceptions import ValidationError
+        from app.utils.helpers import parse_column_mapping
+
+        with pytest.raises(
+            ValidationError, match="column_mapping must be a JSON object"
+        ):
+            parse_column_mapping("column_mapping", raw)
+
+    def test_column_fields_return_parsed_values(self):
+        """Test that well-formed column fields parse unchanged."""
+        from app.utils.helpers import parse_column_list, parse_column_mapping
+
+        assert parse_column_list("columns", '["a", "b"]') == ["a", "b"]
+        assert parse_column_mapping("column_mapping", '{"a": "A"}') == {"a": "A"}
+
+
+class TestGenerateOutputFilename:
+    """Test cases for the generate_output_filename helper."""
+
+    def test_suffix_extension_and_unique_stamp(self):
+        """Test that names keep the stem, add the suffix and never repeat."""
+        import re
+        from app.utils.helpers import generate_output_filename
+
+        first = generate_output_filename("report.xlsx", "sql", "sql")
+        second = generate_output_filename("report.xlsx", "sql", "sql")
+
+        assert re.fullmatch(r"report_sql_[0-9a-f]+\.sql", first)
+        assert first != second
+        assert generate_output_filename("custom_sql.txt").startswith("custom_sql_")
+        assert generate_output_filename("custom_sql.txt").endswith(".txt")
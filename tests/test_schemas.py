@@ -0,0 +1,51 @@
+"""
+Tests for Request Payload Schemas
+
+This module contains unit tests for the precompiled payload validators.
+"""
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.utils.schemas import validate_payload
+
+
+class TestValidatePayload:
+    """Test cases for validate_payload."""
+
+    def test_valid_search_payload(self):
+        """Test that a valid search payload passes."""
+        validate_payload(
+            "search",
+            {
+                "conditions": [{"column": "a", "operator": "equals", "value": 1}],
+                "logic": "AND",
+                "output_format": "csv",
+            },
+        )
+
+    def test_empty_columns_rejected(self):
+        """Test that an empty column list reports the field message."""
+        with pytest.raises(ValidationError) as exc:
+            validate_payload("extract_columns", {"columns": []})
+
+        assert exc.value.message == "No columns specified for extraction"
+
+    def test_missing_comparison_column_rejected(self):
+        """Test that a missing comparison column is rejected."""
+        with pytest.raises(ValidationError) as exc:
+            validate_payload(
+                "bind_single_key", {"comparison_column": None, "bind_columns": ["a"]}
+            )
+
+        assert exc.value.message == "comparison_column parameter is required"
+
+    def test_invalid_logic_rejected(self):
+        """Test that an unknown logic operator is rejected."""
+        with pytest.raises(ValidationError) as exc:
+            validate_payload(
+                "search",
+                {"conditions": [{}], "logic": "XOR", "output_format": "xlsx"},
+            )
+
+        assert exc.value.message == "Logic must be either 'AND' or 'OR'"
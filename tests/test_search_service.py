@@ -98,6 +98,19 @@ excel:
         assert len(result) == 1
         assert "Smith" in result.iloc[0]["name"]
 
+    def test_apply_search_arrow_backed_strings(self, service, sample_dataframe):
+        """Test search on Arrow-backed string columns."""
+        pytest.importorskip("pyarrow")
+        data = sample_dataframe.astype("string[pyarrow]")
+        conditions = [
+            SearchCondition(column="status", operator="equals", value="active"),
+            SearchCondition(column="name", operator="contains", value="o"),
+        ]
+
+        result = service.apply_search(data, conditions, "AND")
+
+        assert result["customer_id"].tolist() == ["021201", "021203", "021204"]
+
     def test_apply_search_greater_than_operator(self, service, sample_dataframe):
         """Test search with greater_than operator."""
         conditions = [
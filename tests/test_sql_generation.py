@@ -6,6 +6,7 @@ This module contains unit tests for the SQLGenerationService class.
 
 import os
 import pytest
+import numpy as np
 import pandas as pd
 import tempfile
 
@@ -119,6 +120,51 @@ sql:
         assert result["success"]
         assert result["database_type"] == "mysql"
 
+    def test_generate_sql_auto_dedup(self, tmp_path, sample_dataframe):
+        """Test that sql.auto_dedup drops identical rows before generating."""
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(f"""
+file:
+  output_folder: "{tmp_path}"
+
+sql:
+  auto_dedup: true
+""")
+        service = SQLGenerationService(Config(str(config_path)))
+        data = pd.concat([sample_dataframe, sample_dataframe.iloc[:2]])
+        request = SQLGenerationRequest(
+            table_name="users", column_mapping={"name": "Name", "email": "Email"}
+        )
+
+        result = service.generate_sql(data, request)
+
+        assert result["total_rows"] == 3
+        inserts = [s for s in result["statements"] if s.startswith("INSERT")]
+        assert len(inserts) == 3
+
+    def test_generate_sql_multi_row_inserts(self, tmp_path, sample_dataframe):
+        """Test that sql.multi_row_inserts groups batch_size rows per INSERT."""
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(f"""
+file:
+  output_folder: "{tmp_path}"
+
+sql:
+  multi_row_inserts: true
+""")
+        service = SQLGenerationService(Config(str(config_path)))
+        request = SQLGenerationRequest(
+            table_name="users",
+            column_mapping={"name": "Name", "email": "Email"},
+            batch_size=2,
+        )
+
+        result = service.generate_sql(sample_dataframe, request)
+
+        inserts = [s for s in result["statements"] if s.startswith("INSERT")]
+        assert len(inserts) == 2
+        assert inserts[0].count("),\n(") == 1
+
     def test_get_supported_databases(self, service):
         """Test getting supported database list."""
         databases = service.get_supported_databases()
@@ -145,3 +191,259 @@ sql:
         with open(output_path, "r") as f:
             content = f.read()
             assert "INSERT INTO test_table" in content
+
+    def test_generate_sql_stream_matches_export(self, service, tmp_path):
+        """Test that streamed output matches exporting generate_sql results."""
+        data = pd.DataFrame(
+            {"Name": ["Alice", "O'Brien", "Carol"], "Age": ["1", "2", ""]}
+        )
+        auto_increment = AutoIncrementConfig(
+            enabled=True, column_name="id", increment_type="manual_sequence"
+        )
+
+        def make_request():
+            request = SQLGenerationRequest(
+                table_name="users",
+                column_mapping={"name": "Name", "age": "Age"},
+                database_type="mysql",
+            )
+            request.auto_increment = auto_increment
+            return request
+
+        expected_path = str(tmp_path / "expected.sql")
+        result = service.generate_sql(data, make_request())
+        service.export_sql(result["statements"], expected_path)
+
+        streamed_path = str(tmp_path / "streamed.sql")
+        chunks = [data.iloc[:2], data.iloc[2:]]
+        streamed = service.generate_sql_stream(chunks, make_request(), streamed_path)
+
+        def strip_times(path):
+            with open(path) as f:
+                return [line for line in f if "Generated at" not in line]
+
+        assert streamed["total_rows"] == 3
+        assert streamed["total_statements"] == result["total_statements"]
+        assert strip_times(streamed_path) == strip_times(expected_path)
+
+
+class TestSQLBuilderInserts:
+    """Test cases for SQLBuilder.iter_inserts."""
+
+    @pytest.mark.parametrize("db_type", list(DatabaseType))
+    @pytest.mark.parametrize(
+        "increment_type",
+        [
+            None,
+            SQLAutoIncrementType.MANUAL_SEQUENCE,
+            SQLAutoIncrementType.UUID_GENERATE,
+        ],
+    )
+    def test_string_columns_match_build_insert(self, db_type, increment_type):
+        """Test that column-wise string inserts match per-row build_insert."""
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame(
+            {"Name": ["O'Neil", 'Say "hi"', ""], "Age": ["30", "4", "x"]}
+        ).astype(str)
+        mapping = {"name": "Name", "age": "Age", "missing": "Nope"}
+
+        def make_builder():
+            builder = (
+                SQLBuilder()
+                .with_table_name("users")
+                .with_database_type(db_type)
+                .with_column_mapping(mapping)
+            )
+            if increment_type:
+                builder.with_auto_increment("id", increment_type, start_value=7)
+            return builder
+
+        reference = make_builder()
+        expected = [reference.build_insert(row) for row in data.to_dict("records")]
+        expected += [reference.build_insert(row) for row in data.to_dict("records")]
+
+        builder = make_builder()
+        statements = list(builder.iter_inserts(data)) + list(builder.iter_inserts(data))
+
+        assert statements == expected
+
+    def test_mixed_columns_keep_column_types(self):
+        """Test that row-wise inserts format each value by its column's type."""
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame(
+            {
+                "Count": [3, 4],
+                "Score": [1.5, float("nan")],
+                "Active": [True, False],
+                "Name": ["it's", None],
+            }
+        )
+        builder = (
+            SQLBuilder()
+            .with_table_name("t")
+            .with_column_mapping(
+                {"count": "Count", "score": "Score", "active": "Active", "x": "Nope"}
+            )
+        )
+
+        assert list(builder.iter_inserts(data)) == [
+            "INSERT INTO t (count, score, active, x) VALUES (3, 1.5, TRUE, NULL);",
+            "INSERT INTO t (count, score, active, x) VALUES (4, NULL, FALSE, NULL);",
+        ]
+
+    @pytest.mark.parametrize("db_type", list(DatabaseType))
+    def test_missing_values_become_null(self, db_type):
+        """Test that None, NaN, pd.NA and NaT all format as NULL."""
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame(
+            {
+                "Name": ["a", None],
+                "Count": pd.array([1, None], dtype="Int64"),
+                "When": pd.to_datetime(["2024-01-02 03:04:05", None]),
+                "Other": pd.Series([np.int64(5), np.nan], dtype=object),
+            }
+        )
+        mapping = {"name": "Name", "count": "Count", "when": "When", "other": "Other"}
+        builder = (
+            SQLBuilder()
+            .with_table_name("t")
+            .with_database_type(db_type)
+            .with_column_mapping(mapping)
+        )
+
+        first, second = builder.iter_inserts(data)
+
+        assert first.endswith("5);") and "'a', 1, '2024-01-02 03:04:05'" in first
+        assert second.endswith("VALUES (NULL, NULL, NULL, NULL);")
+
+    def test_template_inserts_match_build_insert(self):
+        """Test that compiled templates fill columns, auto IDs and literals."""
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame({"Name": ["{auto_id}", "o'k"], "Age": [30, 40]})
+        template = (
+            "INSERT INTO {{t}} VALUES ({auto_id}, {name}, {age}, {missing}, "
+            "{current_date});"
+        )
+
+        def make_builder():
+            return (
+                SQLBuilder()
+                .with_table_name("t")
+                .with_database_type(DatabaseType.MYSQL)
+                .with_column_mapping({"name": "Name", "age": "Age", "missing": "X"})
+                .with_auto_increment(
+                    "id", SQLAutoIncrementType.MANUAL_SEQUENCE, start_value=5
+                )
+                .with_template(template)
+            )
+
+        reference = make_builder()
+        expected = [reference.build_insert(row) for row in data.to_dict("records")]
+        statements = list(make_builder().iter_inserts(data))
+
+        assert statements == expected
+        assert statements[0] == (
+            "INSERT INTO {{t}} VALUES (5, '{auto_id}', 30, NULL, CURDATE());"
+        )
+        assert statements[1].startswith("INSERT INTO {{t}} VALUES (6, 'o\\'k', 40,")
+
+    def test_build_batched_groups_rows(self):
+        """Test that build_batched emits one multi-row INSERT per batch."""
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame({"Name": ["a", "b", "c"], "Age": [1, 2, 3]})
+        builder = (
+            SQLBuilder()
+            .with_table_name("t")
+            .with_database_type(DatabaseType.SQLITE)
+            .with_column_mapping({"name": "Name", "age": "Age"})
+            .with_auto_increment(
+                "id", SQLAutoIncrementType.MANUAL_SEQUENCE, start_value=1
+            )
+            .with_batch_size(2)
+        )
+
+        assert builder.build_batched(data) == [
+            "INSERT INTO t (id, name, age) VALUES (1, 'a', 1),\n(2, 'b', 2);",
+            "INSERT INTO t (id, name, age) VALUES (3, 'c', 3);",
+        ]
+        assert builder.build_batched(data.iloc[:0]) == []
+
+    @pytest.mark.parametrize(
+        "dtype, values",
+        [("Int64", [7, None]), ("Float64", [2.5, None]), ("boolean", [True, None])],
+    )
+    def test_nullable_columns_match_build_insert(self, dtype, values):
+        """Test that nullable extension columns format like row-wise inserts."""
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame({"Value": pd.array(values, dtype=dtype)})
+        builder = SQLBuilder().with_table_name("t").with_column_mapping({"v": "Value"})
+
+        expected = [builder.build_insert(row) for row in data.to_dict("records")]
+
+        assert list(builder.iter_inserts(data)) == expected
+        assert expected[1] == "INSERT INTO t (v) VALUES (NULL);"
+
+    def test_template_follows_later_settings(self):
+        """Test that settings made after with_template still apply to it."""
+        from app.builders.sql_builder import SQLBuilder
+
+        builder = (
+            SQLBuilder()
+            .with_template("INSERT INTO t VALUES ({name}, {current_timestamp});")
+            .with_column_mapping({"name": "Name"})
+            .with_database_type(DatabaseType.SQLITE)
+        )
+
+        assert builder.build_insert({"Name": "a"}) == (
+            "INSERT INTO t VALUES ('a', datetime('now'));"
+        )
+
+    @pytest.mark.parametrize("dtype", ["int8", "int64", "uint64"])
+    def test_integer_columns_match_str(self, dtype):
+        """Test that integer columns are spelled as str() spells them."""
+        from app.builders.sql_builder import SQLBuilder
+
+        info = np.iinfo(dtype)
+        values = pd.Series(np.array([info.min, 0, info.max], dtype=dtype))
+
+        assert SQLBuilder()._format_column(values) == [
+            str(value) for value in values.tolist()
+        ]
+
+    def test_iter_all_streams_batches(self):
+        """Test that iter_all yields build_all's statements batch by batch."""
+        import types
+
+        from app.builders.sql_builder import SQLBuilder
+
+        data = pd.DataFrame({"Name": ["a", "b", "c"]})
+
+        def make_builder():
+            return (
+                SQLBuilder()
+                .with_table_name("t")
+                .with_column_mapping({"name": "Name"})
+                .with_auto_increment(
+                    "id", SQLAutoIncrementType.MANUAL_SEQUENCE, start_value=1
+                )
+                .with_database_type(DatabaseType.MYSQL)
+                .with_batch_size(2)
+            )
+
+        statements = make_builder().iter_all(data)
+
+        assert isinstance(statements, types.GeneratorType)
+        assert list(statements) == make_builder().build_all(data)
+        assert make_builder().build_all(data) == [
+            "START TRANSACTION;",
+            "INSERT INTO t (id, name) VALUES (1, 'a');",
+            "INSERT INTO t (id, name) VALUES (2, 'b');",
+            "INSERT INTO t (id, name) VALUES (3, 'c');",
+            "COMMIT;",
+        ]